@@ -0,0 +1,179 @@
+"""
+자동완성 검색
+컬럼마다 두 가지 인덱스를 둔다.
+
+- LOWER(컬럼) COLLATE "C" B-tree: 접두어 일치를 인덱스 순서대로 읽어 LIMIT 에서 멈춤
+- LOWER(컬럼) gin_trgm_ops GIN: 접두어 결과가 부족할 때 오타/중간 일치(trigram 유사도) 보충
+
+자주 입력되는 접두어는 캐시에서 바로 응답하고,
+DB 조회는 statement_timeout 으로 요청당 시간 예산을 넘지 않게 한다.
+"""
+
+import logging
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
+from django.core.cache import cache
+from django.db import OperationalError, connections, transaction
+from django.db.models import Q
+from django.db.models.functions import Collate, Greatest, Lower
+
+from .metrics import record_cache_lookup
+from .utils import generate_hash
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 20
+MAX_QUERY_LENGTH = 50
+# trigram 은 3글자 단위이므로 그보다 짧은 검색어는 접두어 일치만 사용
+TRIGRAM_MIN_LENGTH = 3
+CACHE_KEY_PREFIX = "autocomplete"
+
+
+def normalize_query(text: str) -> str:
+    """
+    검색어 정규화 (소문자, 연속 공백 제거, 최대 길이 제한)
+    """
+    return " ".join((text or "").lower().split())[:MAX_QUERY_LENGTH]
+
+
+def prefix_key(field: str) -> Collate:
+    """
+    접두어 검색/정렬용 표현식 (인덱스 표현식과 같아야 함)
+    """
+    return Collate(Lower(field), "C")
+
+
+def run_with_budget(func: Callable[[], Any], using: str = "default") -> Optional[Any]:
+    """
+    statement_timeout 을 건 트랜잭션 안에서 조회 실행, 시간 예산을 넘기면 None
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return func()
+
+    timeout_ms = int(getattr(settings, "AUTOCOMPLETE_STATEMENT_TIMEOUT_MS", 50))
+    try:
+        with transaction.atomic(using=using):
+            with connection.cursor() as cursor:
+                cursor.execute(f"SET LOCAL statement_timeout = {timeout_ms}")
+            return func()
+    except OperationalError as exc:
+        logger.warning(
+            "자동완성 조회가 시간 예산(%dms)을 초과했습니다: %s", timeout_ms, exc
+        )
+        return None
+
+
+def find_prefix_matches(queryset, fields: Sequence[str], query: str, limit: int):
+    """
+    컬럼별로 접두어 일치를 인덱스 순서대로 최대 limit 개씩 읽어 합침
+    """
+    results: List[Any] = []
+    seen = set()
+    for field in fields:
+        rows = (
+            queryset.annotate(_prefix_key=prefix_key(field))
+            .filter(_prefix_key__startswith=query)
+            .order_by("_prefix_key")[:limit]
+        )
+        for row in rows:
+            if row.pk not in seen:
+                seen.add(row.pk)
+                results.append(row)
+    return results[:limit]
+
+
+def find_similar_matches(
+    queryset, fields: Sequence[str], query: str, limit: int, exclude=()
+):
+    """
+    trigram 유사도 순 일치 (pg_trgm % 연산자, GIN 인덱스 사용)
+    """
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f"_{field}_lower__trigram_similar": query})
+    similarity = [TrigramSimilarity(Lower(field), query) for field in fields]
+    return list(
+        queryset.annotate(
+            **{f"_{field}_lower": Lower(field) for field in fields},
+            _similarity=(
+                similarity[0] if len(similarity) == 1 else Greatest(*similarity)
+            ),
+        )
+        .filter(condition)
+        .exclude(pk__in=list(exclude))
+        .order_by("-_similarity")[:limit]
+    )
+
+
+def autocomplete(
+    queryset,
+    fields: Sequence[str],
+    query: str,
+    limit: int = DEFAULT_LIMIT,
+) -> Tuple[Optional[List[Any]], bool]:
+    """
+    접두어 일치 우선, 부족하면 유사도 일치로 채운 자동완성 (결과, 완전한 결과 여부)
+    유사도 조회가 시간 예산을 넘기면 (접두어 결과, False), 접두어 조회가 넘기면 (None, False)
+    """
+    prefix_matches = run_with_budget(
+        lambda: find_prefix_matches(queryset, fields, query, limit), queryset.db
+    )
+    if prefix_matches is None:
+        return None, False
+    if len(prefix_matches) >= limit or len(query) < TRIGRAM_MIN_LENGTH:
+        return prefix_matches, True
+
+    similar_matches = run_with_budget(
+        lambda: find_similar_matches(
+            queryset,
+            fields,
+            query,
+            limit - len(prefix_matches),
+            exclude=[row.pk for row in prefix_matches],
+        ),
+        queryset.db,
+    )
+    if similar_matches is None:
+        return prefix_matches, False
+    return prefix_matches + similar_matches, True
+
+
+def get_cached_autocomplete(
+    namespace: str,
+    query: str,
+    limit: int,
+    build: Callable[[], Tuple[Optional[List[dict]], bool]],
+) -> List[dict]:
+    """
+    캐시된 자동완성 응답, 없으면 build() 결과를 캐시 후 반환
+    build() 는 (결과, 완전한 결과 여부)를 반환하며, 시간 예산 초과로
+    불완전한 결과(접두어 결과만 또는 None)는 캐시하지 않는다.
+    """
+    key = f"{CACHE_KEY_PREFIX}:{namespace}:{limit}:{generate_hash(query)[:32]}"
+    results = cache.get(key)
+    if results is not None:
+        record_cache_lookup(CACHE_KEY_PREFIX, hits=1)
+        return results
+
+    record_cache_lookup(CACHE_KEY_PREFIX, hits=0, misses=1)
+    results, complete = build()
+    if results is None:
+        return []
+    if complete:
+        cache.set(key, results, getattr(settings, "AUTOCOMPLETE_CACHE_TIMEOUT", 60))
+    return results
+
+
+def get_limit(request) -> int:
+    """
+    ?limit= 파라미터 (1 ~ MAX_LIMIT)
+    """
+    try:
+        limit = int(request.query_params.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        return DEFAULT_LIMIT
+    return max(1, min(limit, MAX_LIMIT))
@@ -0,0 +1,146 @@
+"""
+API 벤치마크 실행기
+테스트 클라이언트로 엔드포인트를 프로세스 안에서 반복 호출해
+요청별 지연 시간(p50/p95/p99)과 쿼리 수를 측정하고 JSON 결과 파일로 남긴다.
+같은 데이터로 측정한 이전 결과 파일과 비교할 수 있다.
+
+- 지연 시간은 미들웨어/뷰/직렬화/렌더링을 포함한 테스트 클라이언트 요청 전체 (네트워크 제외)
+- 쿼리 수는 요청 계측과 같은 execute_wrapper 로 센다. (DEBUG 쿼리 로그를 쓰지 않음)
+"""
+
+import json
+import platform
+import time
+from contextlib import ExitStack
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.utils import timezone
+
+from .instrumentation import QueryTimer, RequestMetrics
+
+RESULTS_VERSION = 1
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    정렬된 값의 백분위수 (선형 보간)
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (
+        position - lower
+    )
+
+
+def measure_request(client, path: str):
+    """
+    요청 한 번의 (응답, 소요 시간(초), 쿼리 수)
+    """
+    metrics = RequestMetrics()
+    with ExitStack() as stack:
+        timer = QueryTimer(metrics)
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(timer))
+        started = time.perf_counter()
+        response = client.get(path)
+        elapsed = time.perf_counter() - started
+    return response, elapsed, metrics.query_count
+
+
+def run_endpoint(
+    client, name: str, path: str, iterations: int, warmup: int = 5, cold=False
+) -> dict:
+    """
+    엔드포인트 하나를 warmup 후 iterations 번 호출한 결과 요약
+    cold 면 매 요청 전에 캐시를 비운다.
+    """
+    timings = []
+    query_counts = []
+    statuses = set()
+    for index in range(warmup + iterations):
+        if cold:
+            cache.clear()
+        response, elapsed, query_count = measure_request(client, path)
+        if index < warmup:
+            continue
+        timings.append(elapsed * 1000)
+        query_counts.append(query_count)
+        statuses.add(response.status_code)
+
+    timings.sort()
+    summary = {
+        "name": name,
+        "path": path,
+        "requests": iterations,
+        "status": sorted(statuses),
+        "mean_ms": round(sum(timings) / len(timings), 3) if timings else 0.0,
+        "max_ms": round(timings[-1], 3) if timings else 0.0,
+        "queries_min": min(query_counts, default=0),
+        "queries_max": max(query_counts, default=0),
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct}_ms"] = round(percentile(timings, pct), 3)
+    return summary
+
+
+def build_results(results: List[dict], dataset: Dict[str, int], **options) -> dict:
+    """
+    결과 파일 내용 (실행 환경과 데이터 규모 포함)
+    """
+    database = connections["default"]
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": timezone.now().isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "settings": settings.SETTINGS_MODULE,
+            "database": database.vendor,
+            "cache": settings.CACHES["default"]["BACKEND"],
+        },
+        "dataset": dataset,
+        "options": options,
+        "results": results,
+    }
+
+
+def save_results(path: str, results: dict):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, ensure_ascii=False, indent=2)
+
+
+def load_results(path: str) -> dict:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare_results(baseline: dict, current: dict) -> List[dict]:
+    """
+    이름이 같은 엔드포인트끼리 p50/p95/p99 와 최대 쿼리 수의 변화
+    변화율은 기준 대비 (양수면 느려짐), 기준에 없는 엔드포인트는 None
+    """
+    previous = {result["name"]: result for result in baseline.get("results", [])}
+    rows = []
+    for result in current["results"]:
+        before: Optional[dict] = previous.get(result["name"])
+        row = {"name": result["name"]}
+        for pct in PERCENTILES:
+            key = f"p{pct}_ms"
+            row[key] = result[key]
+            row[f"{key}_change"] = (
+                (result[key] - before[key]) / before[key] * 100
+                if before and before[key]
+                else None
+            )
+        row["queries_max"] = result["queries_max"]
+        row["queries_change"] = (
+            result["queries_max"] - before["queries_max"] if before else None
+        )
+        rows.append(row)
+    return rows
@@ -0,0 +1,176 @@
+"""
+공통 캐시 유틸리티
+"""
+
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db.models import prefetch_related_objects
+from rest_framework.response import Response
+
+from .metrics import record_cache_lookup
+
+
+class RepresentationCache:
+    """
+    버전 기반 객체 직렬화 결과 캐시
+    객체마다 버전 토큰을 두고 직렬화 결과에 그 토큰을 함께 저장한다.
+    버전 키와 결과 키를 한 번의 get_many 로 읽어 토큰이 같을 때만 적중으로 보므로,
+    무효화는 버전 토큰만 새로 쓰면 된다.
+    """
+
+    def __init__(self, namespace: str, timeout: Optional[int] = 3600):
+        self.namespace = namespace
+        self.timeout = timeout
+
+    def version_key(self, pk) -> str:
+        return f"{self.namespace}:ver:{pk}"
+
+    def entry_key(self, pk, variant: str) -> str:
+        return f"{self.namespace}:{variant}:{pk}"
+
+    @staticmethod
+    def new_version() -> str:
+        return uuid.uuid4().hex[:16]
+
+    def get_many(
+        self, pks: Iterable[Any], variant: str
+    ) -> Tuple[Dict[Any, dict], Dict[Any, str]]:
+        """
+        (적중한 직렬화 결과, 객체별 현재 버전)을 반환
+        """
+        pks = list(pks)
+        keys = [self.version_key(pk) for pk in pks]
+        keys += [self.entry_key(pk, variant) for pk in pks]
+        found = cache.get_many(keys)
+
+        hits: Dict[Any, dict] = {}
+        versions: Dict[Any, str] = {}
+        missing_versions: Dict[str, str] = {}
+        for pk in pks:
+            version = found.get(self.version_key(pk))
+            if version is None:
+                # 버전 키가 축출되었으면 이전 결과를 신뢰할 수 없으므로 새 버전 발급
+                version = self.new_version()
+                missing_versions[self.version_key(pk)] = version
+            versions[pk] = version
+
+            entry = found.get(self.entry_key(pk, variant))
+            if entry is not None and entry["v"] == version:
+                hits[pk] = entry["data"]
+
+        if missing_versions:
+            cache.set_many(missing_versions, self.timeout)
+        record_cache_lookup(self.namespace, len(hits), len(pks) - len(hits))
+        return hits, versions
+
+    def set_many(self, entries: Dict[Any, dict], versions: Dict[Any, str], variant):
+        """
+        직렬화 결과를 조회 시점의 버전과 함께 저장
+        """
+        cache.set_many(
+            {
+                self.entry_key(pk, variant): {"v": versions[pk], "data": data}
+                for pk, data in entries.items()
+            },
+            self.timeout,
+        )
+
+    def bump(self, pks: Iterable[Any]):
+        """
+        객체 버전을 갱신해 캐시된 직렬화 결과를 무효화
+        """
+        cache.set_many(
+            {self.version_key(pk): self.new_version() for pk in pks}, self.timeout
+        )
+
+
+class CachedRepresentationListMixin:
+    """
+    목록 조회 시 객체별 직렬화 결과를 캐시에서 한 번에 읽고 누락분만 직렬화하는
+    ViewSet 믹스인
+
+    - representation_cache: 사용할 RepresentationCache
+    - volatile_fields: 캐시하지 않고 매 요청마다 새로 계산할 필드 (카운터 등)
+    """
+
+    representation_cache: Optional[RepresentationCache] = None
+    volatile_fields: Tuple[str, ...] = ()
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        # prefetch 는 캐시 누락분에만 수행
+        prefetch_lookups = queryset._prefetch_related_lookups
+        queryset = queryset.prefetch_related(None)
+
+        page = self.paginate_queryset(queryset)
+        objects = list(page if page is not None else queryset)
+        data = self.get_cached_representations(objects, prefetch_lookups)
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    def use_representation_cache(self) -> bool:
+        return self.representation_cache is not None
+
+    def get_cached_representations(
+        self, objects: List[Any], prefetch_lookups=()
+    ) -> List[dict]:
+        """
+        객체 목록의 직렬화 결과 (캐시 적중분 + 새로 직렬화한 누락분)
+        """
+        if not self.use_representation_cache():
+            if prefetch_lookups:
+                prefetch_related_objects(objects, *prefetch_lookups)
+            return self.get_serializer(objects, many=True).data
+
+        variant = self.get_serializer_class().__name__
+        hits, versions = self.representation_cache.get_many(
+            [obj.pk for obj in objects], variant
+        )
+
+        misses = [obj for obj in objects if obj.pk not in hits]
+        if misses:
+            # 목록 조회 후 버전을 읽기 전에 수정되면 이전 내용이 새 버전으로 저장되므로
+            # 버전을 읽은 뒤 누락분을 다시 조회해 직렬화
+            misses = self.reload_objects(misses)
+            if prefetch_lookups:
+                prefetch_related_objects(misses, *prefetch_lookups)
+            fresh = self.get_serializer(misses, many=True).data
+            entries = {
+                obj.pk: {
+                    name: value
+                    for name, value in item.items()
+                    if name not in self.volatile_fields
+                }
+                for obj, item in zip(misses, fresh)
+            }
+            self.representation_cache.set_many(entries, versions, variant)
+            hits.update(entries)
+
+        fields = [
+            (name, field)
+            for name, field in self.get_serializer().fields.items()
+            if not field.write_only
+        ]
+        data = []
+        for obj in objects:
+            cached = hits[obj.pk]
+            item = {}
+            for name, field in fields:
+                if name in self.volatile_fields:
+                    item[name] = field.to_representation(field.get_attribute(obj))
+                elif name in cached:
+                    item[name] = cached[name]
+            data.append(item)
+        return data
+
+    def reload_objects(self, objects: List[Any]) -> List[Any]:
+        """
+        객체 목록을 pk 로 다시 조회 (그 사이 삭제된 객체는 기존 객체 유지)
+        """
+        queryset = self.get_queryset().prefetch_related(None)
+        fresh = {obj.pk: obj for obj in queryset.filter(pk__in=[o.pk for o in objects])}
+        return [fresh.get(obj.pk, obj) for obj in objects]
@@ -0,0 +1,176 @@
+"""
+조건부 요청(ETag / Last-Modified) 처리
+클라이언트 캐시가 최신이면 304 Not Modified 로 응답한다.
+
+- create_response 기반 액션(conditional_action): 행을 읽기 전에 가벼운 검증자(validator)로 판단
+- DRF 목록/상세 조회(ConditionalGetMixin): 행을 읽기 전에 캐시의 세대 토큰으로 판단
+  (표현이 바뀌는 쓰기마다 커밋 후 bump_generations 로 토큰을 새로 씀,
+  토큰이 축출되면 새로 발급되므로 ETag 가 바뀔 뿐 오래된 304 는 나가지 않음)
+"""
+
+import uuid
+from functools import partial, wraps
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+from .utils import generate_hash
+
+Validators = Tuple[str, Optional[Any]]
+
+GENERATION_KEY_PREFIX = "etag:gen"
+GENERATION_TIMEOUT = 86400
+
+
+def build_etag(*parts) -> str:
+    """
+    검증 요소들로 ETag 생성
+    """
+    return quote_etag(generate_hash("|".join(str(part) for part in parts))[:32])
+
+
+def generation_key(name: str) -> str:
+    return f"{GENERATION_KEY_PREFIX}:{name}"
+
+
+def get_generations(names: List[str]) -> List[str]:
+    """
+    세대 토큰들 (없으면 새로 발급)
+    """
+    found = cache.get_many([generation_key(name) for name in names])
+    tokens = []
+    for name in names:
+        key = generation_key(name)
+        token = found.get(key)
+        if token is None:
+            token = uuid.uuid4().hex[:16]
+            if not cache.add(key, token, GENERATION_TIMEOUT):
+                token = cache.get(key, token)
+        tokens.append(token)
+    return tokens
+
+
+def bump_generations(names: Iterable[str]):
+    """
+    세대 토큰 갱신 (트랜잭션 안이면 커밋 후)
+    커밋 전에 갱신하면 그 사이 이전 행을 읽은 요청이 새 토큰으로 ETag 를 만들 수 있음
+    """
+    tokens = {generation_key(name): uuid.uuid4().hex[:16] for name in names}
+    if tokens:
+        transaction.on_commit(partial(cache.set_many, tokens, GENERATION_TIMEOUT))
+
+
+def get_not_modified_response(request, etag: str, last_modified=None):
+    """
+    클라이언트 캐시가 최신이면 304 응답, 아니면 None
+    """
+    if request.method not in ("GET", "HEAD"):
+        return None
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    return get_conditional_response(
+        request, etag=etag, last_modified=timestamp, response=None
+    )
+
+
+def set_validator_headers(response, etag: str, last_modified=None):
+    """
+    응답에 ETag / Last-Modified 헤더 설정
+    """
+    if response.status_code != 200:
+        return response
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
+
+
+def conditional_action(get_validators: Callable[..., Optional[Validators]]):
+    """
+    ViewSet 액션이나 create_response 기반 뷰 메서드용 조건부 요청 데코레이터
+    get_validators(view, request, *args, **kwargs) 는 (etag, last_modified) 또는 None 을 반환
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(view, request, *args, **kwargs):
+            validators = get_validators(view, request, *args, **kwargs)
+            if validators is None:
+                return func(view, request, *args, **kwargs)
+
+            etag, last_modified = validators
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+            response = func(view, request, *args, **kwargs)
+            return set_validator_headers(response, etag, last_modified)
+
+        return wrapper
+
+    return decorator
+
+
+class ConditionalGetMixin:
+    """
+    목록/상세 조회에 조건부 요청을 적용하는 DRF 뷰 믹스인
+    요청 경로(필터/페이지/fields 포함), 사용자, 세대 토큰으로 ETag 를 만들어
+    If-None-Match 와 같으면 행을 읽거나 직렬화하기 전에 304 로 응답한다.
+
+    - etag_namespace: 세대 토큰 이름 앞부분 (목록은 {namespace}:list,
+      상세는 {namespace}:{pk}), 표현이 바뀌는 쓰기에서 같은 이름으로 bump_generations 호출
+    - 조건부 헤더가 없는 요청의 추가 비용은 캐시 get_many 한 번
+    - 좋아요/댓글 수처럼 updated_at 에 드러나지 않는 변경도 토큰으로 반영되므로
+      Last-Modified 는 보내지 않는다. (If-Modified-Since 만으로는 304 가 되지 않음)
+    """
+
+    etag_namespace: Optional[str] = None
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_get(
+            "list", partial(super().list, request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_get(
+            "detail", partial(super().retrieve, request, *args, **kwargs)
+        )
+
+    def conditional_get(self, kind: str, get_response: Callable):
+        """
+        kind(list/detail)의 ETag 가 클라이언트 캐시와 같으면 304, 아니면 응답에 ETag 설정
+        """
+        names = self.get_generation_names(kind)
+        if not names or self.request.method not in ("GET", "HEAD"):
+            return get_response()
+
+        request = self.request
+        etag = build_etag(
+            request.get_full_path(),
+            request.user.pk,
+            self.get_etag_extra(),
+            *get_generations(names),
+        )
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified is not None:
+            not_modified["ETag"] = etag
+            return not_modified
+        return set_validator_headers(get_response(), etag)
+
+    def get_generation_names(self, kind: str) -> List[str]:
+        """
+        응답 표현이 의존하는 세대 토큰 이름들
+        """
+        if self.etag_namespace is None:
+            return []
+        if kind == "list":
+            return [f"{self.etag_namespace}:list"]
+        lookup = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        return [f"{self.etag_namespace}:{lookup}"]
+
+    def get_etag_extra(self) -> Any:
+        """
+        세대 토큰으로 드러나지 않는 변경을 반영할 추가 검증 요소
+        """
+        return ""
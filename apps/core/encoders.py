@@ -0,0 +1,54 @@
+"""
+JSON 인코딩/디코딩
+orjson 이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 대체한다.
+datetime, Decimal, UUID, 지연 번역 문자열 등은 DRF 의 JSONEncoder 와 같은 규칙으로 변환한다.
+"""
+
+import json
+from typing import Any
+
+from django.http import HttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+_fallback_encoder = JSONEncoder()
+
+ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+def dumps(data: Any) -> bytes:
+    """
+    객체를 UTF-8 JSON 바이트로 인코딩
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=_fallback_encoder.default, option=ORJSON_OPTIONS
+        )
+    return json.dumps(
+        data, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def loads(data):
+    """
+    JSON 바이트/문자열을 디코딩
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+class FastJsonResponse(HttpResponse):
+    """
+    dumps 로 인코딩하는 JsonResponse 대체 응답
+    """
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(content=dumps(data), **kwargs)
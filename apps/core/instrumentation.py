@@ -0,0 +1,219 @@
+"""
+요청 계측
+샘플링된 요청마다 쿼리 수, DB 시간, 직렬화 시간, 전체 처리 시간을 뷰 이름(PostViewSet.list 등)별로 기록해
+Server-Timing 헤더와 구조화된 로그 한 줄로 내보낸다.
+
+- DB: 요청 동안 모든 DB 연결에 execute_wrapper 를 걸어 쿼리 수와 실행 시간 합산
+- 직렬화: 시리얼라이저 to_representation(최상위만)과 JSON 인코딩 시간 합산
+  (직렬화 중 발생한 지연 로딩 쿼리는 DB 시간에도 함께 잡힌다)
+- INSTRUMENTATION_SAMPLE_RATE 비율의 요청만 계측하므로 나머지 요청의 비용은 난수 한 번
+- 쿼리 점검(QUERY_CHECK_MODE)을 켜면 모든 요청의 SQL 지문을 모아 N+1 과 쿼리 예산을 점검
+- Prometheus 지표(apps.core.metrics)를 쓸 수 있으면 모든 요청을 계측해 지표로 기록
+"""
+
+import logging
+import random
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+from django.db import connections
+
+from . import metrics as prometheus_metrics
+from .encoders import dumps
+from .query_checks import (
+    check_queries,
+    fingerprint_sql,
+    get_check_mode,
+    get_query_budget,
+)
+
+logger = logging.getLogger(__name__)
+
+_current_metrics: ContextVar[Optional["RequestMetrics"]] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+class RequestMetrics:
+    """
+    요청 한 건의 계측 값 (시간 단위: 초)
+    fingerprints 는 쿼리 점검 시에만 모으는 SQL 지문별 실행 횟수
+    """
+
+    def __init__(self, collect_fingerprints: bool = False):
+        self.fingerprints: Optional[Counter] = (
+            Counter() if collect_fingerprints else None
+        )
+        self.query_count = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.total_time = 0.0
+        self._serialize_depth = 0
+
+    def server_timing(self) -> str:
+        """
+        Server-Timing 헤더 값 (밀리초)
+        """
+        app_time = max(self.total_time - self.db_time - self.serialize_time, 0.0)
+        return ", ".join(
+            [
+                f'db;desc="{self.query_count} queries";dur={self.db_time * 1000:.1f}',
+                f"serialize;dur={self.serialize_time * 1000:.1f}",
+                f"app;dur={app_time * 1000:.1f}",
+                f"total;dur={self.total_time * 1000:.1f}",
+            ]
+        )
+
+
+def get_current_metrics() -> Optional[RequestMetrics]:
+    """
+    현재 계측 중인 요청의 값, 계측 대상이 아니면 None
+    """
+    return _current_metrics.get()
+
+
+class QueryTimer:
+    """
+    쿼리 수와 실행 시간을 합산하는 execute_wrapper
+    """
+
+    def __init__(self, metrics: RequestMetrics):
+        self.metrics = metrics
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.metrics.db_time += time.perf_counter() - started
+            self.metrics.query_count += 1
+            if self.metrics.fingerprints is not None:
+                self.metrics.fingerprints[fingerprint_sql(sql)] += 1
+
+
+@contextmanager
+def track_serialization():
+    """
+    직렬화 구간 시간 측정 (중첩된 구간은 가장 바깥 구간만 합산)
+    """
+    metrics = _current_metrics.get()
+    if metrics is None:
+        yield
+        return
+
+    metrics._serialize_depth += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics._serialize_depth -= 1
+        if not metrics._serialize_depth:
+            metrics.serialize_time += time.perf_counter() - started
+
+
+class SerializationTimingMixin:
+    """
+    to_representation 시간을 직렬화 시간으로 기록하는 시리얼라이저 믹스인
+    """
+
+    def to_representation(self, instance):
+        with track_serialization():
+            return super().to_representation(instance)
+
+
+def resolve_view_name(request) -> str:
+    """
+    계측용 뷰 이름 (ViewSet 은 클래스명.액션, 그 밖의 클래스 뷰는 클래스명.메서드)
+    뷰가 처리하지 않는 HTTP 메서드는 other 로 묶는다.
+    """
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unresolved"
+
+    func = match.func
+    view_class = getattr(func, "cls", None) or getattr(func, "view_class", None)
+    if view_class is None:
+        return match.view_name or getattr(func, "__name__", "unknown")
+
+    method = request.method.lower()
+    if method not in view_class.http_method_names:
+        method = "other"
+    actions = getattr(func, "actions", None)
+    if actions:
+        return f"{view_class.__name__}.{actions.get(method, method)}"
+    return f"{view_class.__name__}.{method}"
+
+
+def should_sample() -> bool:
+    rate = getattr(settings, "INSTRUMENTATION_SAMPLE_RATE", 0.0)
+    return rate >= 1 or (rate > 0 and random.random() < rate)
+
+
+class RequestInstrumentationMiddleware:
+    """
+    요청 계측 미들웨어 (다른 미들웨어의 시간까지 포함하도록 가장 앞에 둠)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        check_mode = get_check_mode()
+        sampled = should_sample()
+        export = prometheus_metrics.is_enabled()
+        if not (sampled or check_mode or export):
+            return self.get_response(request)
+
+        metrics = RequestMetrics(collect_fingerprints=bool(check_mode))
+        token = _current_metrics.set(metrics)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                timer = QueryTimer(metrics)
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timer))
+                response = self.get_response(request)
+        finally:
+            metrics.total_time = time.perf_counter() - started
+            _current_metrics.reset(token)
+
+        view_name = resolve_view_name(request)
+        if export:
+            prometheus_metrics.record_request(
+                view_name, request.method, response.status_code, metrics
+            )
+        if sampled:
+            if getattr(settings, "INSTRUMENTATION_SERVER_TIMING", True):
+                response["Server-Timing"] = metrics.server_timing()
+            self.log(request, response, view_name, metrics)
+        if check_mode:
+            check_queries(
+                view_name,
+                metrics.query_count,
+                metrics.fingerprints,
+                budget=get_query_budget(request, view_name),
+                mode=check_mode,
+            )
+        return response
+
+    def log(self, request, response, view_name: str, metrics: RequestMetrics):
+        """
+        구조화된 계측 로그 한 줄 (JSON)
+        """
+        record = {
+            "view": view_name,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": metrics.query_count,
+            "db_ms": round(metrics.db_time * 1000, 2),
+            "serialize_ms": round(metrics.serialize_time * 1000, 2),
+            "total_ms": round(metrics.total_time * 1000, 2),
+        }
+        logger.info(
+            "request_metrics %s", dumps(record).decode(), extra={"metrics": record}
+        )
@@ -0,0 +1,93 @@
+"""
+JSON 인코딩 벤치마크 명령어
+"""
+
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.encoders import orjson
+from apps.core.renderers import FastJSONRenderer
+
+
+def build_post_list_payload(size: int) -> dict:
+    """
+    게시글 목록 응답과 같은 형태의 페이로드 생성
+    """
+    now = timezone.now()
+    results = []
+    for index in range(size):
+        created_at = now - timedelta(minutes=index)
+        results.append(
+            {
+                "id": index + 1,
+                "title": f"게시글 제목 {index}",
+                "summary": "게시글 요약 " * 10,
+                "author": {
+                    "id": index % 50 + 1,
+                    "display_name": f"사용자{index % 50}",
+                    "profile_image": None,
+                },
+                "category": index % 10 + 1,
+                "tags": [{"id": tag, "name": f"태그{tag}"} for tag in range(3)],
+                "status": gettext_lazy("published"),
+                "featured_image": f"/media/posts/{uuid.uuid4()}.jpg",
+                "like_count": index * 3,
+                "comment_count": index % 7,
+                "score": Decimal("12.50"),
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+        )
+    return {
+        "count": size * 100,
+        "total_items_estimated": False,
+        "next": "http://localhost/api/v1/posts/?page=2",
+        "previous": None,
+        "results": results,
+    }
+
+
+class Command(BaseCommand):
+    help = "게시글 목록 페이로드로 기본 JSON 렌더러와 고속 렌더러의 인코딩 처리량을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--posts", type=int, default=20, help="페이로드에 포함할 게시글 수"
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=2000, help="렌더러별 인코딩 반복 횟수"
+        )
+
+    def handle(self, *args, **options):
+        payload = build_post_list_payload(options["posts"])
+        iterations = options["iterations"]
+
+        if orjson is None:
+            self.stdout.write(
+                self.style.WARNING("orjson 이 설치되지 않아 표준 json 으로 대체됩니다.")
+            )
+
+        baseline = None
+        for renderer in (JSONRenderer(), FastJSONRenderer()):
+            size = len(renderer.render(payload))
+            started = time.perf_counter()
+            for _ in range(iterations):
+                renderer.render(payload)
+            elapsed = time.perf_counter() - started
+
+            ops = iterations / elapsed
+            baseline = baseline or ops
+            self.stdout.write(
+                f"{type(renderer).__name__:<18} "
+                f"{ops:>10.0f} ops/s  "
+                f"{size * ops / 1024 / 1024:>8.1f} MB/s  "
+                f"{size:>8} bytes  "
+                f"x{ops / baseline:.2f}"
+            )
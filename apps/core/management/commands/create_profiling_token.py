@@ -0,0 +1,46 @@
+"""
+프로파일링 토큰 생성 명령어
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.profiling import create_profiling_token
+
+
+class Command(BaseCommand):
+    help = (
+        "요청 프로파일링용 X-Profile 헤더 값(서명된 토큰)을 생성합니다. "
+        "(--path 또는 --view 로 대상을 정해야 함)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="", help="이 경로로 시작하는 요청만")
+        parser.add_argument(
+            "--view", default="", help="이 뷰(PostViewSet.retrieve 등)의 결과만"
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=getattr(settings, "PROFILING_TOKEN_MAX_REQUESTS", 100),
+            help="토큰으로 프로파일링할 최대 요청 수",
+        )
+
+    def handle(self, *args, **options):
+        if not options["path"] and not options["view"]:
+            raise CommandError("--path 또는 --view 를 지정해야 합니다.")
+        if options["requests"] < 1:
+            raise CommandError("--requests 는 1 이상이어야 합니다.")
+
+        max_age = getattr(settings, "PROFILING_TOKEN_MAX_AGE", 3600)
+        self.stdout.write(
+            create_profiling_token(
+                path=options["path"],
+                view=options["view"],
+                requests=options["requests"],
+            )
+        )
+        self.stderr.write(
+            f"X-Profile 헤더로 보내면 {max_age}초 동안 최대 {options['requests']}개 "
+            "요청이 프로파일링됩니다."
+        )
@@ -0,0 +1,132 @@
+"""
+프로파일 병합 명령어
+"""
+
+import io
+import pstats
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.profiling import COLLAPSED_SUFFIX, CPROFILE_SUFFIX, get_profile_dir
+
+MERGED_DIR = "merged"
+
+
+def view_name_of(path: Path) -> str:
+    """
+    프로파일 파일 이름의 뷰 이름 ({뷰}.{pid}.collapsed / {뷰}.{pid}.{시각}.prof)
+    """
+    if path.name.endswith(COLLAPSED_SUFFIX):
+        return path.name[: -len(COLLAPSED_SUFFIX)].rsplit(".", 1)[0]
+    return path.name[: -len(CPROFILE_SUFFIX)].rsplit(".", 2)[0]
+
+
+def read_collapsed(paths) -> Counter:
+    stacks: Counter = Counter()
+    for path in paths:
+        with open(path) as file:
+            for line in file:
+                stack, _, count = line.rstrip("\n").rpartition(" ")
+                if stack and count.isdigit():
+                    stacks[stack] += int(count)
+    return stacks
+
+
+class Command(BaseCommand):
+    help = (
+        "요청 프로파일링 결과를 뷰별로 합쳐 merged/ 에 저장하고 "
+        "가장 많이 잡힌 함수를 요약합니다. (collapsed stack 은 flamegraph.pl 등으로 시각화)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dir", help="프로파일 디렉터리 (기본: PROFILING_DIR)")
+        parser.add_argument(
+            "--view",
+            action="append",
+            default=[],
+            help="합칠 뷰 이름 (여러 번 지정 가능, 기본: 전체)",
+        )
+        parser.add_argument("--top", type=int, default=15, help="요약에 보여줄 함수 수")
+        parser.add_argument(
+            "--delete", action="store_true", help="합친 뒤 원본 파일 삭제"
+        )
+
+    def handle(self, *args, **options):
+        directory = Path(options["dir"]) if options["dir"] else get_profile_dir()
+        if not directory.is_dir():
+            raise CommandError(f"프로파일 디렉터리가 없습니다: {directory}")
+
+        groups = defaultdict(lambda: defaultdict(list))
+        for path in sorted(directory.iterdir()):
+            for suffix in (COLLAPSED_SUFFIX, CPROFILE_SUFFIX):
+                if path.name.endswith(suffix):
+                    groups[view_name_of(path)][suffix].append(path)
+        views = options["view"] or sorted(groups)
+        if not any(view in groups for view in views):
+            raise CommandError("합칠 프로파일이 없습니다.")
+
+        merged_dir = directory / MERGED_DIR
+        merged_dir.mkdir(exist_ok=True)
+        for view in views:
+            files = groups.get(view)
+            if not files:
+                continue
+            if files[COLLAPSED_SUFFIX]:
+                self.merge_collapsed(
+                    view, files[COLLAPSED_SUFFIX], merged_dir, options["top"]
+                )
+            if files[CPROFILE_SUFFIX]:
+                self.merge_cprofile(
+                    view, files[CPROFILE_SUFFIX], merged_dir, options["top"]
+                )
+            if options["delete"]:
+                for paths in files.values():
+                    for path in paths:
+                        path.unlink()
+
+    def merge_collapsed(self, view, paths, merged_dir, top):
+        """
+        collapsed stack 합치기 및 자기/누적 샘플 상위 함수 요약
+        """
+        output = merged_dir / f"{view}{COLLAPSED_SUFFIX}"
+        stacks = read_collapsed(paths)
+        with open(output, "w") as file:
+            for stack, count in stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+        total = sum(stacks.values())
+        own: Counter = Counter()
+        inclusive: Counter = Counter()
+        for stack, count in stacks.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for frame in set(frames):
+                inclusive[frame] += count
+
+        interval = getattr(settings, "PROFILING_INTERVAL_MS", 5)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\n{view}: 샘플 {total}개 (약 {total * interval}ms) -> {output}"
+            )
+        )
+        for title, counter in (("자기 시간", own), ("누적 시간", inclusive)):
+            self.stdout.write(f"  [{title}]")
+            for frame, count in counter.most_common(top):
+                self.stdout.write(f"  {count / total:>6.1%}  {count:>7}  {frame}")
+
+    def merge_cprofile(self, view, paths, merged_dir, top):
+        """
+        cProfile 결과 합치기 및 누적 시간 상위 함수 요약
+        """
+        output = merged_dir / f"{view}{CPROFILE_SUFFIX}"
+        buffer = io.StringIO()
+        stats = pstats.Stats(*map(str, paths), stream=buffer)
+        stats.dump_stats(output)
+        stats.sort_stats("cumulative").print_stats(top)
+        self.stdout.write(
+            self.style.SUCCESS(f"\n{view}: cProfile {len(paths)}개 -> {output}")
+        )
+        self.stdout.write(buffer.getvalue())
@@ -0,0 +1,74 @@
+"""
+느린 쿼리 순위 명령어
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.core.models import SlowQuery
+from apps.core.slow_queries import get_latest_plan, rank_slow_queries
+
+MAX_SQL_LENGTH = 300
+
+
+class Command(BaseCommand):
+    help = (
+        "느린 쿼리 로그를 뷰/SQL 지문별로 묶어 총 실행 시간 순으로 보여줍니다. "
+        "(--plans 로 가장 최근 실행 계획 포함)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=7, help="최근 며칠 동안의 기록")
+        parser.add_argument("--view", help="이 뷰(PostViewSet.list 등)의 쿼리만")
+        parser.add_argument("--top", type=int, default=20, help="보여줄 순위 수")
+        parser.add_argument(
+            "--plans", action="store_true", help="각 쿼리의 가장 최근 실행 계획 출력"
+        )
+        parser.add_argument(
+            "--purge-days",
+            type=int,
+            help="이 일수보다 오래된 기록을 먼저 삭제",
+        )
+
+    def handle(self, *args, **options):
+        if options["purge_days"] is not None:
+            removed, _ = SlowQuery.objects.filter(
+                created_at__lt=timezone.now() - timedelta(days=options["purge_days"])
+            ).delete()
+            self.stdout.write(
+                f"{options['purge_days']}일이 지난 기록 {removed}개를 삭제했습니다."
+            )
+
+        rows = rank_slow_queries(options["days"], options["view"], options["top"])
+        if not rows:
+            self.stdout.write("기록된 느린 쿼리가 없습니다.")
+            return
+
+        for rank, row in enumerate(rows, start=1):
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{rank:>3}. 합계 {row['total_ms']:>10.1f}ms  {row['calls']:>5}회  "
+                    f"평균 {row['mean_ms']:>8.1f}ms  최대 {row['max_ms']:>8.1f}ms  "
+                    f"{row['view_name']}"
+                )
+            )
+            sql = row["fingerprint"]
+            if len(sql) > MAX_SQL_LENGTH:
+                sql = sql[:MAX_SQL_LENGTH] + "..."
+            self.stdout.write(f"     {sql}")
+            if options["plans"]:
+                self.write_plan(row)
+
+    def write_plan(self, row):
+        latest = get_latest_plan(row["view_name"], row["fingerprint_hash"])
+        if latest is None:
+            self.stdout.write("     (실행 계획 없음)")
+            return
+        self.stdout.write(
+            f"     실행 계획 ({latest.explain_mode}, {latest.created_at:%Y-%m-%d %H:%M}, "
+            f"요청 {latest.request_id})"
+        )
+        for line in latest.plan.splitlines():
+            self.stdout.write(f"       {line}")
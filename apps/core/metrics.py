@@ -0,0 +1,149 @@
+"""
+Prometheus 지표
+요청 수/지연 시간 히스토그램(뷰 이름, 상태 코드별), 요청당 DB 쿼리 수, DB 연결 수,
+캐시 계층별 적중/누락 수를 모아 /metrics 에서 Prometheus 텍스트 형식으로 내보낸다.
+
+- prometheus_client(운영 의존성)가 없거나 METRICS_ENABLED 가 꺼져 있으면 기록하지 않고
+  /metrics 는 503 을 응답한다.
+- gunicorn 처럼 여러 프로세스로 띄울 때는 PROMETHEUS_MULTIPROC_DIR 환경 변수에
+  빈 디렉터리를 지정하면 워커별 mmap 파일에 기록하고 조회 시 합산한다.
+  (gunicorn 설정의 child_exit 훅에서 mark_worker_dead(worker.pid) 호출)
+- 기록은 요청당 mmap 값 몇 개를 더하는 정도이며, 쿼리 수는 요청 계측과 같은
+  execute_wrapper 로 센다.
+- 표준이 아닌 HTTP 메서드는 레이블 수가 늘지 않도록 other 로 기록한다.
+- /metrics 는 METRICS_TOKEN 이 없으면 DEBUG 에서만 인증 없이 열린다.
+"""
+
+import os
+from typing import Optional
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:  # pragma: no cover - 개발 환경에는 prometheus_client 미설치
+    prometheus_client = None
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+KNOWN_METHODS = frozenset(
+    ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT")
+)
+
+if prometheus_client is not None:
+    REQUESTS = prometheus_client.Counter(
+        "http_requests_total",
+        "처리한 요청 수",
+        ["view", "method", "status"],
+    )
+    REQUEST_LATENCY = prometheus_client.Histogram(
+        "http_request_duration_seconds",
+        "요청 처리 시간",
+        ["view"],
+        buckets=LATENCY_BUCKETS,
+    )
+    REQUEST_DB_TIME = prometheus_client.Histogram(
+        "http_request_db_duration_seconds",
+        "요청당 DB 쿼리 실행 시간 합계",
+        ["view"],
+        buckets=LATENCY_BUCKETS,
+    )
+    REQUEST_QUERIES = prometheus_client.Histogram(
+        "http_request_db_queries",
+        "요청당 DB 쿼리 수",
+        ["view"],
+        buckets=QUERY_COUNT_BUCKETS,
+    )
+    DB_CONNECTIONS = prometheus_client.Gauge(
+        "db_connections_open",
+        "열려 있는 DB 연결 수 (프로세스 합계)",
+        ["alias"],
+        multiprocess_mode="livesum",
+    )
+    CACHE_LOOKUPS = prometheus_client.Counter(
+        "cache_lookups_total",
+        "캐시 계층별 조회 수",
+        ["layer", "result"],
+    )
+
+
+def is_enabled() -> bool:
+    return prometheus_client is not None and getattr(settings, "METRICS_ENABLED", True)
+
+
+def record_request(view: str, method: str, status: int, metrics):
+    """
+    요청 하나의 지표 기록 (metrics 는 요청 계측의 RequestMetrics)
+    """
+    if method not in KNOWN_METHODS:
+        method = "other"
+    REQUESTS.labels(view, method, str(status)).inc()
+    REQUEST_LATENCY.labels(view).observe(metrics.total_time)
+    REQUEST_DB_TIME.labels(view).observe(metrics.db_time)
+    REQUEST_QUERIES.labels(view).observe(metrics.query_count)
+    for connection in connections.all(initialized_only=True):
+        DB_CONNECTIONS.labels(connection.alias).set(
+            0 if connection.connection is None else 1
+        )
+
+
+def record_cache_lookup(layer: str, hits: int, misses: int = 0):
+    """
+    캐시 계층의 적중/누락 수 기록 (여러 키를 한 번에 읽었으면 키 단위로 셈)
+    """
+    if not is_enabled():
+        return
+    if hits:
+        CACHE_LOOKUPS.labels(layer, "hit").inc(hits)
+    if misses:
+        CACHE_LOOKUPS.labels(layer, "miss").inc(misses)
+
+
+def get_multiproc_dir() -> Optional[str]:
+    return os.environ.get(MULTIPROC_DIR_ENV) or None
+
+
+def mark_worker_dead(pid: int):
+    """
+    종료된 워커의 livesum 게이지 파일 정리 (gunicorn child_exit 훅에서 호출)
+    """
+    if prometheus_client is not None and get_multiproc_dir():
+        multiprocess.mark_process_dead(pid)
+
+
+def render_metrics() -> bytes:
+    """
+    Prometheus 텍스트 형식 (멀티 프로세스면 모든 워커 합산)
+    """
+    if get_multiproc_dir():
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return prometheus_client.generate_latest(registry)
+
+
+def metrics_view(request):
+    """
+    /metrics (Authorization: Bearer METRICS_TOKEN 필요, 토큰이 없으면 DEBUG 에서만 허용)
+    """
+    if not is_enabled():
+        return HttpResponse(
+            "metrics disabled\n", status=503, content_type="text/plain; charset=utf-8"
+        )
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if not token:
+        if not settings.DEBUG:
+            return HttpResponse(status=403)
+    elif not constant_time_compare(
+        request.headers.get("Authorization", ""), f"Bearer {token}"
+    ):
+        return HttpResponse(status=401)
+    return HttpResponse(
+        render_metrics(), content_type=prometheus_client.CONTENT_TYPE_LATEST
+    )
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.1 on 2026-10-18 06:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SlowQuery",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, db_index=True, verbose_name="기록일시"
+                    ),
+                ),
+                (
+                    "view_name",
+                    models.CharField(
+                        db_index=True, max_length=200, verbose_name="뷰 이름"
+                    ),
+                ),
+                ("request_id", models.CharField(max_length=64, verbose_name="요청 id")),
+                (
+                    "database",
+                    models.CharField(
+                        default="default", max_length=50, verbose_name="DB 별칭"
+                    ),
+                ),
+                (
+                    "fingerprint_hash",
+                    models.CharField(
+                        db_index=True, max_length=32, verbose_name="SQL 지문 해시"
+                    ),
+                ),
+                ("fingerprint", models.TextField(verbose_name="SQL 지문")),
+                ("sql", models.TextField(verbose_name="SQL")),
+                ("duration_ms", models.FloatField(verbose_name="실행 시간(ms)")),
+                (
+                    "explain_mode",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="실행 계획 방식"
+                    ),
+                ),
+                ("plan", models.TextField(blank=True, verbose_name="실행 계획")),
+            ],
+            options={
+                "verbose_name": "느린 쿼리",
+                "verbose_name_plural": "느린 쿼리들",
+                "db_table": "slow_queries",
+            },
+        ),
+    ]
@@ -51,3 +51,28 @@ class BaseModel(TimeStampedModel, SoftDeleteModel):
 
     class Meta:
         abstract = True
+
+
+class SlowQuery(models.Model):
+    """
+    느린 쿼리 기록 (요청의 뷰 이름과 실행 계획 포함)
+    """
+
+    created_at = models.DateTimeField("기록일시", auto_now_add=True, db_index=True)
+    view_name = models.CharField("뷰 이름", max_length=200, db_index=True)
+    request_id = models.CharField("요청 id", max_length=64)
+    database = models.CharField("DB 별칭", max_length=50, default="default")
+    fingerprint_hash = models.CharField("SQL 지문 해시", max_length=32, db_index=True)
+    fingerprint = models.TextField("SQL 지문")
+    sql = models.TextField("SQL")
+    duration_ms = models.FloatField("실행 시간(ms)")
+    explain_mode = models.CharField("실행 계획 방식", max_length=20, blank=True)
+    plan = models.TextField("실행 계획", blank=True)
+
+    class Meta:
+        db_table = "slow_queries"
+        verbose_name = "느린 쿼리"
+        verbose_name_plural = "느린 쿼리들"
+
+    def __str__(self):
+        return f"{self.view_name} {self.duration_ms:.1f}ms"
@@ -0,0 +1,430 @@
+"""
+공통 페이지네이션
+"""
+
+import json
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core import signing
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import BooleanField, Expression, F, Q, QuerySet, Value
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+DEFAULT_ESTIMATE_THRESHOLD = 10000
+
+
+def get_estimate_threshold() -> int:
+    """
+    추정 개수를 사용하기 시작하는 기준 행 수
+    """
+    return getattr(
+        settings, "PAGINATION_ESTIMATE_THRESHOLD", DEFAULT_ESTIMATE_THRESHOLD
+    )
+
+
+def estimate_queryset_count(queryset: QuerySet) -> Optional[int]:
+    """
+    PostgreSQL 플래너 통계로 쿼리셋 행 수 추정
+    조건이 없으면 pg_class.reltuples, 있으면 EXPLAIN 의 예상 행 수를 사용하고
+    추정할 수 없으면 None 을 반환
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    query = queryset.query
+    with connection.cursor() as cursor:
+        if not query.where and not query.distinct and not query.is_sliced:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            # 한 번도 ANALYZE 되지 않은 테이블은 -1
+            return row[0] if row and row[0] >= 0 else None
+
+        sql, params = queryset.order_by().query.sql_with_params()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedPage(Page):
+    """
+    추정 개수로 만든 페이지 (다음 페이지 여부는 한 행을 더 읽어 판단)
+    """
+
+    def __init__(self, object_list, number, paginator, has_next: bool):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    대용량 테이블용 페이지네이터
+    플래너 추정 개수가 기준 이상이면 정확한 COUNT(*) 대신 추정값을 사용하고,
+    기준 미만이면 정확한 개수로 대체한다.
+    추정값을 쓸 때는 페이지 번호를 추정 페이지 수로 제한하지 않고 페이지를 한 행 더
+    읽어, 짧은 페이지는 마지막 페이지로 보고 개수를 바로잡는다.
+    """
+
+    is_estimated = False
+
+    @cached_property
+    def count(self):
+        if isinstance(self.object_list, QuerySet):
+            estimate = estimate_queryset_count(self.object_list)
+            if estimate is not None and estimate >= get_estimate_threshold():
+                self.is_estimated = True
+                return estimate
+        return super().count
+
+    def validate_number(self, number):
+        self.count  # 추정값 사용 여부 결정
+        if not self.is_estimated:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.is_estimated:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        has_next = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        if not has_next:
+            # 마지막 페이지를 읽었으므로 정확한 개수를 알 수 있음
+            self.set_count(bottom + len(rows), estimated=False)
+        elif self.count <= bottom + self.per_page:
+            # 추정값보다 행이 많으면 적어도 다음 페이지가 있도록 늘림
+            self.set_count(bottom + self.per_page + 1, estimated=True)
+        return EstimatedPage(rows, number, self, has_next)
+
+    def get_page(self, number):
+        try:
+            return super().get_page(number)
+        except EmptyPage:
+            # 추정값이 실제보다 커서 마지막 페이지도 비었으면 정확한 개수로 다시 계산
+            self.set_count(super().count, estimated=False)
+            return super().get_page(number)
+
+    def set_count(self, count: int, estimated: bool):
+        self.__dict__["count"] = count
+        self.__dict__.pop("num_pages", None)
+        self.is_estimated = estimated
+
+
+class EstimatedPageNumberPagination(PageNumberPagination):
+    """
+    추정 개수를 사용하는 페이지 번호 페이지네이션
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "count": self.page.paginator.count,
+                "total_items_estimated": self.page.paginator.is_estimated,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["total_items_estimated"] = {
+            "type": "boolean",
+            "example": False,
+        }
+        return response_schema
+
+
+class RowValueComparison(Expression):
+    """
+    행 값 비교 조건 (a, b) < (x, y)
+    같은 순서의 복합 인덱스 구간 조건으로 쓰여 OR 로 풀어 쓴 조건과 달리 인덱스를
+    커서 위치부터 바로 읽는다.
+    """
+
+    output_field = BooleanField()
+    conditional = True
+
+    def __init__(self, lhs: List[Any], operator: str, rhs: List[Any]):
+        super().__init__()
+        self.lhs = list(lhs)
+        self.operator = operator
+        self.rhs = list(rhs)
+
+    def get_source_expressions(self):
+        return [*self.lhs, *self.rhs]
+
+    def set_source_expressions(self, exprs):
+        self.lhs, self.rhs = list(exprs[: len(self.lhs)]), list(exprs[len(self.lhs) :])
+
+    def as_sql(self, compiler, connection):
+        params = []
+        sides = []
+        for expressions in (self.lhs, self.rhs):
+            parts = []
+            for expression in expressions:
+                sql, expression_params = compiler.compile(expression)
+                parts.append(sql)
+                params.extend(expression_params)
+            sides.append(f"({', '.join(parts)})")
+        return f"{sides[0]} {self.operator} {sides[1]}", params
+
+
+class KeysetPagination(BasePagination):
+    """
+    키셋(커서) 페이지네이션
+    마지막으로 본 행의 정렬 키 값을 커서에 담아 WHERE 조건으로 이어서 조회하므로
+    COUNT(*) 와 OFFSET 없이 몇 번째 페이지든 첫 페이지와 같은 비용으로 조회한다.
+    정렬 키의 마지막 필드는 유일해야 한다 (기본값: id).
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    ordering: Sequence[str] = ("-created_at", "-id")
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+    signing_salt = "apps.core.pagination.KeysetPagination"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = getattr(view, "keyset_ordering", self.ordering)
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+
+        position, reverse = self.decode_cursor(request)
+        ordering = self._reversed_ordering() if reverse else list(self.ordering)
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._build_filter(queryset, position, reverse))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+
+        if reverse:
+            self.has_previous = has_more
+            self.has_next = position is not None
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = results
+        return results
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        cursor = self.encode_cursor(self._position_of(self.page[-1]), reverse=False)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        cursor = self.encode_cursor(self._position_of(self.page[0]), reverse=True)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def encode_cursor(self, position: List[Any], reverse: bool) -> str:
+        """
+        정렬 키 값을 서명된 불투명 커서 문자열로 변환
+        """
+        values = [
+            value.isoformat() if hasattr(value, "isoformat") else value
+            for value in position
+        ]
+        return signing.dumps(
+            {"p": values, "r": reverse}, salt=self.signing_salt, compress=True
+        )
+
+    def decode_cursor(self, request) -> Tuple[Optional[List[Any]], bool]:
+        """
+        커서 문자열을 (정렬 키 값, 역방향 여부)로 변환
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = signing.loads(encoded, salt=self.signing_salt)
+            position, reverse = payload["p"], bool(payload["r"])
+        except (signing.BadSignature, KeyError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+        if len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def _fields(self) -> List[Tuple[str, bool]]:
+        return [(field.lstrip("-"), field.startswith("-")) for field in self.ordering]
+
+    def _reversed_ordering(self) -> List[str]:
+        return [name if desc else f"-{name}" for name, desc in self._fields()]
+
+    def _position_of(self, instance) -> List[Any]:
+        return [getattr(instance, name) for name, _ in self._fields()]
+
+    def _build_filter(self, queryset, position: List[Any], reverse: bool) -> Q:
+        """
+        (a, b, c) 이후 행 조건
+        정렬 방향이 모두 같으면 행 값 비교 (a, b, c) > (x, y, z) 로 만들어 복합 인덱스
+        구간으로 읽게 하고, 섞여 있으면 a > x OR (a = x AND b > y) OR ... 로 푼다.
+        어느 쪽이든 첫 필드만 있는 인덱스((status, -created_at) 등)도 구간으로 쓸 수 있도록
+        중복 조건 a >= x 를 함께 붙인다.
+        """
+        opts = queryset.model._meta
+        fields = self._fields()
+        try:
+            values = [
+                opts.get_field(name).to_python(value)
+                for (name, _), value in zip(fields, position)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+        lookups = ["lt" if desc != reverse else "gt" for _, desc in fields]
+        first_name = fields[0][0]
+        inclusive = {"lt": "lte", "gt": "gte"}[lookups[0]]
+        leading = Q(**{f"{first_name}__{inclusive}": values[0]})
+
+        if len(set(lookups)) == 1:
+            row = RowValueComparison(
+                [F(name) for name, _ in fields],
+                "<" if lookups[0] == "lt" else ">",
+                [
+                    Value(value, output_field=opts.get_field(name))
+                    for (name, _), value in zip(fields, values)
+                ],
+            )
+            return leading & Q(row)
+
+        condition = Q()
+        equal = Q()
+        for (name, _), lookup, value in zip(fields, lookups, values):
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return leading & condition
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "페이지 커서",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "페이지 크기",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class OptionalKeysetPagination(BasePagination):
+    """
+    페이지 번호 페이지네이션을 기본으로 하고,
+    ?pagination=cursor 또는 ?cursor= 가 있으면 키셋 페이지네이션을 사용
+    """
+
+    mode_query_param = "pagination"
+    page_number_class = EstimatedPageNumberPagination
+    keyset_class = KeysetPagination
+
+    def __init__(self):
+        self.delegate = self.page_number_class()
+
+    def is_keyset_requested(self, request) -> bool:
+        return (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or self.keyset_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.is_keyset_requested(request):
+            self.delegate = self.keyset_class()
+        return self.delegate.paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        return self.delegate.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.delegate.get_paginated_response_schema(schema)
+
+    def get_schema_operation_parameters(self, view):
+        keyset = self.keyset_class()
+        return (
+            self.page_number_class().get_schema_operation_parameters(view)
+            + keyset.get_schema_operation_parameters(view)
+            + [
+                {
+                    "name": self.mode_query_param,
+                    "required": False,
+                    "in": "query",
+                    "description": "cursor 로 지정하면 키셋 페이지네이션 사용",
+                    "schema": {"type": "string", "enum": ["cursor"]},
+                }
+            ]
+        )
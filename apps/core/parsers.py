@@ -0,0 +1,26 @@
+"""
+공통 파서
+"""
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .encoders import loads
+
+
+class FastJSONParser(JSONParser):
+    """
+    orjson 기반 JSON 파서
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            data = stream.read()
+            if encoding.lower().replace("-", "") != "utf8":
+                data = data.decode(encoding)
+            return loads(data)
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
@@ -0,0 +1,291 @@
+"""
+요청 프로파일링
+일부 요청(PROFILING_SAMPLE_RATE) 또는 서명된 X-Profile 헤더가 붙은 요청을 프로파일링해
+뷰 이름별 파일로 남긴다. merge_profiles 명령어로 합쳐서 요약한다.
+
+- sample (기본): 별도 스레드가 PROFILING_INTERVAL_MS 마다 요청 스레드의 스택을 읽어
+  flame graph 도구가 읽는 collapsed stack 형식("프레임;프레임;... 횟수")으로 기록
+  (프로파일링 중인 요청에도 부담이 거의 없음)
+- cprofile: cProfile 결과(.prof)를 요청마다 저장 (함수 호출마다 부담이 있어 느려짐)
+- 헤더 토큰은 create_profiling_token 명령어로 만들며 PROFILING_TOKEN_MAX_AGE 초 동안 유효,
+  경로(접두사)나 뷰 하나에 묶이고 정해진 요청 수만큼만 쓸 수 있다.
+- PROFILING_VIEWS 를 주면 그 뷰(PostViewSet.retrieve 등)의 결과만 남긴다.
+- 결과 디렉터리의 .prof 파일은 PROFILING_MAX_PROFILES 개까지만 두고(오래된 것부터 삭제),
+  collapsed stack 파일이 PROFILING_MAX_COLLAPSED_BYTES 를 넘으면 같은 스택끼리 합쳐 줄이고
+  그래도 충분히 줄지 않으면 더 쓰지 않는다.
+"""
+
+import cProfile
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+
+from .instrumentation import resolve_view_name
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "HTTP_X_PROFILE"
+TOKEN_SALT = "apps.core.profiling"
+TOKEN_USES_KEY_PREFIX = "profiling:token"
+COLLAPSED_SUFFIX = ".collapsed"
+CPROFILE_SUFFIX = ".prof"
+_UNSAFE_FILENAME = re.compile(r"[^\w.-]")
+
+
+def get_profile_dir() -> Path:
+    return Path(
+        getattr(settings, "PROFILING_DIR", settings.BASE_DIR / "logs" / "profiles")
+    )
+
+
+def get_token_max_age() -> int:
+    return getattr(settings, "PROFILING_TOKEN_MAX_AGE", 3600)
+
+
+def create_profiling_token(
+    path: str = "", view: str = "", requests: Optional[int] = None
+) -> str:
+    """
+    X-Profile 헤더 값 (경로 접두사/뷰 이름과 사용 가능한 요청 수를 담은 서명된 토큰)
+    """
+    if requests is None:
+        requests = getattr(settings, "PROFILING_TOKEN_MAX_REQUESTS", 100)
+    claims = {"id": uuid.uuid4().hex, "path": path, "view": view, "requests": requests}
+    return signing.dumps(claims, salt=TOKEN_SALT)
+
+
+def get_token_claims(token: str, request_path: str) -> Optional[dict]:
+    """
+    요청에 쓸 수 있는 토큰이면 내용, 아니면 None
+    서명/유효 시간/경로를 확인한 뒤 사용 횟수를 하나 늘려 요청 수를 넘었는지 본다.
+    """
+    try:
+        claims = signing.loads(token, salt=TOKEN_SALT, max_age=get_token_max_age())
+    except signing.BadSignature:
+        logger.warning("유효하지 않은 프로파일링 토큰입니다.")
+        return None
+    if not request_path.startswith(claims["path"]):
+        return None
+
+    key = f"{TOKEN_USES_KEY_PREFIX}:{claims['id']}"
+    cache.add(key, 0, get_token_max_age())
+    try:
+        uses = cache.incr(key)
+    except ValueError:
+        return None
+    if uses > claims["requests"]:
+        logger.warning("프로파일링 토큰의 요청 수를 모두 사용했습니다.")
+        return None
+    return claims
+
+
+def should_profile(request) -> bool:
+    """
+    쓸 수 있는 서명된 헤더가 있거나 샘플링된 요청이면 True
+    토큰이 뷰에 묶여 있으면 request._profiling_view 에 남겨 그 뷰의 결과만 저장한다.
+    """
+    token = request.META.get(PROFILE_HEADER)
+    if token:
+        claims = get_token_claims(token, request.path)
+        if claims is not None:
+            request._profiling_view = claims["view"]
+            return True
+    rate = getattr(settings, "PROFILING_SAMPLE_RATE", 0.0)
+    return rate >= 1 or (rate > 0 and random.random() < rate)
+
+
+def format_frame(frame) -> str:
+    """
+    collapsed stack 의 프레임 이름 (모듈:함수)
+    """
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{module}:{name}".replace(";", ":")
+
+
+class StackSampler:
+    """
+    대상 스레드의 스택을 일정 간격으로 읽어 collapsed stack 별 횟수를 세는 샘플러
+    root_code 프레임(프로파일링 미들웨어) 위쪽만 기록한다.
+    """
+
+    def __init__(self, thread_id: int, interval: float, root_code=None):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.root_code = root_code
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = self.collapse(frame) if frame is not None else None
+            if stack:
+                self.stacks[stack] += 1
+
+    def collapse(self, frame) -> Optional[str]:
+        """
+        프레임의 collapsed stack, 샘플러를 멈추는 중이면 None
+        """
+        frames = []
+        while frame is not None:
+            if frame.f_code is StackSampler.stop.__code__:
+                return None
+            frames.append(format_frame(frame))
+            if frame.f_code is self.root_code:
+                break
+            frame = frame.f_back
+        return ";".join(reversed(frames))
+
+
+def profile_filename(view_name: str, suffix: str) -> Path:
+    directory = get_profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{_UNSAFE_FILENAME.sub('_', view_name)}.{os.getpid()}{suffix}"
+
+
+def compact_collapsed_stacks(path: Path):
+    """
+    collapsed stack 파일의 같은 스택 줄을 합쳐 다시 씀
+    """
+    stacks: Counter = Counter()
+    with open(path) as file:
+        for line in file:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            if stack and count.isdigit():
+                stacks[stack] += int(count)
+    with open(path, "w") as file:
+        file.write("".join(f"{stack} {count}\n" for stack, count in stacks.items()))
+
+
+def write_collapsed_stacks(view_name: str, stacks: Counter):
+    """
+    뷰의 프로세스별 collapsed stack 파일에 이어 씀 (한 요청을 한 번에 씀)
+    파일이 PROFILING_MAX_COLLAPSED_BYTES 를 넘으면 합쳐 줄이고, 그래도 크면 버림
+    파일 오류는 기록만 하고 넘어감 (응답에는 영향 없음)
+    """
+    if not stacks:
+        return
+    try:
+        path = profile_filename(view_name, COLLAPSED_SUFFIX)
+        max_bytes = getattr(settings, "PROFILING_MAX_COLLAPSED_BYTES", 10 * 1024 * 1024)
+        if path.exists() and path.stat().st_size >= max_bytes:
+            compact_collapsed_stacks(path)
+            # 합쳐도 절반 아래로 줄지 않으면 매번 다시 합치지 않도록 더 쓰지 않음
+            if path.stat().st_size >= max_bytes // 2:
+                logger.warning(
+                    "프로파일 파일이 최대 크기를 넘어 결과를 버립니다: %s", path.name
+                )
+                return
+        lines = "".join(f"{stack} {count}\n" for stack, count in stacks.items())
+        with open(path, "a") as file:
+            file.write(lines)
+    except OSError:
+        logger.exception("프로파일 결과를 저장하지 못했습니다: %s", view_name)
+
+
+def prune_cprofiles(keep: int):
+    """
+    결과 디렉터리의 .prof 파일을 최근 keep 개만 남기고 삭제
+    """
+    paths = sorted(
+        get_profile_dir().glob(f"*{CPROFILE_SUFFIX}"),
+        key=lambda path: path.stat().st_mtime,
+    )
+    for path in paths[: max(len(paths) - keep, 0)]:
+        path.unlink(missing_ok=True)
+
+
+def write_cprofile(view_name: str, profiler: cProfile.Profile):
+    """
+    요청 하나의 cProfile 결과 저장 (파일 이름에 시각을 붙여 요청마다 따로 저장)
+    PROFILING_MAX_PROFILES 개를 넘지 않도록 오래된 파일부터 지운다.
+    파일 오류는 기록만 하고 넘어감 (응답에는 영향 없음)
+    """
+    try:
+        path = profile_filename(view_name, f".{time.time_ns()}{CPROFILE_SUFFIX}")
+        profiler.dump_stats(path)
+        prune_cprofiles(getattr(settings, "PROFILING_MAX_PROFILES", 200))
+    except OSError:
+        logger.exception("프로파일 결과를 저장하지 못했습니다: %s", view_name)
+
+
+class RequestProfilingMiddleware:
+    """
+    요청 프로파일링 미들웨어 (요청 계측 미들웨어 다음에 둠)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not should_profile(request):
+            return self.get_response(request)
+
+        if getattr(settings, "PROFILING_MODE", "sample") == "cprofile":
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # 다른 프로파일러가 이미 동작 중 (동시 요청 등)
+                return self.get_response(request)
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+            view_name = self.get_view_name(request)
+            if view_name:
+                write_cprofile(view_name, profiler)
+            return response
+
+        sampler = StackSampler(
+            threading.get_ident(),
+            getattr(settings, "PROFILING_INTERVAL_MS", 5) / 1000,
+            root_code=RequestProfilingMiddleware.__call__.__code__,
+        )
+        sampler.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            sampler.stop()
+        view_name = self.get_view_name(request)
+        if view_name:
+            write_collapsed_stacks(view_name, sampler.stacks)
+        return response
+
+    def get_view_name(self, request) -> Optional[str]:
+        """
+        결과를 남길 뷰 이름
+        PROFILING_VIEWS 에 없거나 토큰이 묶인 뷰가 아니면 None
+        """
+        view_name = resolve_view_name(request)
+        views = getattr(settings, "PROFILING_VIEWS", [])
+        if views and view_name not in views:
+            return None
+        bound_view = getattr(request, "_profiling_view", "")
+        if bound_view and view_name != bound_view:
+            return None
+        return view_name
@@ -0,0 +1,55 @@
+"""
+쿼리 점검 pytest 플러그인 (pytest-django 필요)
+루트 conftest.py 에 pytest_plugins = ["apps.core.pytest_plugin"] 로 등록되어 있다.
+
+- query_checks: 테스트 동안 QUERY_CHECK_MODE 를 raise 로 바꿔
+  테스트 클라이언트 요청이 N+1 이나 뷰의 쿼리 예산 초과 시 실패하게 함
+- assert_max_queries: 블록 안의 쿼리 수 상한과 N+1 을 직접 점검하는 컨텍스트 매니저
+
+    def test_post_list(client, query_checks):
+        client.get("/api/v1/posts/")
+
+    def test_feed(assert_max_queries):
+        with assert_max_queries(4):
+            list(get_feed(user))
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+from .query_checks import check_queries, count_fingerprints
+
+
+@pytest.fixture
+def query_checks(settings):
+    """
+    요청 단위 N+1 / 쿼리 예산 점검을 예외로 켬
+    """
+    settings.QUERY_CHECK_MODE = "raise"
+    yield
+
+
+@contextmanager
+def _assert_max_queries(max_queries, using=DEFAULT_DB_ALIAS, detect_nplusone=True):
+    with CaptureQueriesContext(connections[using]) as context:
+        yield context
+    sqls = [query["sql"] for query in context.captured_queries]
+    check_queries(
+        "assert_max_queries",
+        len(sqls),
+        count_fingerprints(sqls) if detect_nplusone else Counter(),
+        budget=max_queries,
+        mode="raise",
+    )
+
+
+@pytest.fixture
+def assert_max_queries():
+    """
+    쿼리 수 상한 점검 컨텍스트 매니저 (넘거나 N+1 이 보이면 QueryCheckError)
+    """
+    return _assert_max_queries
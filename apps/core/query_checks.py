@@ -0,0 +1,151 @@
+"""
+쿼리 점검 (N+1 감지 / 뷰별 쿼리 예산)
+요청 계측 미들웨어가 모은 SQL 을 지문(리터럴과 파라미터를 지운 모양)으로 묶어
+같은 모양이 NPLUSONE_THRESHOLD 번 이상 반복되면 N+1 로 보고,
+뷰에 선언한 쿼리 예산을 넘으면 예산 초과로 보고한다.
+
+- QUERY_CHECK_MODE: "" (끔) / "log" (경고 로그) / "raise" (예외, 테스트용)
+- 쿼리 예산: 뷰 메서드에 @query_budget(N) 또는 QUERY_BUDGETS = {"PostViewSet.list": N}
+  (설정이 우선, 세션/인증 쿼리를 포함한 요청 전체의 쿼리 수)
+"""
+
+import logging
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+# 트랜잭션 제어문은 반복되어도 N+1 이 아님
+_IGNORED_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class QueryCheckError(AssertionError):
+    """
+    쿼리 점검 실패 (QUERY_CHECK_MODE = "raise")
+    """
+
+
+class NPlusOneDetected(QueryCheckError):
+    """
+    같은 모양의 쿼리가 반복됨
+    """
+
+
+class QueryBudgetExceeded(QueryCheckError):
+    """
+    뷰의 쿼리 예산 초과
+    """
+
+
+def fingerprint_sql(sql: str) -> str:
+    """
+    SQL 지문 (문자열/숫자 리터럴과 파라미터를 ? 로, IN 목록을 (...) 로 바꿈)
+    """
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _VALUE_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def get_check_mode() -> str:
+    return getattr(settings, "QUERY_CHECK_MODE", "")
+
+
+def get_threshold() -> int:
+    return getattr(settings, "NPLUSONE_THRESHOLD", 5)
+
+
+def find_repeated_queries(
+    fingerprints: Counter, threshold: Optional[int] = None
+) -> List[Tuple[str, int]]:
+    """
+    threshold 번 이상 반복된 (지문, 횟수) 목록 (많은 순)
+    """
+    threshold = threshold or get_threshold()
+    return [
+        (fingerprint, count)
+        for fingerprint, count in fingerprints.most_common()
+        if count >= threshold and not fingerprint.startswith(_IGNORED_PREFIXES)
+    ]
+
+
+def count_fingerprints(sqls: Iterable[str]) -> Counter:
+    return Counter(fingerprint_sql(sql) for sql in sqls)
+
+
+def query_budget(max_queries: int):
+    """
+    뷰 메서드(ViewSet 액션 포함)의 쿼리 예산 선언 데코레이터
+    """
+
+    def decorator(func):
+        func.query_budget = max_queries
+        return func
+
+    return decorator
+
+
+def get_query_budget(request, view_name: str) -> Optional[int]:
+    """
+    요청을 처리한 뷰의 쿼리 예산 (QUERY_BUDGETS 설정 > @query_budget), 없으면 None
+    """
+    budgets: Dict[str, int] = getattr(settings, "QUERY_BUDGETS", {})
+    if view_name in budgets:
+        return budgets[view_name]
+
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return None
+    view_class = getattr(match.func, "cls", None) or getattr(
+        match.func, "view_class", None
+    )
+    if view_class is None:
+        return getattr(match.func, "query_budget", None)
+    method = request.method.lower()
+    actions = getattr(match.func, "actions", None) or {}
+    handler = getattr(view_class, actions.get(method, method), None)
+    return getattr(handler, "query_budget", None)
+
+
+def check_queries(
+    view_name: str,
+    query_count: int,
+    fingerprints: Counter,
+    budget: Optional[int] = None,
+    mode: Optional[str] = None,
+) -> List[str]:
+    """
+    N+1 과 쿼리 예산 점검, 문제 설명 목록을 반환
+    mode 가 log 면 경고 로그, raise 면 QueryCheckError 를 발생
+    """
+    mode = get_check_mode() if mode is None else mode
+    problems = []
+    error_class = QueryCheckError
+
+    repeated = find_repeated_queries(fingerprints)
+    if repeated:
+        error_class = NPlusOneDetected
+        problems.extend(
+            f"{view_name}: N+1 의심 쿼리 {count}회 반복: {fingerprint}"
+            for fingerprint, count in repeated
+        )
+    if budget is not None and query_count > budget:
+        error_class = QueryBudgetExceeded
+        problems.append(f"{view_name}: 쿼리 {query_count}개 (예산 {budget}개 초과)")
+
+    if problems:
+        if mode == "raise":
+            raise error_class("\n".join(problems))
+        if mode == "log":
+            for problem in problems:
+                logger.warning(problem)
+    return problems
@@ -0,0 +1,33 @@
+"""
+Redis 클라이언트
+redis 패키지(운영 의존성)가 없거나 REDIS_URL 이 비어 있으면 None 을 반환하고,
+호출하는 쪽에서 DB 저장소 등으로 대체한다.
+"""
+
+import threading
+from typing import Optional
+
+from django.conf import settings
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - 개발 환경에는 redis 미설치
+    redis = None
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_redis_client() -> Optional["redis.Redis"]:
+    """
+    REDIS_URL 로 연결하는 Redis 클라이언트 (프로세스당 하나, 연결 풀 공유)
+    """
+    global _client
+    url = getattr(settings, "REDIS_URL", "")
+    if redis is None or not url:
+        return None
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = redis.Redis.from_url(url)
+    return _client
@@ -0,0 +1,214 @@
+"""
+공통 시리얼라이저 기능
+?fields= / ?expand= 로 응답 필드를 골라 받는 희소 필드셋(sparse fieldset)
+
+- fields: 응답에 포함할 필드 (점 표기로 중첩 필드 지정, 예: id,title,author.nickname)
+- expand: 중첩 객체로 펼칠 관계 (지정하지 않은 관계는 기본키만 반환)
+
+fields 를 지정하지 않으면 기존과 같이 모든 필드를 반환한다.
+선택 결과는 쿼리셋의 .only() / select_related / prefetch_related 에도 반영되어
+요청하지 않은 관계는 쿼리를 발생시키지 않는다.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+from .instrumentation import SerializationTimingMixin
+
+FIELDS_QUERY_PARAM = "fields"
+EXPAND_QUERY_PARAM = "expand"
+
+FieldTree = Dict[str, "FieldTree"]
+
+
+def parse_field_tree(value: str) -> FieldTree:
+    """
+    "id,author.nickname" -> {"id": {}, "author": {"nickname": {}}}
+    """
+    tree: FieldTree = {}
+    for path in value.split(","):
+        node = tree
+        for name in path.strip().split("."):
+            if name:
+                node = node.setdefault(name, {})
+    return tree
+
+
+def parse_expand(value: str) -> Set[str]:
+    """
+    "author,author.profile" -> {"author", "author.profile"}
+    """
+    expand = set()
+    for path in value.split(","):
+        parts = [name for name in path.strip().split(".") if name]
+        for depth in range(1, len(parts) + 1):
+            expand.add(".".join(parts[:depth]))
+    return expand
+
+
+def get_sparse_selection(request) -> Tuple[Optional[FieldTree], Set[str]]:
+    """
+    요청에서 (필드 트리, 펼칠 관계) 추출, 희소 필드셋 요청이 아니면 (None, set())
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None, set()
+    fields = request.query_params.get(FIELDS_QUERY_PARAM)
+    if not fields:
+        return None, set()
+    expand = parse_expand(request.query_params.get(EXPAND_QUERY_PARAM, ""))
+    return parse_field_tree(fields), expand
+
+
+def _is_nested(field) -> bool:
+    return isinstance(field, serializers.BaseSerializer)
+
+
+def _nested_serializer(field) -> serializers.BaseSerializer:
+    return field.child if isinstance(field, serializers.ListSerializer) else field
+
+
+def prune_fields(fields, tree: FieldTree, expand: Set[str], path: str = ""):
+    """
+    바인딩된 필드 목록에서 선택되지 않은 필드를 제거하고,
+    펼치지 않은 관계는 기본키 필드로 교체
+    """
+    for name in list(fields):
+        if name not in tree:
+            del fields[name]
+            continue
+
+        field = fields[name]
+        if not _is_nested(field):
+            continue
+
+        field_path = f"{path}{name}"
+        subtree = tree[name]
+        if subtree or field_path in expand:
+            if subtree:
+                prune_fields(
+                    _nested_serializer(field).fields, subtree, expand, f"{field_path}."
+                )
+            continue
+
+        many = isinstance(field, serializers.ListSerializer)
+        fields[name] = serializers.PrimaryKeyRelatedField(
+            source=field.source, many=many, read_only=True
+        )
+    return fields
+
+
+class SparseFieldsetMixin(SerializationTimingMixin):
+    """
+    ?fields= / ?expand= 를 지원하는 시리얼라이저 믹스인
+    최상위 시리얼라이저(many=True 의 child 포함)에서만 요청 파라미터를 읽는다.
+    (요청 계측 시 직렬화 시간도 기록)
+
+    - field_sources: 모델 컬럼이 아닌 필드가 읽는 컬럼 (예: display_name -> nickname, username)
+    """
+
+    field_sources: Dict[str, List[str]] = {}
+
+    def is_root_serializer(self) -> bool:
+        parent = getattr(self, "parent", None)
+        if parent is None:
+            return True
+        return isinstance(parent, serializers.ListSerializer) and parent.parent is None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.is_root_serializer():
+            return fields
+        tree, expand = get_sparse_selection(self.context.get("request"))
+        if tree is None:
+            return fields
+        return prune_fields(fields, tree, expand)
+
+
+def build_queryset_plan(serializer, model, prefix: str = ""):
+    """
+    선택된 필드로부터 (only 컬럼 목록 또는 None, select_related 경로, prefetch 목록) 계산
+    컬럼을 알 수 없는 필드가 있으면 only 는 None (전체 컬럼 조회)
+    """
+    opts = model._meta
+    only: Optional[List[str]] = [f"{prefix}{opts.pk.name}"]
+    select_related: List[str] = []
+    prefetch: List = []
+    field_sources = getattr(serializer, "field_sources", {})
+
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        source = field.source
+
+        if name in field_sources:
+            if only is not None:
+                only += [f"{prefix}{column}" for column in field_sources[name]]
+            continue
+
+        try:
+            model_field = opts.get_field(source) if "." not in source else None
+        except Exception:
+            model_field = None
+        if model_field is None:
+            only = None
+            continue
+
+        path = f"{prefix}{source}"
+        if _is_nested(field):
+            nested = _nested_serializer(field)
+            if model_field.many_to_many or model_field.one_to_many:
+                prefetch.append(path)
+                continue
+            select_related.append(path)
+            nested_only, nested_select, nested_prefetch = build_queryset_plan(
+                nested, model_field.related_model, f"{path}__"
+            )
+            select_related += nested_select
+            prefetch += nested_prefetch
+            if only is not None:
+                only.append(path)
+                only = only + nested_only if nested_only is not None else None
+        elif model_field.many_to_many or model_field.one_to_many:
+            related_manager = model_field.related_model._default_manager
+            prefetch.append(Prefetch(path, queryset=related_manager.only("pk")))
+        elif only is not None:
+            only.append(path)
+
+    return only, select_related, prefetch
+
+
+class SparseFieldsetViewMixin:
+    """
+    희소 필드셋 선택을 쿼리셋(.only / select_related / prefetch_related)에 반영하는 뷰 믹스인
+    """
+
+    def is_sparse_request(self) -> bool:
+        tree, _ = get_sparse_selection(getattr(self, "request", None))
+        return tree is not None
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self.is_sparse_request():
+            return queryset
+
+        serializer = self.get_serializer()
+        only, select_related, prefetch = build_queryset_plan(
+            _nested_serializer(serializer), queryset.model
+        )
+        queryset = queryset.select_related(None).prefetch_related(None)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        if only is not None:
+            queryset = queryset.only(*only)
+        return queryset
+
+    def use_representation_cache(self) -> bool:
+        # 선택된 필드만 담은 응답은 객체별 직렬화 캐시를 사용하지 않음
+        if self.is_sparse_request():
+            return False
+        return super().use_representation_cache()
@@ -0,0 +1,282 @@
+"""
+느린 쿼리 로그
+요청 동안 모든 DB 연결에 execute_wrapper 를 걸어 쿼리마다 뷰 이름과 요청 id 를
+sqlcommenter 형식 SQL 주석(/*controller='PostViewSet.list',request_id='...'*/)으로 붙이고,
+SLOW_QUERY_THRESHOLD_MS 보다 오래 걸린 쿼리는 실행 계획과 함께 SlowQuery 로 남긴다.
+rank_slow_queries 명령어로 뷰/SQL 지문별 총 실행 시간 순위를 본다.
+
+- PostgreSQL 로그(log_min_duration_statement)와 pg_stat_activity 에도 주석이 그대로 남아
+  어느 뷰/요청의 쿼리인지 알 수 있다. (pg_stat_statements 는 주석이 달라도 같은 쿼리로 묶음)
+- SLOW_QUERY_EXPLAIN: analyze 면 EXPLAIN (ANALYZE, BUFFERS) (개발 환경, 쿼리를 다시 실행하므로
+  잠금을 걸지 않는 SELECT 만), plain 이면 EXPLAIN (운영 환경), 빈 값이면 실행 계획 없이 기록
+- 실행 계획은 응답을 보낸 뒤(응답 close) 구해 요청 트랜잭션과 응답 시간에 끼어들지
+  않게 하고, DB 드라이버 커서로 직접 실행해 요청 계측/쿼리 점검에 잡히지 않게 한다.
+  같은 뷰/SQL 지문은 프로세스별로 SLOW_QUERY_EXPLAIN_INTERVAL 초에 한 번만 구한다.
+- 기록은 응답을 보낸 뒤 한 번에 저장하므로 요청 트랜잭션이 롤백돼도 남는다.
+  (요청 계측보다 바깥에 두어 저장 쿼리가 요청 쿼리 수에 들어가지 않게 함)
+"""
+
+import logging
+import re
+import time
+import uuid
+from contextlib import ExitStack
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.db.models import Avg, Count, Max, Sum
+from django.utils import timezone
+
+from .encoders import dumps
+from .instrumentation import resolve_view_name
+from .models import SlowQuery
+from .query_checks import fingerprint_sql
+from .utils import generate_hash
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID_HEADER = "HTTP_X_REQUEST_ID"
+EXPLAIN_OPTIONS = {"analyze": {"analyze": True, "buffers": True}, "plain": {}}
+EXPLAINABLE_STATEMENTS = ("select", "insert", "update", "delete", "with")
+MAX_EXPLAINED_KEYS = 1000
+_VALID_REQUEST_ID = re.compile(r"^[\w.-]{1,64}$")
+# SELECT ... FOR UPDATE / FOR NO KEY UPDATE / FOR SHARE / FOR KEY SHARE (행 잠금)
+_LOCKING_CLAUSE = re.compile(
+    r"\bFOR\s+(?:NO\s+KEY\s+)?UPDATE\b|\bFOR\s+(?:KEY\s+)?SHARE\b", re.IGNORECASE
+)
+
+# (뷰 이름, SQL 지문 해시)별 마지막으로 실행 계획을 구한 시각 (프로세스별)
+_last_explained: Dict[Tuple[str, str], float] = {}
+
+
+def is_enabled() -> bool:
+    return getattr(settings, "SLOW_QUERY_LOG", False)
+
+
+def get_request_id(request) -> str:
+    """
+    요청 id (X-Request-ID 헤더 값이 안전한 형식이면 그대로, 아니면 새로 만듦)
+    """
+    request_id = request.META.get(REQUEST_ID_HEADER, "")
+    if _VALID_REQUEST_ID.match(request_id):
+        return request_id
+    return uuid.uuid4().hex
+
+
+def sql_comment(**tags) -> str:
+    """
+    sqlcommenter 형식 SQL 주석 (키 정렬, 값은 URL 인코딩해 작은따옴표로 감쌈)
+    """
+    pairs = ",".join(
+        f"{quote(key, safe='')}='{quote(str(value), safe='')}'"
+        for key, value in sorted(tags.items())
+    )
+    return f"/*{pairs}*/"
+
+
+def should_explain(view_name: str, fingerprint_hash: str) -> bool:
+    """
+    같은 뷰/SQL 지문의 실행 계획을 SLOW_QUERY_EXPLAIN_INTERVAL 초 안에 구한 적이 없으면 True
+    """
+    key = (view_name, fingerprint_hash)
+    now = time.monotonic()
+    last = _last_explained.get(key)
+    if last is not None and now - last < getattr(
+        settings, "SLOW_QUERY_EXPLAIN_INTERVAL", 300
+    ):
+        return False
+    if len(_last_explained) >= MAX_EXPLAINED_KEYS:
+        _last_explained.clear()
+    _last_explained[key] = now
+    return True
+
+
+def explain(connection, sql: str, params, mode: str) -> Tuple[str, str]:
+    """
+    쿼리의 (실행 계획, 실제 방식)
+    ANALYZE 는 쿼리를 다시 실행하므로 SELECT 가 아니거나 행 잠금을 거는 SELECT 면
+    EXPLAIN 으로 대신한다.
+    PostgreSQL 이 아니거나 실행 계획을 구할 수 없는 문이면 ("", "")
+    """
+    words = sql.split(None, 1)
+    statement = words[0].lower() if words else ""
+    if connection.vendor != "postgresql" or statement not in EXPLAINABLE_STATEMENTS:
+        return "", ""
+    if mode == "analyze" and (statement != "select" or _LOCKING_CLAUSE.search(sql)):
+        mode = "plain"
+
+    prefix = connection.ops.explain_query_prefix(**EXPLAIN_OPTIONS[mode])
+    try:
+        connection.ensure_connection()
+        raw = connection.connection
+        # 트랜잭션 안이면 세이브포인트로 감싸 실패해도 진행 중인 트랜잭션에 영향이 없게 함
+        with raw.transaction():
+            with raw.cursor() as cursor:
+                cursor.execute(f"{prefix} {sql}", params)
+                rows = cursor.fetchall()
+    except (DatabaseError, connection.Database.Error) as exc:
+        logger.warning("느린 쿼리의 실행 계획을 구하지 못했습니다: %s", exc)
+        return "", ""
+    return "\n".join(row[0] for row in rows), mode
+
+
+class SlowQueryRecorder:
+    """
+    쿼리에 SQL 주석을 붙이고 느린 쿼리를 모으는 execute_wrapper
+    뷰 이름은 URL 을 확인한 뒤(process_view) 채워지며, 그 전 쿼리는 unresolved 로 남는다.
+    실행 계획을 구할 쿼리는 (느린 쿼리, DB 별칭, SQL, 파라미터)로 모아 두었다가
+    응답을 보낸 뒤 flush 에서 구한다.
+    """
+
+    def __init__(self, request_id: str, threshold: float, explain_mode: str = ""):
+        self.request_id = request_id
+        self.threshold = threshold
+        self.explain_mode = explain_mode
+        self.slow_queries: List[SlowQuery] = []
+        self.pending_explains: List[Tuple[SlowQuery, str, str, object]] = []
+        self.set_view_name("unresolved")
+
+    def set_view_name(self, view_name: str):
+        self.view_name = view_name
+        self.comment = sql_comment(controller=view_name, request_id=self.request_id)
+        # 파라미터가 있으면 드라이버가 % 를 자리표시자로 읽으므로 이스케이프
+        self.escaped_comment = self.comment.replace("%", "%%")
+
+    def __call__(self, execute, sql, params, many, context):
+        comment = self.comment if params is None else self.escaped_comment
+        started = time.perf_counter()
+        result = execute(f"{sql} {comment}", params, many, context)
+        duration = time.perf_counter() - started
+        if duration >= self.threshold:
+            self.record(context["connection"], sql, params, many, duration)
+        return result
+
+    def record(self, connection, sql: str, params, many: bool, duration: float):
+        fingerprint = fingerprint_sql(sql)
+        fingerprint_hash = generate_hash(fingerprint)[:32]
+        slow_query = SlowQuery(
+            view_name=self.view_name,
+            request_id=self.request_id,
+            database=connection.alias,
+            fingerprint_hash=fingerprint_hash,
+            fingerprint=fingerprint,
+            sql=sql,
+            duration_ms=round(duration * 1000, 3),
+        )
+        self.slow_queries.append(slow_query)
+        if (
+            self.explain_mode
+            and not many
+            and should_explain(self.view_name, fingerprint_hash)
+        ):
+            self.pending_explains.append((slow_query, connection.alias, sql, params))
+        record = {
+            "view": slow_query.view_name,
+            "request_id": slow_query.request_id,
+            "database": slow_query.database,
+            "duration_ms": slow_query.duration_ms,
+            "fingerprint": fingerprint,
+        }
+        logger.warning("slow_query %s", dumps(record).decode(), extra={"query": record})
+
+    def explain_pending(self):
+        """
+        모아 둔 느린 쿼리의 실행 계획을 구해 기록에 채움 (요청 처리가 끝난 뒤 호출)
+        """
+        pending, self.pending_explains = self.pending_explains, []
+        for slow_query, alias, sql, params in pending:
+            slow_query.plan, slow_query.explain_mode = explain(
+                connections[alias], sql, params, self.explain_mode
+            )
+
+    def flush(self):
+        """
+        실행 계획을 채워 느린 쿼리 기록 저장 (응답 close 에서 호출)
+        """
+        self.explain_pending()
+        save_slow_queries(self.slow_queries)
+
+
+def save_slow_queries(slow_queries: List[SlowQuery]):
+    """
+    요청 중 모은 느린 쿼리 저장 (실패해도 응답에는 영향 없음)
+    """
+    try:
+        SlowQuery.objects.bulk_create(slow_queries)
+    except DatabaseError:
+        logger.exception("느린 쿼리 기록을 저장하지 못했습니다.")
+
+
+def rank_slow_queries(
+    days: int = 7, view_name: Optional[str] = None, limit: int = 20
+) -> List[dict]:
+    """
+    최근 days 일 동안의 느린 쿼리를 뷰/SQL 지문별로 묶어 총 실행 시간 순으로 정렬
+    """
+    queryset = SlowQuery.objects.filter(
+        created_at__gte=timezone.now() - timedelta(days=days)
+    )
+    if view_name:
+        queryset = queryset.filter(view_name=view_name)
+    return list(
+        queryset.values("view_name", "fingerprint_hash")
+        .annotate(
+            fingerprint=Max("fingerprint"),
+            calls=Count("id"),
+            total_ms=Sum("duration_ms"),
+            mean_ms=Avg("duration_ms"),
+            max_ms=Max("duration_ms"),
+            last_seen=Max("created_at"),
+        )
+        .order_by("-total_ms")[:limit]
+    )
+
+
+def get_latest_plan(view_name: str, fingerprint_hash: str) -> Optional[SlowQuery]:
+    """
+    뷰/SQL 지문의 가장 최근 실행 계획 기록
+    """
+    return (
+        SlowQuery.objects.filter(view_name=view_name, fingerprint_hash=fingerprint_hash)
+        .exclude(plan="")
+        .order_by("-created_at")
+        .first()
+    )
+
+
+class SlowQueryMiddleware:
+    """
+    느린 쿼리 로그 미들웨어 (SLOW_QUERY_LOG 가 켜져 있을 때만 동작, 미들웨어 맨 앞에 둠)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not is_enabled():
+            return self.get_response(request)
+
+        recorder = SlowQueryRecorder(
+            get_request_id(request),
+            getattr(settings, "SLOW_QUERY_THRESHOLD_MS", 200) / 1000,
+            explain_mode=getattr(settings, "SLOW_QUERY_EXPLAIN", "plain"),
+        )
+        request._slow_query_recorder = recorder
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+
+        if recorder.slow_queries:
+            # 응답 close 에서 처리 (request_finished 로 DB 연결을 정리하기 전에 실행됨)
+            response._resource_closers.append(recorder.flush)
+        response["X-Request-ID"] = recorder.request_id
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        recorder = getattr(request, "_slow_query_recorder", None)
+        if recorder is not None:
+            recorder.set_view_name(resolve_view_name(request))
@@ -0,0 +1,20 @@
+"""
+벤치마크 집계 테스트
+"""
+
+import pytest
+
+from apps.core.benchmarks import percentile
+
+
+def test_percentile_of_empty_values_is_zero():
+    assert percentile([], 95) == 0.0
+
+
+def test_percentile_of_single_value():
+    assert percentile([7.0], 99) == 7.0
+
+
+@pytest.mark.parametrize("pct, expected", [(0, 1.0), (50, 2.5), (100, 4.0), (95, 3.85)])
+def test_percentile_interpolates_between_values(pct, expected):
+    assert percentile([1.0, 2.0, 3.0, 4.0], pct) == pytest.approx(expected)
@@ -0,0 +1,173 @@
+"""
+페이지네이션 테스트
+키셋 커서 인코딩/디코딩과 이어서 조회하는 조건, 추정 개수 페이지네이터 점검
+"""
+
+from unittest import mock
+
+import pytest
+from django.core.paginator import EmptyPage
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.core import pagination
+from apps.core.pagination import EstimatedCountPaginator, KeysetPagination
+from apps.posts.models import Post
+from apps.users.models import User
+
+factory = APIRequestFactory()
+
+
+def make_request(**params):
+    return Request(factory.get("/", params))
+
+
+@pytest.fixture
+def posts():
+    author = User.objects.create_user(
+        email="author@example.com", username="author", password="password"
+    )
+    created = [
+        Post.objects.create(title=f"게시글 {index}", content="내용", author=author)
+        for index in range(6)
+    ]
+    # 정렬 키 첫 필드가 같은 행도 id 로 구분되는지 보도록 created_at 을 둘씩 맞춤
+    for index, post in enumerate(created):
+        post.created_at = created[index - index % 2].created_at
+        Post.objects.filter(pk=post.pk).update(created_at=post.created_at)
+    return created
+
+
+def test_cursor_round_trip():
+    paginator = KeysetPagination()
+    cursor = paginator.encode_cursor(["2026-10-18T00:00:00+00:00", 42], reverse=True)
+
+    position, reverse = paginator.decode_cursor(make_request(cursor=cursor))
+
+    assert position == ["2026-10-18T00:00:00+00:00", 42]
+    assert reverse is True
+
+
+def test_missing_cursor_starts_from_first_page():
+    assert KeysetPagination().decode_cursor(make_request()) == (None, False)
+
+
+def test_tampered_cursor_is_rejected():
+    paginator = KeysetPagination()
+    cursor = paginator.encode_cursor(["2026-10-18T00:00:00+00:00", 42], reverse=False)
+
+    with pytest.raises(NotFound):
+        paginator.decode_cursor(make_request(cursor=cursor[:-2] + "xx"))
+
+
+def test_cursor_with_wrong_key_count_is_rejected():
+    paginator = KeysetPagination()
+    cursor = paginator.encode_cursor([42], reverse=False)
+
+    with pytest.raises(NotFound):
+        paginator.decode_cursor(make_request(cursor=cursor))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering", [("-created_at", "-id"), ("-created_at", "id")])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_build_filter_matches_rows_after_position(posts, ordering, reverse):
+    paginator = KeysetPagination()
+    paginator.ordering = ordering
+    queryset = Post.objects.order_by(
+        *(paginator._reversed_ordering() if reverse else ordering)
+    )
+    rows = list(queryset)
+    anchor = rows[2]
+
+    condition = paginator._build_filter(
+        queryset, paginator._position_of(anchor), reverse
+    )
+
+    assert list(queryset.filter(condition)) == rows[3:]
+
+
+@pytest.mark.django_db
+def test_build_filter_uses_row_value_comparison_for_same_direction(posts):
+    paginator = KeysetPagination()
+    queryset = Post.objects.order_by(*paginator.ordering)
+
+    condition = paginator._build_filter(
+        queryset, paginator._position_of(posts[0]), reverse=False
+    )
+
+    sql = str(queryset.filter(condition).query)
+    assert '("posts"."created_at", "posts"."id") < (' in sql
+
+
+@pytest.mark.django_db
+def test_build_filter_rejects_invalid_values(posts):
+    paginator = KeysetPagination()
+
+    with pytest.raises(NotFound):
+        paginator._build_filter(Post.objects.all(), ["not a date", 1], reverse=False)
+
+
+def estimated(estimate):
+    """
+    플래너 추정 개수를 estimate 로 고정하고 항상 추정값을 쓰게 함
+    """
+    return mock.patch.multiple(
+        pagination,
+        estimate_queryset_count=mock.Mock(return_value=estimate),
+        get_estimate_threshold=mock.Mock(return_value=1),
+    )
+
+
+@pytest.mark.django_db
+def test_estimated_count_corrected_by_short_last_page(posts):
+    with estimated(100):
+        paginator = EstimatedCountPaginator(Post.objects.order_by("id"), 4)
+        page = paginator.page(2)
+
+    assert len(page) == 2
+    assert not page.has_next()
+    assert paginator.count == 6
+    assert not paginator.is_estimated
+
+
+@pytest.mark.django_db
+def test_pages_past_low_estimate_are_served(posts):
+    with estimated(2):
+        paginator = EstimatedCountPaginator(Post.objects.order_by("id"), 2)
+        page = paginator.page(2)
+
+        assert page.has_next()
+        assert paginator.num_pages >= 3
+        assert len(paginator.page(3)) == 2
+
+
+@pytest.mark.django_db
+def test_page_past_last_row_is_empty(posts):
+    with estimated(100):
+        paginator = EstimatedCountPaginator(Post.objects.order_by("id"), 4)
+        with pytest.raises(EmptyPage):
+            paginator.page(5)
+
+
+@pytest.mark.django_db
+def test_get_page_falls_back_to_exact_last_page(posts):
+    with estimated(100):
+        paginator = EstimatedCountPaginator(Post.objects.order_by("id"), 4)
+        page = paginator.get_page(50)
+
+    assert page.number == 2
+    assert paginator.count == 6
+    assert not page.has_next()
+
+
+@pytest.mark.django_db
+def test_exact_count_below_threshold(posts):
+    with mock.patch.object(pagination, "estimate_queryset_count", return_value=6):
+        paginator = EstimatedCountPaginator(Post.objects.order_by("id"), 4)
+
+        assert paginator.count == 6
+        assert not paginator.is_estimated
+        with pytest.raises(EmptyPage):
+            paginator.page(3)
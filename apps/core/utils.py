@@ -7,10 +7,11 @@ import hashlib
 import uuid
 from typing import Any, Dict, Optional
 
-from django.core.paginator import Paginator
-from django.http import JsonResponse
 from django.utils import timezone
 
+from .encoders import FastJsonResponse
+from .pagination import EstimatedCountPaginator
+
 
 def generate_unique_id() -> str:
     """
@@ -31,7 +32,7 @@ def create_response(
     message: str = "",
     data: Optional[Dict[str, Any]] = None,
     status_code: int = 200,
-) -> JsonResponse:
+) -> FastJsonResponse:
     """
     표준 API 응답 생성
     """
@@ -44,12 +45,12 @@ def create_response(
     if data is not None:
         response_data["data"] = data
 
-    return JsonResponse(response_data, status=status_code)
+    return FastJsonResponse(response_data, status=status_code)
 
 
 def create_error_response(
     message: str, error_code: Optional[str] = None, status_code: int = 400
-) -> JsonResponse:
+) -> FastJsonResponse:
     """
     에러 응답 생성
     """
@@ -62,14 +63,14 @@ def create_error_response(
     if error_code:
         response_data["error_code"] = error_code
 
-    return JsonResponse(response_data, status=status_code)
+    return FastJsonResponse(response_data, status=status_code)
 
 
 def paginate_queryset(queryset, page_number: int, page_size: int = 20):
     """
     쿼리셋 페이지네이션
     """
-    paginator = Paginator(queryset, page_size)
+    paginator = EstimatedCountPaginator(queryset, page_size)
     page = paginator.get_page(page_number)
 
     return {
@@ -78,6 +79,7 @@ def paginate_queryset(queryset, page_number: int, page_size: int = 20):
             "current_page": page.number,
             "total_pages": paginator.num_pages,
             "total_items": paginator.count,
+            "total_items_estimated": paginator.is_estimated,
             "page_size": page_size,
             "has_next": page.has_next(),
             "has_previous": page.has_previous(),
@@ -3,8 +3,15 @@ Posts 앱 Admin 설정
 """
 
 from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+
+from apps.core.pagination import EstimatedCountPaginator
 
 from .models import Category, Comment, Post, PostLike, Tag
+from .search import search_posts
+
+User = get_user_model()
 
 
 @admin.register(Post)
@@ -22,7 +29,11 @@ class PostAdmin(admin.ModelAdmin):
         "created_at",
     )
     list_filter = ("status", "category", "created_at", "published_at")
+    # 검색은 get_search_results 에서 전문 검색 인덱스로 처리 (검색창 표시용)
     search_fields = ("title", "content", "author__email", "author__username")
+    search_help_text = (
+        "제목/본문 또는 작성자 사용자명 검색, 이메일을 입력하면 작성자로 검색"
+    )
     ordering = ("-created_at",)
     filter_horizontal = ("tags",)
 
@@ -35,6 +46,30 @@ class PostAdmin(admin.ModelAdmin):
     )
 
     readonly_fields = ("view_count", "like_count", "comment_count")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        제목/본문은 search_vector GIN 인덱스로, 이메일은 작성자 일치로 검색
+        사용자명이 일치하는 작성자가 있으면 그 작성자의 게시글도 포함
+        """
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        if "@" in search_term:
+            return queryset.filter(author__email__iexact=search_term), False
+        matches = search_posts(queryset, search_term)
+        author_ids = list(
+            User.objects.filter(username__iexact=search_term).values_list(
+                "pk", flat=True
+            )
+        )
+        if author_ids:
+            matches = queryset.filter(
+                Q(pk__in=matches.values("pk")) | Q(author_id__in=author_ids)
+            )
+        return matches, False
 
 
 @admin.register(Category)
@@ -82,6 +117,8 @@ class PostLikeAdmin(admin.ModelAdmin):
     list_filter = ("created_at",)
     search_fields = ("post__title", "user__email", "user__username")
     ordering = ("-created_at",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Comment)
@@ -101,6 +138,8 @@ class CommentAdmin(admin.ModelAdmin):
     list_filter = ("is_active", "created_at")
     search_fields = ("content", "author__email", "author__username", "post__title")
     ordering = ("-created_at",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     def content_preview(self, obj):
         """댓글 내용 미리보기"""
@@ -0,0 +1,412 @@
+"""
+벤치마크용 합성 데이터
+사용자/카테고리/태그/게시글/좋아요/댓글(답글 체인 포함)을 대량으로 만든다.
+
+- 같은 시드와 빈 DB 에서는 항상 같은 데이터 (id 구간을 미리 확보해 참조를 직접 채움)
+- PostgreSQL 은 COPY, 그 밖의 DB 는 bulk_create 로 적재 (bulk_create 는 생성일시가 현재 시각)
+- 게시글별 좋아요/댓글 수와 작성자별 게시글 수는 Zipf 분포 (소수의 인기 게시글에 몰림)
+- 게시글의 좋아요/댓글 수, 댓글의 경로/깊이/답글 수는 적재할 때 함께 채운다.
+  (시그널과 save() 를 거치지 않으므로 태그 사용 횟수는 마지막에 재계산)
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.db.models import Max
+from django.utils import timezone
+
+from .counters import reconcile_tag_usage_counts
+from .models import (
+    Category,
+    Comment,
+    Post,
+    PostLike,
+    PostStatus,
+    Tag,
+    encode_comment_path_segment,
+)
+
+DEFAULT_BATCH_SIZE = 50000
+# 답글 체인의 최대 깊이
+MAX_REPLY_DEPTH = 6
+PUBLISHED_RATIO = 0.9
+BENCHMARK_PASSWORD = "benchmark1234"
+
+User = get_user_model()
+
+
+def zipf_weights(size: int, exponent: float) -> List[float]:
+    """
+    순위 1..size 의 Zipf 가중치
+    """
+    return [1 / rank**exponent for rank in range(1, size + 1)]
+
+
+def allocate_zipf(
+    total: int,
+    size: int,
+    exponent: float,
+    rng: random.Random,
+    cap: Optional[int] = None,
+) -> List[int]:
+    """
+    total 개를 size 칸에 Zipf 비율로 나눈 칸별 개수 (순위는 무작위로 섞음)
+    cap 을 주면 한 칸에 cap 개까지만 담는다.
+    """
+    if size <= 0:
+        return []
+    weights = zipf_weights(size, exponent)
+    scale = total / sum(weights)
+    counts = [int(weight * scale) for weight in weights]
+    if cap is not None:
+        counts = [min(count, cap) for count in counts]
+
+    remainder = total - sum(counts)
+    while remainder > 0:
+        added = 0
+        for index in range(size):
+            if remainder <= 0:
+                break
+            if cap is None or counts[index] < cap:
+                counts[index] += 1
+                remainder -= 1
+                added += 1
+        if not added:
+            break
+    rng.shuffle(counts)
+    return counts
+
+
+def reserve_ids(model, count: int) -> range:
+    """
+    model 의 id 를 count 개 연속으로 확보
+    PostgreSQL 은 시퀀스를 건너뛰어 두므로 다른 쓰기가 없는 DB 에서 실행해야 한다.
+    """
+    if count <= 0:
+        return range(0)
+    if connection.vendor == "postgresql":
+        table = model._meta.db_table
+        column = model._meta.pk.column
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, %s))", [table, column]
+            )
+            start = cursor.fetchone()[0]
+            cursor.execute(
+                "SELECT setval(pg_get_serial_sequence(%s, %s), %s)",
+                [table, column, start + count - 1],
+            )
+    else:
+        start = (model.objects.aggregate(max_id=Max("pk"))["max_id"] or 0) + 1
+    return range(start, start + count)
+
+
+def _batched(objects: Iterable, size: int) -> Iterator[list]:
+    batch = []
+    for obj in objects:
+        batch.append(obj)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _copy_objects(model, objects: Sequence):
+    # 행마다 connection 프록시를 거치지 않도록 실제 연결 객체를 한 번만 꺼냄
+    db = connections[DEFAULT_DB_ALIAS]
+    fields = [
+        (field.attname, field.get_db_prep_save) for field in model._meta.concrete_fields
+    ]
+    columns = ", ".join(
+        db.ops.quote_name(field.column) for field in model._meta.concrete_fields
+    )
+    sql = f"COPY {db.ops.quote_name(model._meta.db_table)} ({columns}) FROM STDIN"
+    with db.cursor() as cursor:
+        with cursor.cursor.copy(sql) as copy:
+            for obj in objects:
+                copy.write_row(
+                    [prepare(getattr(obj, attname), db) for attname, prepare in fields]
+                )
+
+
+def write_objects(
+    model,
+    objects: Iterable,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[str, int], None]] = None,
+) -> int:
+    """
+    id 가 채워진 모델 인스턴스를 배치로 적재, 적재한 행 수를 반환
+    """
+    written = 0
+    for batch in _batched(objects, batch_size):
+        if connection.vendor == "postgresql":
+            _copy_objects(model, batch)
+        else:
+            model.objects.bulk_create(batch)
+        written += len(batch)
+        if progress:
+            progress(model._meta.db_table, written)
+    return written
+
+
+class BenchmarkDataSeeder:
+    """
+    벤치마크 데이터 생성기
+    """
+
+    def __init__(
+        self,
+        users: int,
+        posts: int,
+        likes: int,
+        comments: int,
+        tags: int,
+        categories: int = 10,
+        days: int = 90,
+        zipf_exponent: float = 1.1,
+        reply_ratio: float = 0.4,
+        seed: int = 42,
+        prefix: str = "bench",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress: Optional[Callable[[str, int], None]] = None,
+    ):
+        self.counts = {
+            "users": users,
+            "posts": posts,
+            "likes": likes,
+            "comments": comments,
+            "tags": tags,
+            "categories": categories,
+        }
+        self.zipf_exponent = zipf_exponent
+        self.reply_ratio = reply_ratio
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.progress = progress
+        self.rng = random.Random(seed)
+        self.now = timezone.now()
+        self.start = self.now - timedelta(days=days)
+        self.span = (self.now - self.start).total_seconds()
+        self.timings: Dict[str, float] = {}
+
+    def exists(self) -> bool:
+        return User.objects.filter(username__startswith=f"{self.prefix}_").exists()
+
+    def seed(self) -> Dict[str, int]:
+        """
+        전체 데이터 생성, 테이블별 적재한 행 수를 반환
+        """
+        written = {}
+        for name, step in (
+            ("users", self.seed_users),
+            ("categories", self.seed_categories),
+            ("tags", self.seed_tags),
+            ("posts", self.seed_posts),
+            ("post_tags", self.seed_post_tags),
+            ("likes", self.seed_likes),
+            ("comments", self.seed_comments),
+        ):
+            started = time.perf_counter()
+            written[name] = step()
+            self.timings[name] = time.perf_counter() - started
+
+        reconcile_tag_usage_counts()
+        if connection.vendor == "postgresql":
+            # 적재 직후의 통계로 실행 계획이 정해지도록
+            models = (User, Category, Tag, Post, Post.tags.through, PostLike, Comment)
+            tables = ", ".join(
+                connection.ops.quote_name(model._meta.db_table) for model in models
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {tables}")
+        return written
+
+    def _random_time(self, after: datetime) -> datetime:
+        remaining = (self.now - after).total_seconds()
+        return after + timedelta(seconds=self.rng.random() * remaining)
+
+    def seed_users(self) -> int:
+        self.user_ids = reserve_ids(User, self.counts["users"])
+        password = make_password(BENCHMARK_PASSWORD)
+
+        def generate():
+            for user_id in self.user_ids:
+                joined = self.start + timedelta(seconds=self.rng.random() * self.span)
+                yield User(
+                    id=user_id,
+                    username=f"{self.prefix}_{user_id}",
+                    email=f"{self.prefix}_{user_id}@example.com",
+                    password=password,
+                    nickname=f"사용자{user_id}",
+                    date_joined=joined,
+                    created_at=joined,
+                    updated_at=joined,
+                )
+
+        return write_objects(User, generate(), self.batch_size, self.progress)
+
+    def seed_categories(self) -> int:
+        self.category_ids = reserve_ids(Category, self.counts["categories"])
+        categories = [
+            Category(
+                id=category_id,
+                name=f"{self.prefix} 카테고리 {category_id}",
+                slug=f"{self.prefix}-category-{category_id}",
+                order=index,
+                created_at=self.start,
+                updated_at=self.start,
+            )
+            for index, category_id in enumerate(self.category_ids)
+        ]
+        return write_objects(Category, categories, self.batch_size, self.progress)
+
+    def seed_tags(self) -> int:
+        self.tag_ids = reserve_ids(Tag, self.counts["tags"])
+        tags = [
+            Tag(
+                id=tag_id,
+                name=f"{self.prefix}태그{tag_id}",
+                slug=f"{self.prefix}-tag-{tag_id}",
+                created_at=self.start,
+                updated_at=self.start,
+            )
+            for tag_id in self.tag_ids
+        ]
+        return write_objects(Tag, tags, self.batch_size, self.progress)
+
+    def seed_posts(self) -> int:
+        count = self.counts["posts"]
+        self.post_ids = reserve_ids(Post, count)
+        self.like_counts = allocate_zipf(
+            self.counts["likes"],
+            count,
+            self.zipf_exponent,
+            self.rng,
+            cap=len(self.user_ids),
+        )
+        self.comment_counts = allocate_zipf(
+            self.counts["comments"], count, self.zipf_exponent, self.rng
+        )
+        # 작성자도 Zipf (소수의 사용자가 많은 글을 씀)
+        author_weights = zipf_weights(len(self.user_ids), self.zipf_exponent)
+        authors = self.rng.choices(self.user_ids, weights=author_weights, k=count)
+        # id 순서 = 작성 순서
+        offsets = sorted(self.rng.random() * self.span for _ in range(count))
+        self.post_times = [self.start + timedelta(seconds=offset) for offset in offsets]
+
+        def generate():
+            categories = list(self.category_ids) or [None]
+            for index, post_id in enumerate(self.post_ids):
+                created_at = self.post_times[index]
+                published = self.rng.random() < PUBLISHED_RATIO
+                yield Post(
+                    id=post_id,
+                    title=f"벤치마크 게시글 {post_id}",
+                    content=f"벤치마크 게시글 {post_id} 의 본문입니다. " * 20,
+                    summary=f"벤치마크 게시글 {post_id} 요약",
+                    author_id=authors[index],
+                    category_id=self.rng.choice(categories),
+                    status=PostStatus.PUBLISHED if published else PostStatus.DRAFT,
+                    published_at=created_at if published else None,
+                    like_count=self.like_counts[index],
+                    comment_count=self.comment_counts[index],
+                    view_count=self.like_counts[index] * 10 + self.rng.randrange(100),
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+
+        return write_objects(Post, generate(), self.batch_size, self.progress)
+
+    def seed_post_tags(self) -> int:
+        through = Post.tags.through
+        if not self.tag_ids:
+            return 0
+        tag_weights = zipf_weights(len(self.tag_ids), self.zipf_exponent)
+        assignments = []
+        for post_id in self.post_ids:
+            picked = self.rng.choices(self.tag_ids, weights=tag_weights, k=3)
+            for tag_id in dict.fromkeys(picked[: self.rng.randrange(4)]):
+                assignments.append((post_id, tag_id))
+        ids = reserve_ids(through, len(assignments))
+        rows = (
+            through(id=row_id, post_id=post_id, tag_id=tag_id)
+            for row_id, (post_id, tag_id) in zip(ids, assignments)
+        )
+        return write_objects(through, rows, self.batch_size, self.progress)
+
+    def seed_likes(self) -> int:
+        ids = iter(reserve_ids(PostLike, sum(self.like_counts)))
+
+        def generate():
+            for index, post_id in enumerate(self.post_ids):
+                count = self.like_counts[index]
+                if not count:
+                    continue
+                for user_id in self.rng.sample(self.user_ids, count):
+                    yield PostLike(
+                        id=next(ids),
+                        post_id=post_id,
+                        user_id=user_id,
+                        created_at=self._random_time(self.post_times[index]),
+                    )
+
+        return write_objects(PostLike, generate(), self.batch_size, self.progress)
+
+    def seed_comments(self) -> int:
+        ids = iter(reserve_ids(Comment, sum(self.comment_counts)))
+
+        def generate():
+            for index, post_id in enumerate(self.post_ids):
+                count = self.comment_counts[index]
+                if count:
+                    yield from self._build_thread(
+                        post_id, self.post_times[index], count, ids
+                    )
+
+        return write_objects(Comment, generate(), self.batch_size, self.progress)
+
+    def _build_thread(
+        self, post_id: int, post_time: datetime, count: int, ids: Iterator[int]
+    ) -> List[Comment]:
+        """
+        게시글 하나의 댓글들 (reply_ratio 확률로 직전 댓글이나 앞선 댓글에 답글)
+        """
+        remaining = (self.now - post_time).total_seconds()
+        offsets = sorted(self.rng.random() * remaining for _ in range(count))
+        comments: List[Comment] = []
+        for offset in offsets:
+            comment_id = next(ids)
+            created_at = post_time + timedelta(seconds=offset)
+            parent = None
+            if comments and self.rng.random() < self.reply_ratio:
+                # 절반은 직전 댓글에 이어 답글 체인을 만들고, 절반은 앞선 댓글 아무 곳에
+                parent = (
+                    comments[-1]
+                    if self.rng.random() < 0.5
+                    else self.rng.choice(comments)
+                )
+                if parent.depth >= MAX_REPLY_DEPTH:
+                    parent = None
+            segment = encode_comment_path_segment(comment_id)
+            comment = Comment(
+                id=comment_id,
+                post_id=post_id,
+                author_id=self.rng.choice(self.user_ids),
+                content=f"벤치마크 댓글 {comment_id}",
+                parent_id=parent.id if parent else None,
+                path=(parent.path if parent else "") + segment,
+                depth=parent.depth + 1 if parent else 0,
+                created_at=created_at,
+                updated_at=created_at,
+            )
+            if parent:
+                parent.reply_count += 1
+            comments.append(comment)
+        return comments
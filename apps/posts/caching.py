@@ -0,0 +1,54 @@
+"""
+게시글 직렬화 결과 캐시와 게시글/댓글 ETag 세대 토큰
+"""
+
+from typing import Iterable, Optional
+
+from django.conf import settings
+
+from apps.core.cache import RepresentationCache
+from apps.core.conditional import bump_generations
+
+# 목록 응답 중 캐시하지 않고 매번 다시 계산하는 필드 (카운터, 사용자별 좋아요 여부)
+POST_VOLATILE_FIELDS = ("like_count", "comment_count", "is_liked")
+
+post_representation_cache = RepresentationCache(
+    "posts:repr",
+    timeout=getattr(settings, "POST_REPRESENTATION_CACHE_TIMEOUT", 3600),
+)
+
+
+def bump_post_versions(post_ids: Iterable[int], chunk_size: int = 1000):
+    """
+    게시글 직렬화 캐시와 ETag 무효화 (chunk_size 단위로 버전 갱신)
+    """
+    chunk = []
+    for post_id in post_ids:
+        chunk.append(post_id)
+        if len(chunk) >= chunk_size:
+            post_representation_cache.bump(chunk)
+            bump_post_etags(chunk)
+            chunk = []
+    if chunk:
+        post_representation_cache.bump(chunk)
+        bump_post_etags(chunk)
+
+
+def bump_post_etags(post_ids: Iterable[int]):
+    """
+    게시글 목록과 각 게시글 상세의 ETag 세대 갱신
+    (좋아요/댓글 수처럼 직렬화 캐시에 넣지 않는 값이 바뀔 때도 호출)
+    """
+    bump_generations(["posts:list", *(f"posts:{post_id}" for post_id in post_ids)])
+
+
+def bump_comment_etags(post_id: int, comment_ids: Iterable[Optional[int]]):
+    """
+    게시글의 댓글 목록과 각 댓글 상세의 ETag 세대 갱신
+    """
+    bump_generations(
+        [
+            f"comments:post:{post_id}",
+            *(f"comments:{comment_id}" for comment_id in comment_ids if comment_id),
+        ]
+    )
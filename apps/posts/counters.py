@@ -0,0 +1,295 @@
+"""
+게시글 카운터
+좋아요 토글은 한 번의 왕복으로 처리하고, 증감분은 샤드 행에 나누어 기록한 뒤
+주기적으로 posts.like_count 에 합산한다. 조회 시에는 컬럼 값과 샤드 증감분을 합친다.
+
+댓글 수(posts.comment_count, 활성 댓글)와 태그 사용 횟수(tags.usage_count)는
+변경이 일어난 트랜잭션 안에서 F() 로 바로 증감하고, 어긋난 값은 재계산 명령어로 바로잡는다.
+"""
+
+from typing import Dict, Iterable, Tuple
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from .caching import bump_post_etags
+from .like_filter import add_to_like_filter
+from .like_status import invalidate_like_status
+from .models import Comment, Post, PostLike, PostLikeCounterShard, Tag
+
+DEFAULT_LIKE_COUNTER_SHARDS = 8
+
+TOGGLE_LIKE_SQL = """
+WITH removed AS (
+    DELETE FROM post_likes
+    WHERE post_id = %(post_id)s AND user_id = %(user_id)s
+    RETURNING id
+), added AS (
+    INSERT INTO post_likes (post_id, user_id, created_at)
+    SELECT %(post_id)s, %(user_id)s, NOW()
+    WHERE NOT EXISTS (SELECT 1 FROM removed)
+    ON CONFLICT (post_id, user_id) DO NOTHING
+    RETURNING id
+), change AS (
+    SELECT (SELECT COUNT(*) FROM added) - (SELECT COUNT(*) FROM removed) AS delta
+), shard AS (
+    INSERT INTO post_like_counter_shards (post_id, shard, delta)
+    SELECT %(post_id)s, %(shard)s, change.delta FROM change WHERE change.delta <> 0
+    ON CONFLICT (post_id, shard)
+    DO UPDATE SET delta = post_like_counter_shards.delta + EXCLUDED.delta
+    RETURNING delta
+)
+SELECT
+    NOT EXISTS (SELECT 1 FROM removed) AS is_liked,
+    posts.like_count
+        + COALESCE(
+            (SELECT SUM(s.delta) FROM post_like_counter_shards AS s
+             WHERE s.post_id = %(post_id)s),
+            0
+        )
+        + (SELECT delta FROM change) AS like_count
+FROM posts
+WHERE posts.id = %(post_id)s
+"""
+
+FLUSH_SHARDS_SQL = """
+WITH drained AS (
+    DELETE FROM post_like_counter_shards
+    RETURNING post_id, delta
+), totals AS (
+    SELECT post_id, SUM(delta) AS delta FROM drained GROUP BY post_id
+)
+UPDATE posts
+SET like_count = GREATEST(posts.like_count + totals.delta, 0)
+FROM totals
+WHERE posts.id = totals.post_id
+"""
+
+
+def get_like_counter_shards() -> int:
+    """
+    좋아요 수 샤드 개수
+    """
+    return max(
+        1, getattr(settings, "POST_LIKE_COUNTER_SHARDS", DEFAULT_LIKE_COUNTER_SHARDS)
+    )
+
+
+def get_shard_for_user(user_id: int) -> int:
+    """
+    사용자별 샤드 번호 (동시 요청이 서로 다른 행으로 흩어지도록 사용자 ID 기준 분배)
+    """
+    return user_id % get_like_counter_shards()
+
+
+def toggle_post_like(post_id: int, user_id: int) -> Tuple[bool, int]:
+    """
+    게시글 좋아요 토글
+    (좋아요 여부, 반영된 좋아요 수)를 반환
+    """
+    if connection.vendor == "postgresql":
+        is_liked, like_count = _toggle_post_like_postgresql(post_id, user_id)
+    else:
+        is_liked, like_count = _toggle_post_like_generic(post_id, user_id)
+    # 필터에 먼저 더한 뒤 캐시를 지운다. (자동 커밋이면 on_commit 이 바로 실행되므로
+    # 순서가 바뀌면 그 사이의 조회가 필터에 걸러져 좋아요가 빠진 상태로 다시 캐시됨)
+    if is_liked:
+        add_to_like_filter(user_id, post_id)
+    # 커밋 후 삭제 (트랜잭션 안에서 지우면 커밋 전 상태로 다시 채워질 수 있음)
+    transaction.on_commit(lambda: invalidate_like_status(user_id, post_id))
+    bump_post_etags([post_id])
+    return is_liked, like_count
+
+
+def _toggle_post_like_postgresql(post_id: int, user_id: int) -> Tuple[bool, int]:
+    """
+    좋아요 행 삭제/추가와 샤드 증감을 하나의 쿼리로 처리
+    """
+    params = {
+        "post_id": post_id,
+        "user_id": user_id,
+        "shard": get_shard_for_user(user_id),
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(TOGGLE_LIKE_SQL, params)
+        is_liked, like_count = cursor.fetchone()
+    return bool(is_liked), max(int(like_count), 0)
+
+
+def _toggle_post_like_generic(post_id: int, user_id: int) -> Tuple[bool, int]:
+    """
+    PostgreSQL 이외의 DB 용 토글 (트랜잭션 내 ORM 처리)
+    """
+    with transaction.atomic():
+        deleted, _ = PostLike.objects.filter(post_id=post_id, user_id=user_id).delete()
+        if deleted:
+            is_liked, delta = False, -1
+        else:
+            _, created = PostLike.objects.get_or_create(
+                post_id=post_id, user_id=user_id
+            )
+            is_liked, delta = True, 1 if created else 0
+
+        if delta:
+            shard = get_shard_for_user(user_id)
+            updated = PostLikeCounterShard.objects.filter(
+                post_id=post_id, shard=shard
+            ).update(delta=F("delta") + delta)
+            if not updated:
+                PostLikeCounterShard.objects.create(
+                    post_id=post_id, shard=shard, delta=delta
+                )
+
+    return is_liked, get_like_counts([post_id]).get(post_id, 0)
+
+
+def get_like_counts(post_ids: Iterable[int]) -> Dict[int, int]:
+    """
+    게시글별 좋아요 수 (컬럼 값 + 아직 합산되지 않은 샤드 증감분)
+    """
+    queryset = annotate_like_counts(Post.objects.filter(id__in=list(post_ids)))
+    return {
+        post_id: max(like_count + pending, 0)
+        for post_id, like_count, pending in queryset.values_list(
+            "id", "like_count", "pending_like_delta"
+        )
+    }
+
+
+def annotate_like_counts(queryset):
+    """
+    쿼리셋에 합산되지 않은 샤드 증감분(pending_like_delta) 주석 추가
+    """
+    pending = (
+        PostLikeCounterShard.objects.filter(post_id=OuterRef("pk"))
+        .values("post_id")
+        .annotate(total=Sum("delta"))
+        .values("total")
+    )
+    return queryset.annotate(
+        pending_like_delta=Coalesce(
+            Subquery(pending, output_field=IntegerField()), Value(0)
+        )
+    )
+
+
+def get_merged_like_count(post: Post) -> int:
+    """
+    주석이 달린 게시글 인스턴스의 좋아요 수
+    """
+    return max(post.like_count + getattr(post, "pending_like_delta", 0), 0)
+
+
+def flush_like_counter_shards() -> int:
+    """
+    샤드 증감분을 posts.like_count 에 합산하고 샤드 행을 비움
+    갱신된 게시글 수를 반환
+    """
+    if connection.vendor == "postgresql":
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(FLUSH_SHARDS_SQL)
+            return cursor.rowcount
+
+    with transaction.atomic():
+        shards = PostLikeCounterShard.objects.select_for_update()
+        totals = dict(
+            shards.values("post_id")
+            .annotate(total=Sum("delta"))
+            .values_list("post_id", "total")
+        )
+        for post_id, total in totals.items():
+            Post.objects.filter(id=post_id).update(
+                like_count=Greatest(F("like_count") + total, 0)
+            )
+        PostLikeCounterShard.objects.filter(post_id__in=list(totals)).delete()
+    return len(totals)
+
+
+def reconcile_like_counts(start_id: int, end_id: int) -> int:
+    """
+    post_likes 기준으로 id 구간 [start_id, end_id) 게시글의 좋아요 수 재계산
+    갱신된 게시글 수를 반환
+    """
+    like_totals = (
+        PostLike.objects.filter(post_id=OuterRef("pk"))
+        .values("post_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    with transaction.atomic():
+        posts = Post.objects.filter(id__gte=start_id, id__lt=end_id)
+        # 재계산 결과에 이미 반영될 증감분이므로 구간의 샤드를 먼저 비움
+        PostLikeCounterShard.objects.filter(
+            post_id__gte=start_id, post_id__lt=end_id
+        ).delete()
+        bump_post_etags(range(start_id, end_id))
+        return posts.update(
+            like_count=Coalesce(
+                Subquery(like_totals, output_field=IntegerField()), Value(0)
+            )
+        )
+
+
+def adjust_comment_count(post_id: int, delta: int):
+    """
+    게시글 댓글 수 증감 (0 아래로 내려가지 않음)
+    """
+    if delta > 0:
+        Post.objects.filter(pk=post_id).update(comment_count=F("comment_count") + delta)
+    elif delta < 0:
+        Post.objects.filter(pk=post_id).update(
+            comment_count=Greatest(F("comment_count") + delta, 0)
+        )
+    if delta:
+        bump_post_etags([post_id])
+
+
+def adjust_tag_usage_counts(tag_ids: Iterable[int], delta: int):
+    """
+    태그들의 사용 횟수 증감 (0 아래로 내려가지 않음)
+    """
+    tag_ids = list(tag_ids)
+    if not tag_ids or not delta:
+        return
+    Tag.objects.filter(pk__in=tag_ids).update(
+        usage_count=Greatest(F("usage_count") + delta, 0)
+    )
+
+
+def reconcile_comment_counts(start_id: int, end_id: int) -> int:
+    """
+    활성 댓글 기준으로 id 구간 [start_id, end_id) 게시글의 댓글 수 재계산
+    갱신된 게시글 수를 반환
+    """
+    comment_totals = (
+        Comment.objects.filter(post_id=OuterRef("pk"), is_active=True)
+        .values("post_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    bump_post_etags(range(start_id, end_id))
+    return Post.objects.filter(id__gte=start_id, id__lt=end_id).update(
+        comment_count=Coalesce(
+            Subquery(comment_totals, output_field=IntegerField()), Value(0)
+        )
+    )
+
+
+def reconcile_tag_usage_counts() -> int:
+    """
+    게시글-태그 연결 기준으로 모든 태그의 사용 횟수 재계산
+    갱신된 태그 수를 반환
+    """
+    usage_totals = (
+        Post.tags.through.objects.filter(tag_id=OuterRef("pk"))
+        .values("tag_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Tag.objects.update(
+        usage_count=Coalesce(
+            Subquery(usage_totals, output_field=IntegerField()), Value(0)
+        )
+    )
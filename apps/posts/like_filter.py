@@ -0,0 +1,305 @@
+"""
+좋아요 여부 Bloom 필터
+사용자별로 좋아요한 게시글 id 를 Bloom 필터에 담아 두고,
+필터에 없는(확실히 좋아요하지 않은) 게시글은 post_likes 를 조회하지 않는다.
+필터에 있다고 나온 게시글만 DB 로 확인하므로 오탐은 조회 한 번의 비용일 뿐 결과는 정확하다.
+
+- 저장소: Redis 비트맵(posts:like_filter:{user_id}) 또는 post_like_filters.bits
+  (LIKE_FILTER_BACKEND)
+- 크기: 만들 때의 좋아요 수의 두 배를 목표 오탐률(LIKE_FILTER_FALSE_POSITIVE_RATE)로
+  담을 수 있게 정함
+- 해시 함수 개수는 비트 배열 앞의 헤더에 함께 저장하므로 오탐률 설정이 바뀌어도
+  기존 필터는 만들 때의 개수로 조회한다. (헤더가 없는 필터는 다시 만듦)
+- 좋아요가 추가되면 비트를 더하고, 취소는 비트를 지울 수 없으므로
+  rebuild_like_filters 명령어로 주기적으로 다시 만든다.
+- 필터가 없는 사용자는 처음 조회할 때 만든다.
+"""
+
+import hashlib
+import logging
+import math
+from datetime import timedelta
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.redis_client import get_redis_client
+
+from .models import PostLike, PostLikeFilter
+
+logger = logging.getLogger(__name__)
+
+# 필터가 담을 최소 항목 수 (좋아요가 적은 사용자도 추가분을 받을 여유)
+MIN_CAPACITY = 64
+# 빌드 중 추가된 좋아요를 다시 반영할 때 빌드 시작 시각에서 거슬러 올라갈 여유(초)
+CATCH_UP_MARGIN_SECONDS = 5
+# 저장 형식 헤더 (매직 2바이트 + 해시 함수 개수 1바이트), 비트 배열은 그 뒤에 이어짐
+HEADER_MAGIC = b"BF"
+HEADER_SIZE = 3
+
+
+def get_false_positive_rate() -> float:
+    return getattr(settings, "LIKE_FILTER_FALSE_POSITIVE_RATE", 0.01)
+
+
+def get_hash_count() -> int:
+    """
+    새로 만드는 필터의 해시 함수 개수 (목표 오탐률에서 결정, 필터 크기와 무관)
+    """
+    return max(1, round(-math.log2(get_false_positive_rate())))
+
+
+def parse_header(header: bytes) -> Optional[int]:
+    """
+    저장된 값 앞부분의 해시 함수 개수, 헤더가 없으면 None
+    """
+    if len(header) < HEADER_SIZE or header[:2] != HEADER_MAGIC or not header[2]:
+        return None
+    return header[2]
+
+
+class BloomFilter:
+    """
+    비트 배열 Bloom 필터 (Redis 비트맵과 같은 비트 순서: 각 바이트의 최상위 비트가 0번)
+    """
+
+    def __init__(self, bits: bytearray, hash_count: int):
+        self.bits = bits
+        self.hash_count = hash_count
+
+    @classmethod
+    def for_capacity(cls, capacity: int, false_positive_rate: float) -> "BloomFilter":
+        """
+        capacity 개를 목표 오탐률로 담을 수 있는 빈 필터
+        """
+        size = math.ceil(
+            -max(capacity, MIN_CAPACITY)
+            * math.log(false_positive_rate)
+            / math.log(2) ** 2
+        )
+        return cls(bytearray(math.ceil(size / 8)), get_hash_count())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional["BloomFilter"]:
+        """
+        저장된 값 -> 필터, 헤더가 없는(이전 형식) 값이면 None
+        """
+        hash_count = parse_header(data)
+        if hash_count is None or len(data) <= HEADER_SIZE:
+            return None
+        return cls(bytearray(data[HEADER_SIZE:]), hash_count)
+
+    def to_bytes(self) -> bytes:
+        return HEADER_MAGIC + bytes([self.hash_count]) + bytes(self.bits)
+
+    @property
+    def size(self) -> int:
+        return len(self.bits) * 8
+
+    def positions(self, item: int) -> List[int]:
+        return get_positions(item, self.size, self.hash_count)
+
+    def add(self, item: int):
+        for position in self.positions(item):
+            self.bits[position // 8] |= 0x80 >> (position % 8)
+
+    def __contains__(self, item: int) -> bool:
+        return all(
+            self.bits[position // 8] & (0x80 >> (position % 8))
+            for position in self.positions(item)
+        )
+
+
+def get_positions(item: int, size: int, hash_count: int) -> List[int]:
+    """
+    항목의 비트 위치 (128비트 해시를 둘로 나눈 double hashing)
+    """
+    digest = hashlib.blake2b(str(item).encode(), digest_size=16).digest()
+    first = int.from_bytes(digest[:8], "big")
+    second = int.from_bytes(digest[8:], "big") | 1
+    return [(first + index * second) % size for index in range(hash_count)]
+
+
+class RedisLikeFilterStore:
+    """
+    Redis 비트맵 저장소
+    조회는 GET 한 번, 추가는 헤더와 STRLEN 으로 해시 함수 개수와 크기를 읽은 뒤
+    SETBIT 를 파이프라인으로 보낸다.
+    """
+
+    key_prefix = "posts:like_filter"
+
+    def __init__(self, client):
+        self.client = client
+
+    def key(self, user_id: int) -> str:
+        return f"{self.key_prefix}:{user_id}"
+
+    def load(self, user_id: int) -> Optional[bytes]:
+        return self.client.get(self.key(user_id))
+
+    def save(self, user_id: int, data: bytes):
+        self.client.set(self.key(user_id), data)
+
+    def delete(self, user_id: int):
+        self.client.delete(self.key(user_id))
+
+    def add(self, user_id: int, post_id: int):
+        key = self.key(user_id)
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.getrange(key, 0, HEADER_SIZE - 1)
+        pipeline.strlen(key)
+        header, length = pipeline.execute()
+        hash_count = parse_header(header)
+        size = (length - HEADER_SIZE) * 8
+        if hash_count is None or size <= 0:
+            return
+        offset = HEADER_SIZE * 8
+        for position in get_positions(post_id, size, hash_count):
+            pipeline.setbit(key, offset + position, 1)
+        pipeline.execute()
+
+    def user_ids(self) -> Iterable[int]:
+        prefix_length = len(self.key_prefix) + 1
+        for key in self.client.scan_iter(match=f"{self.key_prefix}:*", count=1000):
+            yield int(key[prefix_length:])
+
+
+class DatabaseLikeFilterStore:
+    """
+    post_like_filters 테이블 저장소
+    추가는 행을 잠그고 비트 배열을 읽어 고쳐 쓴다.
+    """
+
+    def load(self, user_id: int) -> Optional[bytes]:
+        bits = (
+            PostLikeFilter.objects.filter(user_id=user_id)
+            .values_list("bits", flat=True)
+            .first()
+        )
+        return bytes(bits) if bits is not None else None
+
+    def save(self, user_id: int, data: bytes):
+        PostLikeFilter.objects.update_or_create(
+            user_id=user_id, defaults={"bits": data}
+        )
+
+    def delete(self, user_id: int):
+        PostLikeFilter.objects.filter(user_id=user_id).delete()
+
+    def add(self, user_id: int, post_id: int):
+        with transaction.atomic():
+            row = (
+                PostLikeFilter.objects.select_for_update()
+                .filter(user_id=user_id)
+                .first()
+            )
+            bloom = BloomFilter.from_bytes(bytes(row.bits)) if row else None
+            if bloom is None:
+                return
+            bloom.add(post_id)
+            row.bits = bloom.to_bytes()
+            row.save(update_fields=["bits", "updated_at"])
+
+    def user_ids(self) -> Iterable[int]:
+        return PostLikeFilter.objects.values_list("user_id", flat=True).iterator()
+
+
+def get_like_filter_store():
+    """
+    설정(LIKE_FILTER_BACKEND)에 따른 필터 저장소, 사용하지 않으면 None
+    redis 로 설정되어 있어도 클라이언트를 만들 수 없으면 DB 저장소를 사용
+    """
+    backend = getattr(settings, "LIKE_FILTER_BACKEND", "")
+    if backend == "redis":
+        client = get_redis_client()
+        if client is not None:
+            return RedisLikeFilterStore(client)
+        logger.warning("Redis 를 사용할 수 없어 DB 좋아요 필터 저장소를 사용합니다.")
+        return DatabaseLikeFilterStore()
+    if backend == "db":
+        return DatabaseLikeFilterStore()
+    return None
+
+
+def build_like_filter(store, user_id: int) -> BloomFilter:
+    """
+    사용자의 좋아요 전체로 필터를 새로 만들어 저장
+    빌드 중 추가된 좋아요는 저장 후 다시 읽어 더한다. (저장 전에 비트를 더한 경우 유실 방지)
+    """
+    started_at = timezone.now()
+    post_ids = list(
+        PostLike.objects.filter(user_id=user_id).values_list("post_id", flat=True)
+    )
+    bloom = BloomFilter.for_capacity(len(post_ids) * 2, get_false_positive_rate())
+    for post_id in post_ids:
+        bloom.add(post_id)
+    store.save(user_id, bloom.to_bytes())
+
+    caught_up = PostLike.objects.filter(
+        user_id=user_id,
+        created_at__gte=started_at - timedelta(seconds=CATCH_UP_MARGIN_SECONDS),
+    ).values_list("post_id", flat=True)
+    for post_id in caught_up:
+        if post_id not in bloom:
+            bloom.add(post_id)
+            store.add(user_id, post_id)
+    return bloom
+
+
+def filter_possible_likes(user_id: int, post_ids: List[int]) -> List[int]:
+    """
+    post_ids 중 사용자가 좋아요했을 수 있는 게시글 (나머지는 확실히 좋아요하지 않음)
+    필터를 사용하지 않거나 저장소 오류가 나면 post_ids 를 그대로 반환 (DB 로 확인)
+    """
+    store = get_like_filter_store()
+    if store is None or not post_ids:
+        return post_ids
+
+    try:
+        data = store.load(user_id)
+        bloom = BloomFilter.from_bytes(data) if data is not None else None
+        if bloom is None:
+            bloom = build_like_filter(store, user_id)
+    except Exception:
+        logger.exception("좋아요 필터를 읽지 못했습니다. (user %s)", user_id)
+        return post_ids
+    return [post_id for post_id in post_ids if post_id in bloom]
+
+
+def add_to_like_filter(user_id: int, post_id: int):
+    """
+    새 좋아요를 사용자 필터에 추가 (필터가 없으면 다음 조회 때 만들어짐)
+    좋아요는 이미 저장되었으므로 실패해도 예외를 올리지 않고, 이 좋아요가 빠진 필터가
+    남지 않도록 필터를 지워 다음 조회 때 다시 만들게 한다.
+    """
+    store = get_like_filter_store()
+    if store is None:
+        return
+    try:
+        store.add(user_id, post_id)
+    except Exception:
+        logger.exception("좋아요 필터에 추가하지 못했습니다. (user %s)", user_id)
+        try:
+            store.delete(user_id)
+        except Exception:
+            logger.exception("좋아요 필터를 지우지 못했습니다. (user %s)", user_id)
+
+
+def rebuild_like_filters(user_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    필터를 다시 만들어 취소된 좋아요를 털어냄, 다시 만든 필터 수를 반환
+    user_ids 를 주지 않으면 이미 필터가 있는 모든 사용자
+    """
+    store = get_like_filter_store()
+    if store is None:
+        return 0
+    if user_ids is None:
+        user_ids = list(store.user_ids())
+    rebuilt = 0
+    for user_id in dict.fromkeys(user_ids):
+        build_like_filter(store, user_id)
+        rebuilt += 1
+    return rebuilt
@@ -0,0 +1,98 @@
+"""
+현재 사용자의 게시글 좋아요 여부
+(사용자, 게시글)별 좋아요 여부를 캐시에 두고, 캐시에 없는 게시글만
+post_likes 의 (post_id, user_id) 유니크 인덱스로 한 번에 조회한다.
+좋아요 필터(like_filter)를 쓰면 확실히 좋아요하지 않은 게시글은 조회에서 뺀다.
+항목에는 DB 조회 전에 읽은 사용자별 버전 토큰을 함께 저장하고, 좋아요 토글 시
+버전 토큰을 새로 써서 무효화한다. (조회와 토글이 겹쳐도 이전 상태는 이전 버전으로
+저장되어 적중하지 않음, 계산한 새 상태를 쓰면 동시 토글이 순서가 뒤바뀐 채 남을 수 있음)
+"""
+
+import uuid
+from typing import Iterable, Set
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.metrics import record_cache_lookup
+
+from .like_filter import filter_possible_likes
+from .models import PostLike
+
+CACHE_KEY_PREFIX = "posts:liked"
+
+
+def get_like_status_timeout() -> int:
+    return getattr(settings, "LIKE_STATUS_CACHE_TIMEOUT", 3600)
+
+
+def status_key(user_id: int, post_id: int) -> str:
+    return f"{CACHE_KEY_PREFIX}:{user_id}:{post_id}"
+
+
+def version_key(user_id: int) -> str:
+    return f"{CACHE_KEY_PREFIX}:ver:{user_id}"
+
+
+def new_version() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def get_liked_post_ids(user_id: int, post_ids: Iterable[int]) -> Set[int]:
+    """
+    post_ids 중 사용자가 좋아요한 게시글 id
+    캐시 누락분은 PostLike 한 번의 조회로 채워 캐시에 저장
+    """
+    post_ids = list(dict.fromkeys(post_ids))
+    if not post_ids:
+        return set()
+
+    keys = {status_key(user_id, post_id): post_id for post_id in post_ids}
+    found = cache.get_many([version_key(user_id), *keys])
+    version = found.pop(version_key(user_id), None)
+    if version is None:
+        # 버전 키가 축출되었으면 이전 항목을 신뢰할 수 없으므로 새 버전 발급
+        version = new_version()
+        if not cache.add(version_key(user_id), version, get_like_status_timeout()):
+            version = cache.get(version_key(user_id), version)
+        found = {}
+    found = {
+        key: entry["liked"]
+        for key, entry in found.items()
+        if isinstance(entry, dict) and entry.get("v") == version
+    }
+    liked = {keys[key] for key, value in found.items() if value}
+
+    missing = [
+        post_id for post_id in post_ids if status_key(user_id, post_id) not in found
+    ]
+    record_cache_lookup(CACHE_KEY_PREFIX, len(found), len(missing))
+    if missing:
+        candidates = filter_possible_likes(user_id, missing)
+        fetched = set()
+        if candidates:
+            fetched = set(
+                PostLike.objects.filter(
+                    user_id=user_id, post_id__in=candidates
+                ).values_list("post_id", flat=True)
+            )
+        # 조회 전에 읽은 버전으로 저장 (그 사이 토글되었으면 적중하지 않음)
+        cache.set_many(
+            {
+                status_key(user_id, post_id): {
+                    "v": version,
+                    "liked": post_id in fetched,
+                }
+                for post_id in missing
+            },
+            get_like_status_timeout(),
+        )
+        liked |= fetched
+    return liked
+
+
+def invalidate_like_status(user_id: int, post_id: int):
+    """
+    좋아요 여부 캐시 무효화 (사용자 버전 토큰 갱신, 사용자의 항목 전체가 다시 채워짐)
+    """
+    cache.set(version_key(user_id), new_version(), get_like_status_timeout())
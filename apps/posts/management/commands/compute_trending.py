@@ -0,0 +1,38 @@
+"""
+인기 게시글 계산 명령어
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.posts.trending import compute_trending, store_trending
+
+
+class Command(BaseCommand):
+    help = "최근 발행된 게시글의 시간 감쇠 점수로 카테고리별 인기 게시글 순위를 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 주기마다 반복 실행",
+        )
+        parser.add_argument(
+            "--interval", type=int, default=300, help="반복 실행 주기(초)"
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.monotonic()
+            rankings = compute_trending()
+            stored = store_trending(rankings)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{len(rankings)}개 순위(전체 포함)에 {stored}개 항목을 저장했습니다. "
+                    f"({time.monotonic() - started:.2f}초)"
+                )
+            )
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,51 @@
+"""
+타임라인 fan-out 명령어
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.posts.timeline import FANOUT_QUEUE_BATCH_SIZE, process_fan_out_queue
+
+
+class Command(BaseCommand):
+    help = "fan-out 대기열의 발행된 게시글을 팔로워 타임라인에 추가합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=FANOUT_QUEUE_BATCH_SIZE,
+            help="한 트랜잭션에서 처리할 최대 게시글 수",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 주기마다 반복 실행",
+        )
+        parser.add_argument(
+            "--interval", type=int, default=5, help="반복 실행 주기(초)"
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.monotonic()
+            processed = failed = 0
+            # 대기열이 빌 때까지 (실패만 남으면 다음 주기에 다시 시도)
+            while True:
+                done, errors = process_fan_out_queue(options["batch_size"])
+                processed += done
+                failed += errors
+                if not done:
+                    break
+            if processed or failed or not options["loop"]:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"게시글 {processed}개를 팔로워 타임라인에 추가했습니다. "
+                        f"(실패 {failed}개, {time.monotonic() - started:.2f}초)"
+                    )
+                )
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
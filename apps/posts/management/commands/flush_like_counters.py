@@ -0,0 +1,17 @@
+"""
+좋아요 수 샤드 합산 명령어
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.posts.counters import flush_like_counter_shards
+
+
+class Command(BaseCommand):
+    help = "좋아요 수 샤드 증감분을 posts.like_count 에 합산합니다."
+
+    def handle(self, *args, **options):
+        updated = flush_like_counter_shards()
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 게시글의 좋아요 수를 합산했습니다.")
+        )
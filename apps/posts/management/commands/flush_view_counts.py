@@ -0,0 +1,61 @@
+"""
+조회수 버퍼 반영 명령어
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.posts.view_counter import (
+    collect_lost_increments,
+    flush_post_view_counts,
+    get_flush_interval,
+    get_lost_increments,
+)
+
+
+class Command(BaseCommand):
+    help = "캐시에 모인 게시글 조회수 증가분을 posts.view_count 에 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 반영 주기마다 반복 실행",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=None,
+            help="반복 실행 주기(초), 기본값은 POST_VIEW_COUNT_FLUSH_INTERVAL",
+        )
+
+    def handle(self, *args, **options):
+        interval = options["interval"] or get_flush_interval()
+
+        while True:
+            self.flush_once()
+            if not options["loop"]:
+                break
+            time.sleep(interval)
+
+    def flush_once(self):
+        if getattr(settings, "POST_VIEW_COUNT_BUFFER", "cache") == "local":
+            # 프로세스 메모리 버퍼는 각 웹 프로세스가 직접 반영하므로 유실량만 집계
+            lost = collect_lost_increments()
+            self.stdout.write(f"유실 조회수 {lost}건 (누적 {get_lost_increments()}건)")
+            return
+
+        result = flush_post_view_counts()
+        if result is None:
+            self.stdout.write("다른 프로세스가 반영 중입니다.")
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result['posts']}개 게시글에 조회수 {result['increments']}건을 "
+                f"반영했습니다. (다시 시도 {result['requeued']}건, "
+                f"유실 {result['lost']}건, 누적 유실 {get_lost_increments()}건)"
+            )
+        )
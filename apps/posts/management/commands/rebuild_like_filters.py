@@ -0,0 +1,30 @@
+"""
+좋아요 필터 재생성 명령어
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.posts.like_filter import get_like_filter_store, rebuild_like_filters
+
+
+class Command(BaseCommand):
+    help = "사용자별 좋아요 Bloom 필터를 다시 만들어 취소된 좋아요를 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="다시 만들 사용자 id (여러 번 지정 가능, 생략 시 필터가 있는 모든 사용자)",
+        )
+
+    def handle(self, *args, **options):
+        if get_like_filter_store() is None:
+            self.stdout.write("LIKE_FILTER_BACKEND 가 설정되지 않아 건너뜁니다.")
+            return
+
+        rebuilt = rebuild_like_filters(options["user_ids"])
+        self.stdout.write(
+            self.style.SUCCESS(f"{rebuilt}명의 좋아요 필터를 다시 만들었습니다.")
+        )
@@ -0,0 +1,37 @@
+"""
+게시글 검색 벡터 재생성 명령어
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.posts.models import Post
+from apps.posts.search import build_search_vector
+
+
+class Command(BaseCommand):
+    help = "게시글 제목/본문으로 검색 벡터(posts.search_vector)를 다시 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="검색 벡터가 없는 게시글만 생성",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="한 번에 읽을 게시글 수"
+        )
+
+    def handle(self, *args, **options):
+        queryset = Post.objects.only("id", "title", "content").order_by("id")
+        if options["missing_only"]:
+            queryset = queryset.filter(search_vector__isnull=True)
+
+        updated = 0
+        for post in queryset.iterator(chunk_size=options["batch_size"]):
+            updated += Post.objects.filter(pk=post.pk).update(
+                search_vector=build_search_vector(post.title, post.content)
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 게시글의 검색 벡터를 생성했습니다.")
+        )
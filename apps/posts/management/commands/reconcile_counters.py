@@ -0,0 +1,39 @@
+"""
+댓글 수/태그 사용 횟수 재계산 명령어
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max, Min
+
+from apps.posts.counters import reconcile_comment_counts, reconcile_tag_usage_counts
+from apps.posts.models import Post
+
+
+class Command(BaseCommand):
+    help = "댓글과 게시글-태그 연결을 기준으로 댓글 수와 태그 사용 횟수를 일괄 재계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="한 번의 UPDATE 로 처리할 게시글 id 구간 크기",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        updated = 0
+        bounds = Post.objects.aggregate(min_id=Min("id"), max_id=Max("id"))
+        if bounds["min_id"] is not None:
+            start_id = bounds["min_id"]
+            while start_id <= bounds["max_id"]:
+                end_id = start_id + batch_size
+                updated += reconcile_comment_counts(start_id, end_id)
+                start_id = end_id
+
+        tags = reconcile_tag_usage_counts()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"게시글 {updated}개의 댓글 수와 태그 {tags}개의 사용 횟수를 재계산했습니다."
+            )
+        )
@@ -0,0 +1,39 @@
+"""
+좋아요 수 재계산 명령어
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max, Min
+
+from apps.posts.counters import reconcile_like_counts
+from apps.posts.models import Post
+
+
+class Command(BaseCommand):
+    help = "post_likes 를 기준으로 게시글 좋아요 수를 일괄 재계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="한 번의 UPDATE 로 처리할 게시글 id 구간 크기",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        bounds = Post.objects.aggregate(min_id=Min("id"), max_id=Max("id"))
+        if bounds["min_id"] is None:
+            self.stdout.write("재계산할 게시글이 없습니다.")
+            return
+
+        updated = 0
+        start_id = bounds["min_id"]
+        while start_id <= bounds["max_id"]:
+            end_id = start_id + batch_size
+            updated += reconcile_like_counts(start_id, end_id)
+            start_id = end_id
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 게시글의 좋아요 수를 재계산했습니다.")
+        )
@@ -0,0 +1,46 @@
+"""
+일별 통계 롤업 명령어
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.posts.rollups import DEFAULT_BATCH_SIZE, rollup_daily_stats
+
+
+class Command(BaseCommand):
+    help = "마지막 처리 위치 이후의 좋아요/댓글을 게시글/작성자 일별 통계에 집계합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="한 트랜잭션에서 집계할 최대 행 수",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 주기마다 반복 실행",
+        )
+        parser.add_argument(
+            "--interval", type=int, default=60, help="반복 실행 주기(초)"
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.monotonic()
+            processed = rollup_daily_stats(options["batch_size"])
+            summary = ", ".join(
+                f"{name} {count}건" for name, count in processed.items()
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"일별 통계를 집계했습니다: {summary} "
+                    f"({time.monotonic() - started:.2f}초)"
+                )
+            )
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,179 @@
+"""
+API 벤치마크 실행 명령어
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from apps.core.benchmarks import (
+    PERCENTILES,
+    build_results,
+    compare_results,
+    load_results,
+    run_endpoint,
+    save_results,
+)
+from apps.posts.models import Comment, Post, PostLike, PostStatus, Tag
+
+User = get_user_model()
+
+# (이름, 경로, 로그인 필요)
+SCENARIOS = (
+    ("posts.list", "/api/v1/posts/", False),
+    ("posts.list.deep_page", "/api/v1/posts/?page=50", False),
+    ("posts.list.auth", "/api/v1/posts/", True),
+    ("posts.retrieve", "/api/v1/posts/{post_id}/", False),
+    ("posts.retrieve.hot", "/api/v1/posts/{hot_post_id}/", False),
+    ("posts.trending", "/api/v1/posts/trending/", False),
+    ("comments.list.hot", "/api/v1/posts/{hot_post_id}/comments/", False),
+    ("comments.thread.hot", "/api/v1/posts/{hot_post_id}/comments/thread/", False),
+    ("users.me", "/api/v1/users/me/", True),
+    ("users.list", "/api/v1/users/", True),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "주요 API 엔드포인트를 테스트 클라이언트로 반복 호출해 "
+        "p50/p95/p99 지연 시간과 요청당 쿼리 수를 JSON 파일로 저장합니다. "
+        "(seed_benchmark_data 로 만든 데이터 기준, DEBUG 와 요청 계측/느린 쿼리 로그는 끄고 측정)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations", type=int, default=100, help="엔드포인트별 측정 요청 수"
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=5, help="측정 전에 버리는 요청 수"
+        )
+        parser.add_argument(
+            "--cold", action="store_true", help="매 요청 전에 캐시를 비움"
+        )
+        parser.add_argument(
+            "--only",
+            action="append",
+            default=[],
+            help="이름이 이 값으로 시작하는 시나리오만 실행 (여러 번 지정 가능)",
+        )
+        parser.add_argument(
+            "--user",
+            help="로그인 시나리오의 사용자 이메일 (기본: 좋아요가 가장 많은 게시글의 작성자)",
+        )
+        parser.add_argument(
+            "--output", default="benchmark-results.json", help="결과 JSON 파일 경로"
+        )
+        parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일 경로")
+
+    def handle(self, *args, **options):
+        scenarios = [
+            scenario
+            for scenario in SCENARIOS
+            if not options["only"]
+            or any(scenario[0].startswith(prefix) for prefix in options["only"])
+        ]
+        if not scenarios:
+            raise CommandError("실행할 시나리오가 없습니다.")
+
+        published = Post.objects.filter(status=PostStatus.PUBLISHED)
+        published_count = published.count()
+        if not published_count:
+            raise CommandError(
+                "게시된 게시글이 없습니다. seed_benchmark_data 를 먼저 실행하세요."
+            )
+        targets = {
+            "post_id": published.order_by("id").values_list("id", flat=True)[
+                published_count // 2
+            ],
+            "hot_post_id": published.order_by("-like_count", "id")
+            .values_list("id", flat=True)
+            .first(),
+        }
+        user = self.get_user(options["user"], targets["hot_post_id"])
+        baseline = load_results(options["compare"]) if options["compare"] else None
+
+        results = []
+        setup_test_environment(debug=False)
+        try:
+            with override_settings(
+                INSTRUMENTATION_SAMPLE_RATE=0.0,
+                QUERY_CHECK_MODE="",
+                SLOW_QUERY_LOG=False,
+            ):
+                anonymous = Client()
+                authenticated = Client()
+                authenticated.force_login(user)
+                for name, path, login in scenarios:
+                    result = run_endpoint(
+                        authenticated if login else anonymous,
+                        name,
+                        path.format(**targets),
+                        options["iterations"],
+                        warmup=options["warmup"],
+                        cold=options["cold"],
+                    )
+                    results.append(result)
+                    self.write_result(result)
+        finally:
+            teardown_test_environment()
+
+        dataset = {
+            "users": User.objects.count(),
+            "posts": Post.objects.count(),
+            "published_posts": published_count,
+            "post_likes": PostLike.objects.count(),
+            "comments": Comment.objects.count(),
+            "tags": Tag.objects.count(),
+        }
+        report = build_results(
+            results,
+            dataset,
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+            cold=options["cold"],
+            targets=targets,
+        )
+        save_results(options["output"], report)
+        self.stdout.write(
+            self.style.SUCCESS(f"결과를 {options['output']} 에 저장했습니다.")
+        )
+        if baseline is not None:
+            self.write_comparison(compare_results(baseline, report))
+
+    def get_user(self, email, hot_post_id):
+        if not email:
+            return Post.objects.get(id=hot_post_id).author
+        try:
+            return User.objects.get(email=email)
+        except User.DoesNotExist:
+            raise CommandError(f"사용자를 찾을 수 없습니다: {email}")
+
+    def write_result(self, result: dict):
+        percentiles = "  ".join(
+            f"p{pct} {result[f'p{pct}_ms']:>8.2f}ms" for pct in PERCENTILES
+        )
+        queries = (
+            f"{result['queries_max']}"
+            if result["queries_min"] == result["queries_max"]
+            else f"{result['queries_min']}-{result['queries_max']}"
+        )
+        self.stdout.write(
+            f"{result['name']:<22} {percentiles}  쿼리 {queries:>5}  "
+            f"상태 {','.join(map(str, result['status']))}"
+        )
+
+    def write_comparison(self, rows):
+        self.stdout.write("\n이전 결과 대비 변화")
+        for row in rows:
+            changes = []
+            for pct in PERCENTILES:
+                change = row[f"p{pct}_ms_change"]
+                changes.append(
+                    f"p{pct} {change:>+7.1f}%"
+                    if change is not None
+                    else f"p{pct}      -"
+                )
+            queries = row["queries_change"]
+            changes.append(f"쿼리 {queries:+d}" if queries is not None else "쿼리 -")
+            self.stdout.write(f"{row['name']:<22} " + "  ".join(changes))
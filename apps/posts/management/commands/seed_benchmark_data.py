@@ -0,0 +1,87 @@
+"""
+벤치마크 데이터 생성 명령어
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.posts.benchmark_data import DEFAULT_BATCH_SIZE, BenchmarkDataSeeder
+
+
+class Command(BaseCommand):
+    help = (
+        "벤치마크용 사용자/게시글/좋아요/댓글/태그를 대량으로 생성합니다. "
+        "(같은 시드와 빈 DB 에서는 같은 데이터, 다른 쓰기가 없는 DB 에서 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10000, help="사용자 수")
+        parser.add_argument("--posts", type=int, default=100000, help="게시글 수")
+        parser.add_argument("--likes", type=int, default=1000000, help="좋아요 수")
+        parser.add_argument("--comments", type=int, default=300000, help="댓글 수")
+        parser.add_argument("--tags", type=int, default=500, help="태그 수")
+        parser.add_argument("--categories", type=int, default=10, help="카테고리 수")
+        parser.add_argument(
+            "--days", type=int, default=90, help="생성일시를 분포시킬 최근 일수"
+        )
+        parser.add_argument(
+            "--zipf",
+            type=float,
+            default=1.1,
+            help="좋아요/댓글/작성자/태그 분포의 Zipf 지수 (0 이면 균등)",
+        )
+        parser.add_argument(
+            "--reply-ratio", type=float, default=0.4, help="답글인 댓글의 비율"
+        )
+        parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+        parser.add_argument(
+            "--prefix", default="bench", help="생성하는 사용자/태그 이름의 접두사"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="한 번에 적재할 행 수",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+        seeder = BenchmarkDataSeeder(
+            users=options["users"],
+            posts=options["posts"],
+            likes=options["likes"],
+            comments=options["comments"],
+            tags=options["tags"],
+            categories=options["categories"],
+            days=options["days"],
+            zipf_exponent=options["zipf"],
+            reply_ratio=options["reply_ratio"],
+            seed=options["seed"],
+            prefix=options["prefix"],
+            batch_size=options["batch_size"],
+            progress=self.report_progress,
+        )
+        if options["users"] <= 0:
+            raise CommandError("사용자는 1명 이상이어야 합니다.")
+        if seeder.exists():
+            raise CommandError(
+                f"'{options['prefix']}' 접두사의 데이터가 이미 있습니다. "
+                "빈 DB 에서 실행하거나 --prefix 를 바꾸세요."
+            )
+
+        written = seeder.seed()
+        for name, count in written.items():
+            elapsed = seeder.timings[name]
+            rate = count / elapsed if elapsed else 0
+            self.stdout.write(
+                f"{name:<12} {count:>10}행  {elapsed:>7.1f}초  {rate:>10.0f}행/초"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                "벤치마크 데이터를 생성했습니다. "
+                "검색 벤치마크가 필요하면 rebuild_search_vectors --missing-only 를 실행하세요."
+            )
+        )
+
+    def report_progress(self, table: str, written: int):
+        if self.verbosity >= 2:
+            self.stdout.write(f"  {table}: {written}")
@@ -0,0 +1,31 @@
+"""
+타임라인 정리 명령어
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.posts.timeline import trim_timelines
+
+
+class Command(BaseCommand):
+    help = "보관 기간이 지난 홈 타임라인 항목을 삭제합니다. (주기 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=None,
+            help="보관 기간(일), 기본값은 TIMELINE_RETENTION_DAYS",
+        )
+
+    def handle(self, *args, **options):
+        days = options["days"]
+        if days is None:
+            days = getattr(settings, "TIMELINE_RETENTION_DAYS", 30)
+        removed = trim_timelines(days)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{days}일이 지난 타임라인 항목 {removed}개를 삭제했습니다."
+            )
+        )
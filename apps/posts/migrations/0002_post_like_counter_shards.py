@@ -0,0 +1,45 @@
+# Generated by Django 5.2.1 on 2026-10-18 05:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostLikeCounterShard",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("shard", models.PositiveSmallIntegerField(verbose_name="샤드 번호")),
+                ("delta", models.IntegerField(default=0, verbose_name="증감분")),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="like_count_shards",
+                        to="posts.post",
+                        verbose_name="게시글",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "게시글 좋아요 수 샤드",
+                "verbose_name_plural": "게시글 좋아요 수 샤드들",
+                "db_table": "post_like_counter_shards",
+                "unique_together": {("post", "shard")},
+            },
+        ),
+    ]
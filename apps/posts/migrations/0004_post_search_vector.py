@@ -0,0 +1,41 @@
+# Generated by Django 5.2.1 on 2026-10-18 05:32
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+def backfill_search_vectors(apps, schema_editor):
+    from apps.posts.search import build_search_vector
+
+    Post = apps.get_model("posts", "Post")
+    for post in Post.objects.only("id", "title", "content").iterator(chunk_size=1000):
+        Post.objects.filter(pk=post.pk).update(
+            search_vector=build_search_vector(post.title, post.content)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0003_comment_post_created_at_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="검색 벡터"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="posts_search_vector_gin"
+            ),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
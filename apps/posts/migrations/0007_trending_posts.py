@@ -0,0 +1,73 @@
+# Generated by Django 5.2.1 on 2026-10-18 05:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0006_timeline_entries"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TrendingPost",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rank", models.PositiveSmallIntegerField(verbose_name="순위")),
+                ("score", models.FloatField(verbose_name="점수")),
+                ("computed_at", models.DateTimeField(verbose_name="계산일시")),
+            ],
+            options={
+                "verbose_name": "인기 게시글",
+                "verbose_name_plural": "인기 게시글들",
+                "db_table": "trending_posts",
+                "ordering": ["category", "rank"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["status", "-published_at"], name="posts_status_cc3e56_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="trendingpost",
+            name="category",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="trending_posts",
+                to="posts.category",
+                verbose_name="카테고리",
+            ),
+        ),
+        migrations.AddField(
+            model_name="trendingpost",
+            name="post",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="trending_entries",
+                to="posts.post",
+                verbose_name="게시글",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trendingpost",
+            index=models.Index(
+                fields=["category", "rank"], name="trending_po_categor_6e5150_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 5.2.1 on 2026-10-18 05:40
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def backfill_comment_threads(apps, schema_editor):
+    from apps.posts.models import (
+        COMMENT_PATH_SEGMENT_LENGTH,
+        MAX_COMMENT_DEPTH,
+        encode_comment_path_segment,
+    )
+
+    Comment = apps.get_model("posts", "Comment")
+    last_id = 0
+    # id 키셋 배치로 처리 (상위 댓글은 항상 먼저 생성되므로 이전 배치에서 경로가 채워짐)
+    while True:
+        batch = list(
+            Comment.objects.filter(id__gt=last_id)
+            .only("id", "parent_id")
+            .order_by("id")[:BACKFILL_BATCH_SIZE]
+        )
+        if not batch:
+            break
+        last_id = batch[-1].id
+
+        parent_ids = {comment.parent_id for comment in batch} - {None}
+        parents = {
+            row["id"]: (row["path"], row["depth"])
+            for row in Comment.objects.filter(
+                id__in=parent_ids, id__lt=batch[0].id
+            ).values("id", "path", "depth")
+        }
+        for comment in batch:
+            parent_path, parent_depth = parents.get(comment.parent_id, ("", -1))
+            if parent_depth >= MAX_COMMENT_DEPTH:
+                # 경로 길이(255)를 넘는 깊이는 최대 깊이에 형제로 둔다 (parent 는 유지)
+                parent_path = parent_path[:-COMMENT_PATH_SEGMENT_LENGTH]
+                parent_depth -= 1
+            comment.path = parent_path + encode_comment_path_segment(comment.id)
+            comment.depth = parent_depth + 1
+            parents[comment.id] = (comment.path, comment.depth)
+        Comment.objects.bulk_update(batch, ["path", "depth"])
+
+    replies = (
+        Comment.objects.filter(parent_id=OuterRef("pk"))
+        .order_by()
+        .values("parent_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Comment.objects.update(reply_count=Coalesce(Subquery(replies), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0007_trending_posts"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comment",
+            name="depth",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="깊이"),
+        ),
+        migrations.AddField(
+            model_name="comment",
+            name="path",
+            field=models.CharField(
+                blank=True,
+                db_collation="C",
+                default="",
+                max_length=255,
+                verbose_name="경로",
+            ),
+        ),
+        migrations.AddField(
+            model_name="comment",
+            name="reply_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="답글 수"),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["post", "path"], name="comments_post_id_5f9abc_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_comment_threads, migrations.RunPython.noop),
+    ]
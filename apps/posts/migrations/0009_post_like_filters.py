@@ -0,0 +1,42 @@
+# Generated by Django 5.2.1 on 2026-10-18 05:46
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0008_comment_threads"),
+        ("users", "0003_follow"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostLikeFilter",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="post_like_filter",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+                ("bits", models.BinaryField(verbose_name="비트 배열")),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "게시글 좋아요 필터",
+                "verbose_name_plural": "게시글 좋아요 필터들",
+                "db_table": "post_like_filters",
+            },
+        ),
+    ]
@@ -0,0 +1,127 @@
+# Generated by Django 5.2.1 on 2026-10-18 05:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0009_post_like_filters"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RollupCheckpoint",
+            fields=[
+                (
+                    "name",
+                    models.CharField(
+                        max_length=50,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="이름",
+                    ),
+                ),
+                (
+                    "last_id",
+                    models.BigIntegerField(default=0, verbose_name="마지막 처리 id"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "롤업 처리 위치",
+                "verbose_name_plural": "롤업 처리 위치들",
+                "db_table": "rollup_checkpoints",
+            },
+        ),
+        migrations.CreateModel(
+            name="AuthorDailyStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="날짜")),
+                (
+                    "views",
+                    models.PositiveIntegerField(default=0, verbose_name="조회수"),
+                ),
+                (
+                    "likes",
+                    models.PositiveIntegerField(default=0, verbose_name="좋아요 수"),
+                ),
+                (
+                    "comments",
+                    models.PositiveIntegerField(default=0, verbose_name="댓글 수"),
+                ),
+                (
+                    "author",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="작성자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "작성자 일별 통계",
+                "verbose_name_plural": "작성자 일별 통계들",
+                "db_table": "author_daily_stats",
+                "unique_together": {("author", "date")},
+            },
+        ),
+        migrations.CreateModel(
+            name="PostDailyStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="날짜")),
+                (
+                    "views",
+                    models.PositiveIntegerField(default=0, verbose_name="조회수"),
+                ),
+                (
+                    "likes",
+                    models.PositiveIntegerField(default=0, verbose_name="좋아요 수"),
+                ),
+                (
+                    "comments",
+                    models.PositiveIntegerField(default=0, verbose_name="댓글 수"),
+                ),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="posts.post",
+                        verbose_name="게시글",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "게시글 일별 통계",
+                "verbose_name_plural": "게시글 일별 통계들",
+                "db_table": "post_daily_stats",
+                "unique_together": {("post", "date")},
+            },
+        ),
+    ]
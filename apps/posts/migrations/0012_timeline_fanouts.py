@@ -0,0 +1,46 @@
+# Generated by Django 5.2.1 on 2026-10-18 06:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0011_post_created_at_id_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TimelineFanout",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="posts.post",
+                        verbose_name="게시글",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "타임라인 fan-out 대기열",
+                "verbose_name_plural": "타임라인 fan-out 대기열",
+                "db_table": "timeline_fanouts",
+            },
+        ),
+    ]
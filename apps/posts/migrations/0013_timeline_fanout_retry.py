@@ -0,0 +1,32 @@
+# Generated by Django 5.2.1 on 2026-10-18 06:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0012_timeline_fanouts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="timelinefanout",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="시도 횟수"),
+        ),
+        migrations.AddField(
+            model_name="timelinefanout",
+            name="next_attempt_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, verbose_name="다음 시도 일시"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="timelinefanout",
+            index=models.Index(
+                fields=["next_attempt_at", "id"], name="timeline_fanout_next_idx"
+            ),
+        ),
+    ]
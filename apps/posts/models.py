@@ -4,7 +4,10 @@ Toss 스타일의 네이밍 컨벤션을 따름
 """
 
 from django.conf import settings
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models.functions import Collate, Lower
 from django.utils import timezone
 
 
@@ -63,6 +66,9 @@ class Post(models.Model):
     updated_at = models.DateTimeField("수정일시", auto_now=True)
     published_at = models.DateTimeField("게시일시", null=True, blank=True)
 
+    # 전문 검색 (제목/본문 저장 시 시그널로 갱신, apps.posts.search 참고)
+    search_vector = SearchVectorField("검색 벡터", null=True, editable=False)
+
     class Meta:
         db_table = "posts"
         verbose_name = "게시글"
@@ -70,17 +76,27 @@ class Post(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["status", "-created_at"]),
+            # 상태 필터 없는 키셋 페이지네이션 (created_at, id 순)
+            models.Index(fields=["-created_at", "-id"]),
             models.Index(fields=["author", "-created_at"]),
+            models.Index(fields=["author", "-published_at"]),
+            models.Index(fields=["status", "-published_at"]),
+            GinIndex(fields=["search_vector"], name="posts_search_vector_gin"),
         ]
 
     def __str__(self):
         return f"{self.title} - {self.author.display_name}"
 
     def publish(self):
-        """게시글 발행"""
+        """게시글 발행 (팔로워 타임라인 fan-out 대기열에 추가)"""
+        from .timeline import schedule_fan_out
+
         self.status = PostStatus.PUBLISHED
         self.published_at = timezone.now()
-        self.save(update_fields=["status", "published_at"])
+        # 발행과 대기열 추가를 함께 커밋해 fan-out 이 빠지지 않도록
+        with transaction.atomic():
+            self.save(update_fields=["status", "published_at"])
+            schedule_fan_out(self)
 
     def archive(self):
         """게시글 보관"""
@@ -88,9 +104,10 @@ class Post(models.Model):
         self.save(update_fields=["status"])
 
     def increment_view_count(self):
-        """조회수 증가"""
-        self.view_count += 1
-        self.save(update_fields=["view_count"])
+        """조회수 증가 (버퍼에 기록 후 주기적으로 일괄 반영)"""
+        from .view_counter import record_post_view
+
+        record_post_view(self.id)
 
     @property
     def is_published(self):
@@ -159,6 +176,13 @@ class Tag(models.Model):
         verbose_name = "태그"
         verbose_name_plural = "태그들"
         ordering = ["-usage_count", "name"]
+        indexes = [
+            # 자동완성 (apps.core.autocomplete 참고)
+            models.Index(Collate(Lower("name"), "C"), name="tags_name_prefix_idx"),
+            GinIndex(
+                OpClass(Lower("name"), name="gin_trgm_ops"), name="tags_name_trgm_gin"
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -192,9 +216,254 @@ class PostLike(models.Model):
         return f"{self.user.display_name}이 {self.post.title}을 좋아함"
 
 
+class PostLikeCounterShard(models.Model):
+    """
+    게시글 좋아요 수 샤드
+    인기 게시글의 posts 행에 쓰기가 몰리지 않도록 좋아요 증감분을 여러 행에 나누어 기록
+    """
+
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name="like_count_shards",
+        verbose_name="게시글",
+    )
+    shard = models.PositiveSmallIntegerField("샤드 번호")
+    delta = models.IntegerField("증감분", default=0)
+
+    class Meta:
+        db_table = "post_like_counter_shards"
+        verbose_name = "게시글 좋아요 수 샤드"
+        verbose_name_plural = "게시글 좋아요 수 샤드들"
+        unique_together = ["post", "shard"]
+
+    def __str__(self):
+        return f"{self.post_id}#{self.shard}: {self.delta:+d}"
+
+
+class PostLikeFilter(models.Model):
+    """
+    사용자별 좋아요한 게시글 Bloom 필터
+    Redis 를 쓸 수 없을 때의 저장소 (비트 배열을 그대로 저장)
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="post_like_filter",
+        verbose_name="사용자",
+    )
+    bits = models.BinaryField("비트 배열")
+
+    # 타임스탬프
+    updated_at = models.DateTimeField("수정일시", auto_now=True)
+
+    class Meta:
+        db_table = "post_like_filters"
+        verbose_name = "게시글 좋아요 필터"
+        verbose_name_plural = "게시글 좋아요 필터들"
+
+    def __str__(self):
+        return f"{self.user_id}: {len(self.bits) * 8} bits"
+
+
+class PostDailyStats(models.Model):
+    """
+    게시글 일별 통계 (조회수/좋아요/댓글 롤업)
+    """
+
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name="daily_stats",
+        verbose_name="게시글",
+    )
+    date = models.DateField("날짜")
+    views = models.PositiveIntegerField("조회수", default=0)
+    likes = models.PositiveIntegerField("좋아요 수", default=0)
+    comments = models.PositiveIntegerField("댓글 수", default=0)
+
+    class Meta:
+        db_table = "post_daily_stats"
+        verbose_name = "게시글 일별 통계"
+        verbose_name_plural = "게시글 일별 통계들"
+        unique_together = ["post", "date"]
+
+    def __str__(self):
+        return f"{self.post_id} {self.date}"
+
+
+class AuthorDailyStats(models.Model):
+    """
+    작성자 일별 통계 (작성한 게시글들의 조회수/좋아요/댓글 롤업)
+    """
+
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="daily_stats",
+        verbose_name="작성자",
+    )
+    date = models.DateField("날짜")
+    views = models.PositiveIntegerField("조회수", default=0)
+    likes = models.PositiveIntegerField("좋아요 수", default=0)
+    comments = models.PositiveIntegerField("댓글 수", default=0)
+
+    class Meta:
+        db_table = "author_daily_stats"
+        verbose_name = "작성자 일별 통계"
+        verbose_name_plural = "작성자 일별 통계들"
+        unique_together = ["author", "date"]
+
+    def __str__(self):
+        return f"{self.author_id} {self.date}"
+
+
+class RollupCheckpoint(models.Model):
+    """
+    롤업 처리 위치 (원본 테이블에서 마지막으로 집계한 id)
+    """
+
+    name = models.CharField("이름", max_length=50, primary_key=True)
+    last_id = models.BigIntegerField("마지막 처리 id", default=0)
+
+    # 타임스탬프
+    updated_at = models.DateTimeField("수정일시", auto_now=True)
+
+    class Meta:
+        db_table = "rollup_checkpoints"
+        verbose_name = "롤업 처리 위치"
+        verbose_name_plural = "롤업 처리 위치들"
+
+    def __str__(self):
+        return f"{self.name}: {self.last_id}"
+
+
+class TimelineEntry(models.Model):
+    """
+    홈 타임라인 항목 (Redis 를 사용할 수 없을 때의 DB 저장소, apps.posts.timeline 참고)
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="timeline_entries",
+        verbose_name="사용자",
+    )
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name="timeline_entries",
+        verbose_name="게시글",
+    )
+    # 정렬 기준 (게시글 게시일시)
+    published_at = models.DateTimeField("게시일시")
+
+    class Meta:
+        db_table = "timeline_entries"
+        verbose_name = "타임라인 항목"
+        verbose_name_plural = "타임라인 항목들"
+        unique_together = ["user", "post"]
+        indexes = [
+            models.Index(fields=["user", "-published_at"]),
+            models.Index(fields=["published_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}: {self.post_id}"
+
+
+class TimelineFanout(models.Model):
+    """
+    팔로워 타임라인 fan-out 대기열 (게시글 발행과 같은 트랜잭션에 추가)
+    fan_out_timelines 명령어가 요청 밖에서 처리하고 지운다.
+    실패한 항목은 next_attempt_at 을 늦춰 재시도하고,
+    최대 시도 횟수를 넘기면 대기열에 남겨 둔 채 더 이상 꺼내지 않는다.
+    """
+
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="게시글",
+    )
+    attempts = models.PositiveSmallIntegerField("시도 횟수", default=0)
+    next_attempt_at = models.DateTimeField("다음 시도 일시", default=timezone.now)
+    created_at = models.DateTimeField("생성일시", auto_now_add=True)
+
+    class Meta:
+        db_table = "timeline_fanouts"
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at", "id"],
+                name="timeline_fanout_next_idx",
+            ),
+        ]
+        verbose_name = "타임라인 fan-out 대기열"
+        verbose_name_plural = "타임라인 fan-out 대기열"
+
+    def __str__(self):
+        return f"{self.post_id}"
+
+
+class TrendingPost(models.Model):
+    """
+    인기 게시글 순위 (compute_trending 이 주기적으로 다시 씀, apps.posts.trending 참고)
+    카테고리가 없는 행은 전체 순위
+    """
+
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="trending_posts",
+        verbose_name="카테고리",
+    )
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name="trending_entries",
+        verbose_name="게시글",
+    )
+    rank = models.PositiveSmallIntegerField("순위")
+    score = models.FloatField("점수")
+    computed_at = models.DateTimeField("계산일시")
+
+    class Meta:
+        db_table = "trending_posts"
+        verbose_name = "인기 게시글"
+        verbose_name_plural = "인기 게시글들"
+        ordering = ["category", "rank"]
+        indexes = [models.Index(fields=["category", "rank"])]
+
+    def __str__(self):
+        return f"{self.category_id or '전체'} #{self.rank}: {self.post_id}"
+
+
+COMMENT_PATH_SEGMENT_LENGTH = 8
+COMMENT_PATH_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+# 경로 길이(255) 안에 들어가는 최대 깊이
+MAX_COMMENT_DEPTH = 255 // COMMENT_PATH_SEGMENT_LENGTH - 1
+
+
+def encode_comment_path_segment(comment_id: int) -> str:
+    """
+    댓글 id 를 고정 길이 36진수 경로 조각으로 변환 (문자열 정렬 = id 순서)
+    """
+    digits = ""
+    while comment_id:
+        comment_id, remainder = divmod(comment_id, 36)
+        digits = COMMENT_PATH_ALPHABET[remainder] + digits
+    return digits.rjust(COMMENT_PATH_SEGMENT_LENGTH, "0")
+
+
 class Comment(models.Model):
     """
     댓글 모델
+    path 는 루트부터 자신까지의 id 조각을 이어 붙인 구체화 경로로,
+    (post, path) 인덱스 한 구간 스캔으로 하위 스레드 전체를 트리 순서대로 읽을 수 있다.
     """
 
     post = models.ForeignKey(
@@ -220,6 +489,13 @@ class Comment(models.Model):
         verbose_name="상위 댓글",
     )
 
+    # 스레드 (구체화 경로, 깊이, 직계 답글 수)
+    path = models.CharField(
+        "경로", max_length=255, blank=True, default="", db_collation="C"
+    )
+    depth = models.PositiveSmallIntegerField("깊이", default=0)
+    reply_count = models.PositiveIntegerField("답글 수", default=0)
+
     # 상태
     is_active = models.BooleanField("활성 상태", default=True)
 
@@ -232,6 +508,57 @@ class Comment(models.Model):
         verbose_name = "댓글"
         verbose_name_plural = "댓글들"
         ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["post", "created_at"]),
+            models.Index(fields=["post", "path"]),
+        ]
 
     def __str__(self):
         return f"{self.author.display_name}의 댓글: {self.content[:50]}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 활성 상태 변경을 저장 시 알 수 있도록 읽어 온 값을 기억
+        instance._loaded_is_active = instance.__dict__.get("is_active")
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        새 댓글이면 저장 후 id 로 경로를 만들고 상위 댓글의 답글 수 증가
+        활성 댓글이 늘거나 줄면 같은 트랜잭션에서 게시글의 댓글 수 갱신
+        """
+        from .counters import adjust_comment_count
+
+        creating = self._state.adding
+        if creating and self.parent_id:
+            self.depth = self.parent.depth + 1
+        comment_delta = self._get_comment_count_delta(
+            creating, kwargs.get("update_fields")
+        )
+
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+            adjust_comment_count(self.post_id, comment_delta)
+            if creating and not self.path:
+                parent_path = self.parent.path if self.parent_id else ""
+                self.path = parent_path + encode_comment_path_segment(self.pk)
+                Comment.objects.filter(pk=self.pk).update(path=self.path)
+                if self.parent_id:
+                    Comment.objects.filter(pk=self.parent_id).update(
+                        reply_count=models.F("reply_count") + 1
+                    )
+        self._loaded_is_active = self.is_active
+
+    def _get_comment_count_delta(self, creating: bool, update_fields) -> int:
+        """
+        이번 저장으로 인한 게시글 댓글 수 증감 (활성 댓글만 집계)
+        """
+        if creating:
+            return 1 if self.is_active else 0
+        if update_fields is not None and "is_active" not in update_fields:
+            return 0
+        loaded = getattr(self, "_loaded_is_active", None)
+        if loaded is None or loaded == self.is_active:
+            return 0
+        return 1 if self.is_active else -1
@@ -0,0 +1,228 @@
+"""
+일별 통계 롤업
+post_likes / comments 에서 마지막 처리 id(rollup_checkpoints) 이후의 새 행만 읽어
+(게시글, 날짜)별로 집계한 뒤 post_daily_stats 와 author_daily_stats 에 더한다.
+조회수는 원본 행이 없으므로 조회수 버퍼를 DB 에 반영할 때 조회한 날짜의 증가분으로 더한다.
+
+통계 조회는 (대상, 날짜) 유니크 인덱스 구간을 읽으므로 기간의 날짜 수에만 비례한다.
+
+- 좋아요/댓글은 그날 새로 생긴 수 (취소/삭제는 빼지 않음)
+- 커밋이 늦은 트랜잭션의 행을 건너뛰지 않도록
+  ROLLUP_SAFETY_LAG_SECONDS 이전에 만들어진 행까지만 처리
+"""
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .models import (
+    AuthorDailyStats,
+    Comment,
+    Post,
+    PostDailyStats,
+    PostLike,
+    RollupCheckpoint,
+)
+
+STAT_FIELDS = ("views", "likes", "comments")
+# 롤업 대상 (체크포인트 이름, 원본 모델, 더할 통계 필드)
+ROLLUP_SOURCES = (
+    ("post_likes", PostLike, "likes"),
+    ("comments", Comment, "comments"),
+)
+DEFAULT_BATCH_SIZE = 10000
+
+# (대상 id, 날짜) -> 필드별 증가분
+StatDeltas = Dict[Tuple[int, date], Dict[str, int]]
+
+UPSERT_SQL = """
+INSERT INTO {table} ({key}, date, views, likes, comments)
+VALUES {values}
+ON CONFLICT ({key}, date) DO UPDATE SET
+    views = {table}.views + EXCLUDED.views,
+    likes = {table}.likes + EXCLUDED.likes,
+    comments = {table}.comments + EXCLUDED.comments
+"""
+
+
+def get_safety_lag() -> timedelta:
+    return timedelta(seconds=getattr(settings, "ROLLUP_SAFETY_LAG_SECONDS", 60))
+
+
+def add_daily_stats(post_deltas: StatDeltas, author_deltas: StatDeltas):
+    """
+    게시글/작성자 일별 통계에 증가분을 더함
+    """
+    _upsert(PostDailyStats, "post_id", post_deltas)
+    _upsert(AuthorDailyStats, "author_id", author_deltas)
+
+
+def _upsert(model, key: str, deltas: StatDeltas):
+    rows = [
+        (key_id, day, *(values.get(name, 0) for name in STAT_FIELDS))
+        for (key_id, day), values in deltas.items()
+    ]
+    if not rows:
+        return
+    if connection.vendor == "postgresql":
+        sql = UPSERT_SQL.format(
+            table=model._meta.db_table,
+            key=key,
+            values=", ".join(["(%s, %s, %s, %s, %s)"] * len(rows)),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [value for row in rows for value in row])
+        return
+
+    for key_id, day, *values in rows:
+        increments = dict(zip(STAT_FIELDS, values))
+        updated = model.objects.filter(**{key: key_id, "date": day}).update(
+            **{name: F(name) + amount for name, amount in increments.items()}
+        )
+        if not updated:
+            model.objects.create(**{key: key_id, "date": day}, **increments)
+
+
+def _next_upper_id(model, last_id: int, batch_size: int) -> Optional[int]:
+    """
+    이번에 처리할 마지막 id
+    안전 지연 이후에 만들어진 행을 만나면 그 앞에서 멈춘다.
+    """
+    cutoff = timezone.now() - get_safety_lag()
+    upper = None
+    rows = (
+        model.objects.filter(id__gt=last_id)
+        .order_by("id")
+        .values_list("id", "created_at")[:batch_size]
+    )
+    for row_id, created_at in rows:
+        if created_at >= cutoff:
+            break
+        upper = row_id
+    return upper
+
+
+def rollup_source(
+    name: str, model, field: str, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Optional[int]:
+    """
+    원본 테이블의 새 행을 한 배치 집계해 일별 통계에 더하고 처리 위치를 옮김
+    처리한 행 수를 반환, 더 처리할 행이 없으면 None
+    """
+    with transaction.atomic():
+        checkpoint, _ = RollupCheckpoint.objects.select_for_update().get_or_create(
+            name=name
+        )
+        upper = _next_upper_id(model, checkpoint.last_id, batch_size)
+        if upper is None:
+            return None
+
+        groups = (
+            model.objects.filter(id__gt=checkpoint.last_id, id__lte=upper)
+            .annotate(day=TruncDate("created_at"))
+            .values("post_id", "post__author_id", "day")
+            .annotate(total=Count("id"))
+            .values_list("post_id", "post__author_id", "day", "total")
+        )
+        post_deltas: StatDeltas = defaultdict(dict)
+        author_deltas: StatDeltas = defaultdict(dict)
+        processed = 0
+        for post_id, author_id, day, total in groups:
+            post_deltas[(post_id, day)][field] = total
+            author_values = author_deltas[(author_id, day)]
+            author_values[field] = author_values.get(field, 0) + total
+            processed += total
+        add_daily_stats(post_deltas, author_deltas)
+
+        checkpoint.last_id = upper
+        checkpoint.save(update_fields=["last_id", "updated_at"])
+    return processed
+
+
+def rollup_daily_stats(batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+    """
+    모든 롤업 대상의 새 행을 끝까지 처리, 대상별 처리한 행 수를 반환
+    """
+    processed = {}
+    for name, model, field in ROLLUP_SOURCES:
+        processed[name] = 0
+        while True:
+            count = rollup_source(name, model, field, batch_size)
+            if count is None:
+                break
+            processed[name] += count
+    return processed
+
+
+def record_daily_views(increments: Dict[int, int], day: Optional[date] = None):
+    """
+    DB 에 반영한 조회수 증가분을 조회한 날짜(기본 오늘)의 통계에 더함
+    """
+    increments = {post_id: amount for post_id, amount in increments.items() if amount}
+    if not increments:
+        return
+    day = day or timezone.localdate()
+    post_deltas: StatDeltas = {}
+    author_deltas: StatDeltas = defaultdict(dict)
+    for post_id, author_id in Post.objects.filter(id__in=list(increments)).values_list(
+        "id", "author_id"
+    ):
+        amount = increments[post_id]
+        post_deltas[(post_id, day)] = {"views": amount}
+        author_values = author_deltas[(author_id, day)]
+        author_values["views"] = author_values.get("views", 0) + amount
+    add_daily_stats(post_deltas, author_deltas)
+
+
+def parse_date_range(params, default_days: int, max_days: int) -> Tuple[date, date]:
+    """
+    ?from=YYYY-MM-DD&to=YYYY-MM-DD 또는 ?days= (오늘까지 최근 N 일) 기간
+    형식이 잘못되었거나 max_days 를 넘으면 ValueError
+    """
+    try:
+        end = params.get("to")
+        end = parse_date(end) if end else timezone.localdate()
+        start = params.get("from")
+        if start:
+            start = parse_date(start)
+        elif end is not None:
+            start = end - timedelta(days=int(params.get("days", default_days)) - 1)
+    except ValueError:
+        start = end = None
+    if start is None or end is None:
+        raise ValueError("날짜 형식이 올바르지 않습니다.")
+    if start > end or (end - start).days + 1 > max_days:
+        raise ValueError(f"기간은 1일 이상 {max_days}일 이하여야 합니다.")
+    return start, end
+
+
+def get_daily_stats(model, start: date, end: date, **lookup) -> List[dict]:
+    """
+    기간의 날짜별 통계 (롤업 행이 없는 날은 0)
+    """
+    rows = {
+        row["date"]: row
+        for row in model.objects.filter(
+            date__gte=start, date__lte=end, **lookup
+        ).values("date", *STAT_FIELDS)
+    }
+    return [
+        rows.get(day, {"date": day, **{name: 0 for name in STAT_FIELDS}})
+        for day in (
+            start + timedelta(days=offset) for offset in range((end - start).days + 1)
+        )
+    ]
+
+
+def sum_daily_stats(daily: List[dict]) -> Dict[str, int]:
+    """
+    날짜별 통계 합계
+    """
+    return {name: sum(row[name] for row in daily) for name in STAT_FIELDS}
@@ -0,0 +1,138 @@
+"""
+게시글 전문 검색
+posts.search_vector(tsvector, GIN 인덱스)에 제목(가중치 A)과 본문(가중치 B)의 검색 토큰을 저장한다.
+
+한국어는 조사가 붙어 띄어쓰기 단위 단어로는 검색이 잘 되지 않으므로
+한글 구간을 바이그램(2글자 단위)으로 쪼갠 토큰을 함께 저장하고,
+검색어의 한글 구간도 바이그램으로 바꿔 모든 바이그램이 포함된 게시글을 찾는다.
+(예: "서울에서" -> 서울, 울에, 에서 / 검색어 "서울" -> 서울)
+"""
+
+import html
+import re
+from typing import List, Optional
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, Value
+
+SEARCH_CONFIG = "simple"
+WORD_RE = re.compile(r"\w+")
+# 단어 안의 한글 구간 / 그 밖의 문자 구간
+SEGMENT_RE = re.compile(r"[가-힣]+|[^\W가-힣]+")
+HANGUL_RE = re.compile(r"[가-힣]+")
+
+MAX_QUERY_TERMS = 32
+HIGHLIGHT_LENGTH = 160
+HIGHLIGHT_START_TAG = "<mark>"
+HIGHLIGHT_STOP_TAG = "</mark>"
+
+
+def _bigrams(text: str) -> List[str]:
+    return [text[index : index + 2] for index in range(len(text) - 1)]
+
+
+def tokenize_document(text: str) -> str:
+    """
+    저장용 검색 토큰 문자열 생성
+    단어 원형 + 문자 종류별 구간 + 한글 구간의 바이그램
+    """
+    tokens: List[str] = []
+    for word in WORD_RE.findall(text.lower()):
+        segments = SEGMENT_RE.findall(word)
+        word_tokens = {word, *segments}
+        for segment in segments:
+            if HANGUL_RE.fullmatch(segment):
+                word_tokens.update(_bigrams(segment))
+        tokens.extend(sorted(word_tokens))
+    return " ".join(tokens)
+
+
+def tokenize_query(text: str) -> List[str]:
+    """
+    검색어를 검색 토큰 목록으로 변환 (한글 구간은 바이그램)
+    """
+    terms: List[str] = []
+    for word in WORD_RE.findall(text.lower()):
+        for segment in SEGMENT_RE.findall(word):
+            if HANGUL_RE.fullmatch(segment) and len(segment) > 1:
+                terms.extend(_bigrams(segment))
+            else:
+                terms.append(segment)
+    return list(dict.fromkeys(terms))[:MAX_QUERY_TERMS]
+
+
+def build_search_vector(title: str, content: str) -> SearchVector:
+    """
+    제목/본문으로 search_vector 값 표현식 생성
+    """
+    return SearchVector(
+        Value(tokenize_document(title or "")), weight="A", config=SEARCH_CONFIG
+    ) + SearchVector(
+        Value(tokenize_document(content or "")), weight="B", config=SEARCH_CONFIG
+    )
+
+
+def build_search_query(text: str) -> Optional[SearchQuery]:
+    """
+    검색어로 tsquery 생성 (모든 토큰을 포함해야 일치), 토큰이 없으면 None
+    """
+    terms = tokenize_query(text)
+    if not terms:
+        return None
+    return SearchQuery(" ".join(terms), config=SEARCH_CONFIG, search_type="plain")
+
+
+def search_posts(queryset, text: str):
+    """
+    검색어와 일치하는 게시글을 관련도(rank) 순으로 정렬한 쿼리셋
+    검색어가 비어 있으면 빈 쿼리셋
+    """
+    query = build_search_query(text)
+    if query is None:
+        return queryset.none()
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(rank=SearchRank(F("search_vector"), query))
+        .order_by("-rank", "-created_at", "-id")
+    )
+
+
+def update_post_search_vector(post):
+    """
+    게시글의 search_vector 갱신
+    """
+    type(post).objects.filter(pk=post.pk).update(
+        search_vector=build_search_vector(post.title, post.content)
+    )
+
+
+def build_highlight(text: str, query_text: str, length: int = HIGHLIGHT_LENGTH) -> str:
+    """
+    검색어가 처음 나오는 부분을 중심으로 자른 HTML 이스케이프된 발췌문
+    일치한 부분은 <mark> 로 감싼다. 일치가 없으면 앞부분을 발췌.
+    """
+    text = text or ""
+    terms = sorted(tokenize_query(query_text), key=len, reverse=True)
+    pattern = (
+        re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+        if terms
+        else None
+    )
+
+    first = pattern.search(text) if pattern else None
+    start = max(0, first.start() - length // 4) if first else 0
+    snippet = text[start : start + length]
+
+    parts: List[str] = []
+    position = 0
+    for match in pattern.finditer(snippet) if pattern else ():
+        parts.append(html.escape(snippet[position : match.start()]))
+        parts.append(
+            f"{HIGHLIGHT_START_TAG}{html.escape(match.group())}{HIGHLIGHT_STOP_TAG}"
+        )
+        position = match.end()
+    parts.append(html.escape(snippet[position:]))
+
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if start + length < len(text) else ""
+    return f"{prefix}{''.join(parts)}{suffix}"
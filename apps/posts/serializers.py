@@ -4,9 +4,14 @@ Posts 앱 시리얼라이저
 
 from rest_framework import serializers
 
-from apps.users.serializers import UserSerializer
+from apps.core.instrumentation import SerializationTimingMixin
+from apps.core.serializers import SparseFieldsetMixin
+from apps.users.serializers import UserSerializer, UserSummarySerializer
 
+from .counters import get_merged_like_count
+from .like_status import get_liked_post_ids
 from .models import Category, Comment, Post, Tag
+from .search import build_highlight
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -42,7 +47,27 @@ class TagSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class PostSerializer(serializers.ModelSerializer):
+class LikedStateMixin(serializers.Serializer):
+    """
+    현재 사용자의 좋아요 여부(is_liked) 필드
+    목록은 뷰가 한 페이지 분을 한 번에 조회해 컨텍스트(liked_post_ids)에 넣어 두고,
+    단건 직렬화는 해당 게시글만 조회한다.
+    """
+
+    is_liked = serializers.SerializerMethodField()
+
+    def get_is_liked(self, obj):
+        liked_post_ids = self.context.get("liked_post_ids")
+        if liked_post_ids is None:
+            request = self.context.get("request")
+            user = getattr(request, "user", None)
+            if user is None or not user.is_authenticated:
+                return False
+            liked_post_ids = get_liked_post_ids(user.id, [obj.pk])
+        return obj.pk in liked_post_ids
+
+
+class PostSerializer(SparseFieldsetMixin, LikedStateMixin, serializers.ModelSerializer):
     """
     게시글 시리얼라이저
     """
@@ -54,7 +79,7 @@ class PostSerializer(serializers.ModelSerializer):
     tag_ids = serializers.ListField(
         child=serializers.IntegerField(), write_only=True, required=False
     )
-    like_count = serializers.ReadOnlyField()
+    like_count = serializers.SerializerMethodField()
     comment_count = serializers.ReadOnlyField()
 
     class Meta:
@@ -72,11 +97,20 @@ class PostSerializer(serializers.ModelSerializer):
             "featured_image",
             "like_count",
             "comment_count",
+            "is_liked",
             "created_at",
             "updated_at",
         ]
         read_only_fields = ["id", "author", "created_at", "updated_at"]
 
+    field_sources = {"like_count": ["like_count"], "is_liked": []}
+
+    def get_like_count(self, obj):
+        """
+        좋아요 수 (아직 합산되지 않은 샤드 증감분 포함)
+        """
+        return get_merged_like_count(obj)
+
     def create(self, validated_data):
         """
         게시글 생성
@@ -107,12 +141,106 @@ class PostSerializer(serializers.ModelSerializer):
         return instance
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class PostListSerializer(
+    SparseFieldsetMixin, LikedStateMixin, serializers.ModelSerializer
+):
+    """
+    게시글 목록 시리얼라이저
+    본문 대신 요약을, 전체 사용자 정보 대신 작성자 요약을 내려준다.
+    """
+
+    author = UserSummarySerializer(read_only=True)
+    category = CategorySerializer(read_only=True)
+    tags = TagSerializer(many=True, read_only=True)
+    like_count = serializers.SerializerMethodField()
+    comment_count = serializers.ReadOnlyField()
+
+    class Meta:
+        model = Post
+        fields = [
+            "id",
+            "title",
+            "summary",
+            "author",
+            "category",
+            "tags",
+            "status",
+            "featured_image",
+            "like_count",
+            "comment_count",
+            "is_liked",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+    # 목록 조회 시 읽는 컬럼 (본문 등 큰 컬럼 제외)
+    only_fields = [
+        "id",
+        "title",
+        "summary",
+        "status",
+        "featured_image",
+        "like_count",
+        "comment_count",
+        "created_at",
+        "updated_at",
+        "author",
+        "category",
+        *(f"author__{name}" for name in UserSummarySerializer.only_fields),
+        *(f"category__{name}" for name in CategorySerializer.Meta.fields),
+    ]
+    field_sources = {"like_count": ["like_count"], "is_liked": []}
+
+    def get_like_count(self, obj):
+        """
+        좋아요 수 (아직 합산되지 않은 샤드 증감분 포함)
+        """
+        return get_merged_like_count(obj)
+
+
+class PostSearchResultSerializer(PostListSerializer):
+    """
+    게시글 검색 결과 시리얼라이저
+    관련도 점수와 검색어를 강조한 제목/본문 발췌문을 함께 내려준다.
+    """
+
+    rank = serializers.FloatField(read_only=True)
+    highlight = serializers.SerializerMethodField()
+
+    class Meta(PostListSerializer.Meta):
+        fields = PostListSerializer.Meta.fields + ["rank", "highlight"]
+        read_only_fields = fields
+
+    only_fields = PostListSerializer.only_fields + ["content"]
+    field_sources = {
+        **PostListSerializer.field_sources,
+        "rank": [],
+        "highlight": ["title", "content"],
+    }
+
+    def get_highlight(self, obj):
+        """
+        검색어 강조 발췌문 (HTML 이스케이프 후 <mark> 로 강조)
+        """
+        query = self.context.get("search_query", "")
+        return {
+            "title": build_highlight(obj.title, query),
+            "content": build_highlight(obj.content, query),
+        }
+
+
+class CommentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     댓글 시리얼라이저
     """
 
     author = UserSerializer(read_only=True)
+    parent = serializers.PrimaryKeyRelatedField(
+        queryset=Comment.objects.only("id", "post_id", "path", "depth"),
+        required=False,
+        allow_null=True,
+    )
 
     class Meta:
         model = Comment
@@ -121,7 +249,63 @@ class CommentSerializer(serializers.ModelSerializer):
             "content",
             "author",
             "post",
+            "parent",
+            "depth",
+            "reply_count",
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["id", "author", "post", "created_at", "updated_at"]
+        read_only_fields = [
+            "id",
+            "author",
+            "post",
+            "depth",
+            "reply_count",
+            "created_at",
+            "updated_at",
+        ]
+
+    def validate_parent(self, value):
+        """
+        상위 댓글은 작성 시에만 지정 가능 (경로가 고정되므로 이동 불가)
+        """
+        if self.instance is not None and value != self.instance.parent:
+            raise serializers.ValidationError("상위 댓글은 변경할 수 없습니다.")
+        return value
+
+
+class CommentThreadSerializer(SerializationTimingMixin, serializers.ModelSerializer):
+    """
+    댓글 스레드 시리얼라이저 (replies 는 뷰에서 중첩)
+    """
+
+    author = UserSummarySerializer(read_only=True)
+
+    class Meta:
+        model = Comment
+        fields = [
+            "id",
+            "content",
+            "author",
+            "parent",
+            "depth",
+            "reply_count",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+    # 스레드 조회 시 읽을 컬럼
+    only_fields = [
+        "id",
+        "post_id",
+        "content",
+        "author",
+        "parent_id",
+        "path",
+        "depth",
+        "reply_count",
+        "created_at",
+        "updated_at",
+        *(f"author__{name}" for name in UserSummarySerializer.only_fields),
+    ]
@@ -0,0 +1,179 @@
+"""
+Posts 앱 시그널
+게시글 직렬화 결과에 포함되는 모델이 바뀌면 해당 게시글의 캐시 버전을 갱신하고,
+댓글이 바뀌면 댓글 목록/상세의 ETag 세대를 갱신하며,
+제목/본문이 바뀌면 검색 벡터를 갱신한다.
+댓글 삭제와 게시글-태그 연결 변경은 댓글 수/태그 사용 횟수에 반영하고,
+ORM 으로 추가된 좋아요는 좋아요 필터에 반영한다.
+"""
+
+from django.conf import settings
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.users.signals import USER_FIELDS_NOT_SERIALIZED
+
+from .caching import bump_comment_etags, bump_post_versions
+from .counters import adjust_comment_count, adjust_tag_usage_counts
+from .like_filter import add_to_like_filter
+from .models import Category, Comment, Post, PostLike, Tag
+from .search import update_post_search_vector
+
+# 검색 벡터에 반영되는 게시글 필드
+POST_SEARCH_FIELDS = {"title", "content"}
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post(sender, instance, **kwargs):
+    """
+    게시글 저장/삭제 시 캐시 무효화
+    """
+    bump_post_versions([instance.pk])
+
+
+@receiver(post_save, sender=Post)
+def update_search_vector(sender, instance, update_fields=None, **kwargs):
+    """
+    게시글 제목/본문 저장 시 검색 벡터 갱신
+    """
+    if update_fields is not None and not POST_SEARCH_FIELDS & set(update_fields):
+        return
+    update_post_search_vector(instance)
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def invalidate_post_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    게시글 태그 변경 시 캐시 무효화
+    """
+    if action not in ("post_add", "post_remove", "post_clear", "pre_clear"):
+        return
+    if not reverse:
+        # 태그 변경도 게시글 수정으로 보고 updated_at 갱신
+        Post.objects.filter(pk=instance.pk).update(updated_at=timezone.now())
+        bump_post_versions([instance.pk])
+        return
+
+    if action == "pre_clear":
+        bump_post_versions(
+            Post.tags.through.objects.filter(tag_id=instance.pk).values_list(
+                "post_id", flat=True
+            )
+        )
+    elif pk_set:
+        bump_post_versions(pk_set)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(pre_delete, sender=Tag)
+def invalidate_tag_posts(sender, instance, **kwargs):
+    """
+    태그 수정/삭제 시 해당 태그가 달린 게시글 캐시 무효화
+    """
+    bump_post_versions(
+        Post.tags.through.objects.filter(tag_id=instance.pk)
+        .values_list("post_id", flat=True)
+        .iterator()
+    )
+
+
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+def invalidate_category_posts(sender, instance, **kwargs):
+    """
+    카테고리 수정/삭제 시 해당 카테고리 게시글 캐시 무효화
+    """
+    bump_post_versions(
+        Post.objects.filter(category_id=instance.pk)
+        .values_list("id", flat=True)
+        .iterator()
+    )
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_author_posts(sender, instance, created, update_fields, **kwargs):
+    """
+    사용자 정보 수정 시 작성한 게시글 캐시 무효화
+    """
+    if created:
+        return
+    if update_fields is not None and set(update_fields) <= USER_FIELDS_NOT_SERIALIZED:
+        return
+    bump_post_versions(
+        Post.objects.filter(author_id=instance.pk)
+        .values_list("id", flat=True)
+        .iterator()
+    )
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comment(sender, instance, **kwargs):
+    """
+    댓글 저장/삭제 시 댓글 목록과 자신/상위 댓글(답글 수) 상세의 ETag 무효화
+    """
+    bump_comment_etags(instance.post_id, [instance.pk, instance.parent_id])
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_counts(sender, instance, **kwargs):
+    """
+    댓글 삭제 시 게시글 댓글 수와 상위 댓글의 답글 수 감소
+    (게시글/상위 댓글도 함께 삭제되면 갱신할 행 없음)
+    """
+    if instance.is_active:
+        adjust_comment_count(instance.post_id, -1)
+    if instance.parent_id:
+        Comment.objects.filter(pk=instance.parent_id, reply_count__gt=0).update(
+            reply_count=F("reply_count") - 1
+        )
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def update_tag_usage_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    게시글-태그 연결 변경 시 태그 사용 횟수 증감
+    추가는 실제로 새로 연결된 pk_set 으로, 제거/비우기는 삭제 전 실제 연결 행으로 계산한다.
+    """
+    if action == "post_add" and pk_set:
+        if reverse:
+            adjust_tag_usage_counts([instance.pk], len(pk_set))
+        else:
+            adjust_tag_usage_counts(pk_set, 1)
+        return
+    if action not in ("pre_remove", "pre_clear"):
+        return
+
+    links = sender.objects.filter(**{"tag_id" if reverse else "post_id": instance.pk})
+    if action == "pre_remove":
+        links = links.filter(**{"post_id__in" if reverse else "tag_id__in": pk_set})
+    if reverse:
+        adjust_tag_usage_counts([instance.pk], -links.count())
+    else:
+        adjust_tag_usage_counts(links.values_list("tag_id", flat=True), -1)
+
+
+@receiver(pre_delete, sender=Post)
+def release_post_tags(sender, instance, **kwargs):
+    """
+    게시글 삭제 시 (연결 행은 시그널 없이 함께 삭제되므로) 태그 사용 횟수 감소
+    """
+    adjust_tag_usage_counts(
+        Post.tags.through.objects.filter(post_id=instance.pk).values_list(
+            "tag_id", flat=True
+        ),
+        -1,
+    )
+
+
+@receiver(post_save, sender=PostLike)
+def add_like_to_filter(sender, instance, created, **kwargs):
+    """
+    ORM 으로 추가된 좋아요를 좋아요 필터에 반영
+    (좋아요 토글은 SQL 로 처리하므로 toggle_post_like 에서 반영)
+    """
+    if created:
+        add_to_like_filter(instance.user_id, instance.post_id)
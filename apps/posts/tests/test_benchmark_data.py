@@ -0,0 +1,44 @@
+"""
+벤치마크 데이터 분배 테스트
+"""
+
+import random
+
+from apps.posts.benchmark_data import allocate_zipf
+
+
+def test_allocation_sums_to_total():
+    counts = allocate_zipf(10000, 100, 1.1, random.Random(1))
+
+    assert len(counts) == 100
+    assert sum(counts) == 10000
+
+
+def test_allocation_is_skewed():
+    counts = sorted(allocate_zipf(10000, 100, 1.1, random.Random(1)), reverse=True)
+
+    assert counts[0] > 10 * counts[-1]
+    assert sum(counts[:10]) > sum(counts) / 2
+
+
+def test_allocation_is_deterministic_for_seed():
+    assert allocate_zipf(500, 20, 1.0, random.Random(7)) == allocate_zipf(
+        500, 20, 1.0, random.Random(7)
+    )
+
+
+def test_cap_limits_each_slot():
+    counts = allocate_zipf(1000, 50, 1.2, random.Random(1), cap=30)
+
+    assert max(counts) <= 30
+    assert sum(counts) == 1000
+
+
+def test_cap_smaller_than_total_fills_every_slot():
+    counts = allocate_zipf(1000, 10, 1.0, random.Random(1), cap=20)
+
+    assert counts == [20] * 10
+
+
+def test_empty_allocation():
+    assert allocate_zipf(100, 0, 1.0, random.Random(1)) == []
@@ -0,0 +1,27 @@
+"""
+댓글 구체화 경로 조각 테스트
+"""
+
+from apps.posts.models import (
+    COMMENT_PATH_SEGMENT_LENGTH,
+    MAX_COMMENT_DEPTH,
+    encode_comment_path_segment,
+)
+
+
+def test_segment_has_fixed_length():
+    assert encode_comment_path_segment(1) == "00000001"
+    assert encode_comment_path_segment(36) == "00000010"
+    assert encode_comment_path_segment(36**8 - 1) == "zzzzzzzz"
+
+
+def test_segment_order_matches_id_order():
+    ids = [1, 9, 10, 35, 36, 1295, 1296, 99999, 100000, 2**40]
+    segments = [encode_comment_path_segment(comment_id) for comment_id in ids]
+
+    assert all(len(segment) == COMMENT_PATH_SEGMENT_LENGTH for segment in segments)
+    assert segments == sorted(segments)
+
+
+def test_deepest_path_fits_path_column():
+    assert (MAX_COMMENT_DEPTH + 1) * COMMENT_PATH_SEGMENT_LENGTH <= 255
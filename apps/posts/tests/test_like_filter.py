@@ -0,0 +1,45 @@
+"""
+좋아요 Bloom 필터 테스트
+"""
+
+from apps.posts.like_filter import HEADER_MAGIC, BloomFilter, get_hash_count
+
+
+def test_added_items_are_always_found():
+    bloom = BloomFilter.for_capacity(1000, 0.01)
+    for item in range(1, 1001):
+        bloom.add(item)
+
+    assert all(item in bloom for item in range(1, 1001))
+
+
+def test_false_positive_rate_near_target():
+    bloom = BloomFilter.for_capacity(1000, 0.01)
+    for item in range(1, 1001):
+        bloom.add(item)
+
+    false_positives = sum(item in bloom for item in range(100001, 110001))
+    assert false_positives / 10000 < 0.03
+
+
+def test_empty_filter_contains_nothing():
+    bloom = BloomFilter.for_capacity(10, 0.01)
+
+    assert not any(item in bloom for item in range(1, 100))
+
+
+def test_bytes_round_trip_keeps_hash_count():
+    bloom = BloomFilter.for_capacity(100, 0.01)
+    bloom.add(42)
+
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+
+    assert restored.hash_count == bloom.hash_count == get_hash_count()
+    assert restored.bits == bloom.bits
+    assert 42 in restored
+
+
+def test_value_without_header_is_rejected():
+    assert BloomFilter.from_bytes(b"\x00" * 64) is None
+    assert BloomFilter.from_bytes(HEADER_MAGIC + b"\x00" + b"\x00" * 8) is None
+    assert BloomFilter.from_bytes(HEADER_MAGIC + b"\x07") is None
@@ -0,0 +1,47 @@
+"""
+쿼리 예산 테스트
+게시글 목록과 댓글 스레드가 목록 크기와 상관없이 예산 안의 쿼리로 처리되는지 점검
+"""
+
+import pytest
+
+from apps.posts.models import Comment, Post, PostStatus
+from apps.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def author():
+    return User.objects.create_user(
+        email="author@example.com", username="author", password="password"
+    )
+
+
+@pytest.fixture
+def post(author):
+    posts = [
+        Post.objects.create(
+            title=f"게시글 {index}",
+            content="내용",
+            author=author,
+            status=PostStatus.PUBLISHED,
+        )
+        for index in range(10)
+    ]
+    return posts[0]
+
+
+def test_post_list_within_budget(client, query_checks, author, post):
+    client.force_login(author)
+    response = client.get("/api/v1/posts/")
+    assert response.status_code == 200
+
+
+def test_comment_thread_within_budget(client, query_checks, author, post):
+    for index in range(10):
+        root = Comment.objects.create(post=post, author=author, content=f"댓글 {index}")
+        Comment.objects.create(post=post, author=author, content="답글", parent=root)
+
+    response = client.get(f"/api/v1/posts/{post.id}/comments/thread/")
+    assert response.status_code == 200
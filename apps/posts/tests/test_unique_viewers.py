@@ -0,0 +1,66 @@
+"""
+순 방문자 수 HyperLogLog 테스트
+"""
+
+import pytest
+from django.core.cache import cache
+
+from apps.posts.unique_viewers import CacheViewerStore, HyperLogLog
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def sketch_of(viewers):
+    sketch = HyperLogLog()
+    for viewer in viewers:
+        sketch.add(viewer)
+    return sketch
+
+
+def test_empty_sketch_counts_zero():
+    assert HyperLogLog().count() == 0
+
+
+def test_small_counts_are_nearly_exact():
+    assert abs(sketch_of(f"user:{index}" for index in range(100)).count() - 100) <= 2
+
+
+def test_large_count_within_error():
+    count = sketch_of(f"user:{index}" for index in range(20000)).count()
+
+    assert abs(count - 20000) / 20000 < 0.05
+
+
+def test_repeated_viewers_counted_once():
+    sketch = sketch_of(["user:1"] * 100)
+
+    assert not sketch.add("user:1")
+    assert sketch.count() == 1
+
+
+def test_merge_counts_union():
+    first = sketch_of(f"user:{index}" for index in range(0, 3000))
+    second = sketch_of(f"user:{index}" for index in range(2000, 5000))
+
+    first.merge(second)
+
+    assert abs(first.count() - 5000) / 5000 < 0.05
+
+
+def test_cache_store_count_many_matches_count():
+    store = CacheViewerStore()
+    days = [f"posts:viewers:1:2026100{day}" for day in range(1, 8)]
+    for offset, key in enumerate(days):
+        for index in range(offset * 50, offset * 50 + 100):
+            store.add(key, f"user:{index}")
+
+    key_groups = [days[-1:], days, days[:3], ["posts:viewers:1:missing"]]
+    counts = store.count_many(key_groups)
+
+    assert counts == [store.count(keys) for keys in key_groups]
+    assert counts[-1] == 0
@@ -0,0 +1,84 @@
+"""
+댓글 스레드 조회
+한 페이지의 루트 댓글 경로를 읽은 뒤(쿼리 1), 첫 루트부터 마지막 루트의 하위 스레드까지를
+(post, path) 인덱스 한 구간으로 깊이 제한과 함께 읽는다(쿼리 2).
+경로 순서가 곧 트리 순서이므로 한 번 훑으면서 중첩 구조를 만든다.
+"""
+
+import re
+from typing import Callable, List, Optional, Tuple
+
+from .models import Comment
+
+DEFAULT_MAX_DEPTH = 3
+MAX_DEPTH_LIMIT = 10
+PATH_RE = re.compile(r"^[0-9a-z]+$")
+# C 정렬에서 경로 문자(0-9, a-z)보다 뒤에 오는 문자 (하위 경로 구간의 끝)
+PATH_RANGE_END = "~"
+
+
+def load_comment_thread(
+    queryset,
+    post_id: int,
+    parent: Optional[Comment] = None,
+    after: Optional[str] = None,
+    limit: int = 20,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+) -> Tuple[List[Comment], Optional[str]]:
+    """
+    루트 댓글 한 페이지와 그 하위 댓글(루트 기준 max_depth 단계까지)을 경로 순으로 반환
+    parent 를 지정하면 그 댓글의 답글들을 루트로 사용한다.
+    (댓글 목록, 다음 페이지 커서(마지막 루트 경로))
+    """
+    root_depth = parent.depth + 1 if parent else 0
+    roots = Comment.objects.filter(post_id=post_id, depth=root_depth)
+    if parent:
+        roots = roots.filter(path__startswith=parent.path)
+    if after:
+        roots = roots.filter(path__gt=after)
+    root_paths = list(
+        roots.order_by("path").values_list("path", flat=True)[: limit + 1]
+    )
+
+    has_more = len(root_paths) > limit
+    root_paths = root_paths[:limit]
+    if not root_paths:
+        return [], None
+
+    comments = list(
+        queryset.filter(
+            post_id=post_id,
+            path__gte=root_paths[0],
+            path__lt=root_paths[-1] + PATH_RANGE_END,
+            depth__lte=root_depth + max_depth,
+        ).order_by("path")
+    )
+    return comments, root_paths[-1] if has_more else None
+
+
+def build_comment_tree(
+    comments: List[Comment], serialize: Callable[[List[Comment]], List[dict]]
+) -> List[dict]:
+    """
+    경로 순 댓글 목록을 replies 로 중첩된 트리로 변환
+    """
+    nodes = {}
+    roots = []
+    for comment, data in zip(comments, serialize(comments)):
+        data["replies"] = []
+        nodes[comment.id] = data
+        parent = nodes.get(comment.parent_id)
+        if parent is not None:
+            parent["replies"].append(data)
+        else:
+            roots.append(data)
+    return roots
+
+
+def parse_thread_cursor(value: Optional[str]) -> Optional[str]:
+    """
+    ?after= 커서 검증 (경로 문자만 허용)
+    """
+    if value and PATH_RE.match(value):
+        return value
+    return None
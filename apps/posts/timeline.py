@@ -0,0 +1,365 @@
+"""
+홈 타임라인 (fan-out-on-write)
+게시글이 발행되면 작성자와 팔로워들의 타임라인에 게시글 id 를 미리 넣어 두고,
+피드 조회는 자기 타임라인에서 id 한 페이지를 읽어 in_bulk 한 번으로 채운다.
+
+- 저장소: 운영은 Redis sorted set(timeline:{user_id}), Redis 를 쓸 수 없으면 timeline_entries 테이블
+- 점수: 게시일시(마이크로초 정수), 피드 커서도 같은 값을 사용
+- 발행 요청에서는 작성자 본인 타임라인에만 넣고, 팔로워 타임라인은 발행과 같은 트랜잭션에
+  넣은 fan-out 대기열(timeline_fanouts)을 fan_out_timelines 명령어가 요청 밖에서 처리
+- 팔로워가 TIMELINE_FANOUT_FOLLOWER_LIMIT 이상인 작성자는 미리 넣지 않고
+  피드 조회 시 (author, -published_at) 인덱스로 끌어와(pull) 합친다.
+- 오래된 항목은 trim_timelines 명령어로 주기적으로 정리
+"""
+
+import logging
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.core.redis_client import get_redis_client
+from apps.users.models import Follow
+
+from .models import Post, PostStatus, TimelineEntry, TimelineFanout
+
+logger = logging.getLogger(__name__)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+FANOUT_BATCH_SIZE = 1000
+# fan-out 대기열에서 한 트랜잭션에 처리할 게시글 수
+FANOUT_QUEUE_BATCH_SIZE = 100
+# 실패한 fan-out 재시도 간격 (초, 시도마다 두 배, 최대 1시간)
+FANOUT_RETRY_BASE_DELAY = 30
+FANOUT_RETRY_MAX_DELAY = 3600
+# 이 횟수만큼 실패하면 더 이상 재시도하지 않는다 (dead letter)
+FANOUT_MAX_ATTEMPTS = 8
+TRIM_BATCH_SIZE = 10000
+# 팔로우 시 타임라인에 채워 넣을 최근 게시글 수
+FOLLOW_BACKFILL_SIZE = 20
+
+PROLIFIC_AUTHORS_KEY = "timeline:prolific_authors"
+PROLIFIC_AUTHORS_TIMEOUT = 600
+
+TimelinePage = List[Tuple[int, int]]
+
+
+def to_score(published_at: datetime) -> int:
+    """
+    게시일시 -> 타임라인 점수 (마이크로초)
+    """
+    return (published_at - EPOCH) // timedelta(microseconds=1)
+
+
+def from_score(score: int) -> datetime:
+    """
+    타임라인 점수 -> 게시일시
+    """
+    return EPOCH + timedelta(microseconds=score)
+
+
+class RedisTimelineStore:
+    """
+    Redis sorted set 타임라인 저장소
+    쓰기마다 최근 max_length 개만 남기고 잘라낸다.
+    """
+
+    key_prefix = "timeline"
+
+    def __init__(self, client, max_length: int):
+        self.client = client
+        self.max_length = max_length
+
+    def key(self, user_id: int) -> str:
+        return f"{self.key_prefix}:{user_id}"
+
+    def add(self, user_ids: Iterable[int], post_id: int, score: int):
+        pipeline = self.client.pipeline(transaction=False)
+        for user_id in user_ids:
+            key = self.key(user_id)
+            pipeline.zadd(key, {post_id: score})
+            pipeline.zremrangebyrank(key, 0, -(self.max_length + 1))
+        pipeline.execute()
+
+    def remove(self, user_id: int, post_ids: List[int]):
+        if post_ids:
+            self.client.zrem(self.key(user_id), *post_ids)
+
+    def page(self, user_id: int, before: Optional[int], limit: int) -> TimelinePage:
+        rows = self.client.zrevrangebyscore(
+            self.key(user_id),
+            f"({before}" if before is not None else "+inf",
+            "-inf",
+            start=0,
+            num=limit,
+            withscores=True,
+        )
+        return [(int(member), int(score)) for member, score in rows]
+
+    def trim(self, cutoff: int) -> int:
+        removed = 0
+        pipeline = self.client.pipeline(transaction=False)
+        for index, key in enumerate(
+            self.client.scan_iter(match=f"{self.key_prefix}:*", count=1000), 1
+        ):
+            pipeline.zremrangebyscore(key, "-inf", f"({cutoff}")
+            if index % 1000 == 0:
+                removed += sum(pipeline.execute())
+        removed += sum(pipeline.execute())
+        return removed
+
+
+class DatabaseTimelineStore:
+    """
+    timeline_entries 테이블 타임라인 저장소
+    길이 제한 없이 쌓이므로 trim_timelines 로 보관 기간을 넘긴 항목을 지운다.
+    """
+
+    def add(self, user_ids: Iterable[int], post_id: int, score: int):
+        published_at = from_score(score)
+        TimelineEntry.objects.bulk_create(
+            [
+                TimelineEntry(
+                    user_id=user_id, post_id=post_id, published_at=published_at
+                )
+                for user_id in user_ids
+            ],
+            batch_size=FANOUT_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+    def remove(self, user_id: int, post_ids: List[int]):
+        if post_ids:
+            TimelineEntry.objects.filter(user_id=user_id, post_id__in=post_ids).delete()
+
+    def page(self, user_id: int, before: Optional[int], limit: int) -> TimelinePage:
+        queryset = TimelineEntry.objects.filter(user_id=user_id)
+        if before is not None:
+            queryset = queryset.filter(published_at__lt=from_score(before))
+        rows = queryset.order_by("-published_at", "-post_id").values_list(
+            "post_id", "published_at"
+        )
+        return [
+            (post_id, to_score(published_at)) for post_id, published_at in rows[:limit]
+        ]
+
+    def trim(self, cutoff: int) -> int:
+        removed = 0
+        queryset = TimelineEntry.objects.filter(published_at__lt=from_score(cutoff))
+        while True:
+            ids = list(queryset.values_list("id", flat=True)[:TRIM_BATCH_SIZE])
+            if not ids:
+                return removed
+            removed += TimelineEntry.objects.filter(id__in=ids).delete()[0]
+
+
+def get_timeline_store():
+    """
+    설정(TIMELINE_BACKEND)에 따른 타임라인 저장소
+    redis 로 설정되어 있어도 클라이언트를 만들 수 없으면 DB 저장소를 사용
+    """
+    if getattr(settings, "TIMELINE_BACKEND", "db") == "redis":
+        client = get_redis_client()
+        if client is not None:
+            return RedisTimelineStore(
+                client, getattr(settings, "TIMELINE_MAX_LENGTH", 800)
+            )
+        logger.warning("Redis 를 사용할 수 없어 DB 타임라인 저장소를 사용합니다.")
+    return DatabaseTimelineStore()
+
+
+def get_prolific_author_ids() -> Set[int]:
+    """
+    팔로워가 많아 fan-out 대신 pull 로 처리하는 작성자 id (캐시)
+    """
+    author_ids = cache.get(PROLIFIC_AUTHORS_KEY)
+    if author_ids is None:
+        threshold = getattr(settings, "TIMELINE_FANOUT_FOLLOWER_LIMIT", 10000)
+        author_ids = set(
+            Follow.objects.values("following_id")
+            .annotate(follower_count=Count("id"))
+            .filter(follower_count__gte=threshold)
+            .values_list("following_id", flat=True)
+        )
+        cache.set(PROLIFIC_AUTHORS_KEY, author_ids, PROLIFIC_AUTHORS_TIMEOUT)
+    return author_ids
+
+
+def fan_out_post(post: Post) -> int:
+    """
+    발행된 게시글을 작성자와 팔로워들의 타임라인에 추가
+    팔로워가 많은 작성자는 작성자 본인 타임라인에만 추가 (팔로워는 조회 시 pull)
+    추가한 타임라인 수를 반환
+    """
+    if post.status != PostStatus.PUBLISHED or post.published_at is None:
+        return 0
+
+    store = get_timeline_store()
+    score = to_score(post.published_at)
+    store.add([post.author_id], post.id, score)
+    if post.author_id in get_prolific_author_ids():
+        return 1
+
+    delivered = 1
+    follower_ids = (
+        Follow.objects.filter(following_id=post.author_id)
+        .values_list("follower_id", flat=True)
+        .iterator(chunk_size=FANOUT_BATCH_SIZE)
+    )
+    batch = []
+    for follower_id in follower_ids:
+        batch.append(follower_id)
+        if len(batch) >= FANOUT_BATCH_SIZE:
+            store.add(batch, post.id, score)
+            delivered += len(batch)
+            batch = []
+    if batch:
+        store.add(batch, post.id, score)
+        delivered += len(batch)
+    return delivered
+
+
+def schedule_fan_out(post: Post):
+    """
+    fan-out 대기열에 추가하고, 커밋 후에는 작성자 본인 타임라인에만 바로 추가
+    (팔로워 수만큼의 쓰기를 발행 요청에서 하지 않음)
+    """
+    TimelineFanout.objects.create(post=post)
+    transaction.on_commit(lambda: add_to_author_timeline(post))
+
+
+def add_to_author_timeline(post: Post):
+    """
+    작성자 본인 타임라인에 추가 (실패해도 발행은 이미 커밋되었으므로 로그만 남기고,
+    대기열 처리 때 다시 추가됨)
+    """
+    try:
+        get_timeline_store().add([post.author_id], post.id, to_score(post.published_at))
+    except Exception:
+        logger.exception("작성자 타임라인에 게시글 %s 를 추가하지 못했습니다.", post.id)
+
+
+def process_fan_out_queue(batch_size: int = FANOUT_QUEUE_BATCH_SIZE) -> Tuple[int, int]:
+    """
+    재시도 시각이 지난 fan-out 대기열을 batch_size 개 처리, (처리한 게시글 수, 실패한 게시글 수)
+    여러 프로세스가 동시에 실행해도 SKIP LOCKED 로 나눠 가지며,
+    실패한 항목은 지수 백오프로 다음 시도 시각을 미루고
+    FANOUT_MAX_ATTEMPTS 번 실패하면 대기열에 남겨 둔 채 더 이상 꺼내지 않는다.
+    """
+    processed = failed = 0
+    now = timezone.now()
+    with transaction.atomic():
+        tasks = list(
+            TimelineFanout.objects.select_for_update(skip_locked=True, of=("self",))
+            .filter(attempts__lt=FANOUT_MAX_ATTEMPTS, next_attempt_at__lte=now)
+            .select_related("post")
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        finished = []
+        for task in tasks:
+            try:
+                with transaction.atomic():
+                    fan_out_post(task.post)
+            except Exception:
+                logger.exception(
+                    "게시글 %s 의 타임라인 fan-out 에 실패했습니다.", task.post_id
+                )
+                _postpone_fan_out(task, now)
+                failed += 1
+            else:
+                finished.append(task.id)
+                processed += 1
+        TimelineFanout.objects.filter(id__in=finished).delete()
+    return processed, failed
+
+
+def _postpone_fan_out(task: TimelineFanout, now: datetime):
+    """실패한 fan-out 의 시도 횟수를 올리고 다음 시도 시각을 미룬다."""
+    task.attempts += 1
+    delay = min(
+        FANOUT_RETRY_BASE_DELAY * 2 ** (task.attempts - 1), FANOUT_RETRY_MAX_DELAY
+    )
+    task.next_attempt_at = now + timedelta(seconds=delay)
+    task.save(update_fields=["attempts", "next_attempt_at"])
+    if task.attempts >= FANOUT_MAX_ATTEMPTS:
+        logger.error(
+            "게시글 %s 의 타임라인 fan-out 이 %s 번 실패해 재시도를 중단합니다.",
+            task.post_id,
+            task.attempts,
+        )
+
+
+def _recent_published_posts(author_ids, before: Optional[int], limit: int):
+    queryset = Post.objects.filter(
+        author_id__in=author_ids,
+        status=PostStatus.PUBLISHED,
+        published_at__isnull=False,
+    )
+    if before is not None:
+        queryset = queryset.filter(published_at__lt=from_score(before))
+    return queryset.order_by("-published_at").values_list("id", "published_at")[:limit]
+
+
+def backfill_timeline(follower_id: int, author_id: int):
+    """
+    새로 팔로우한 작성자의 최근 게시글을 타임라인에 추가
+    """
+    if author_id in get_prolific_author_ids():
+        return
+    store = get_timeline_store()
+    for post_id, published_at in _recent_published_posts(
+        [author_id], None, FOLLOW_BACKFILL_SIZE
+    ):
+        store.add([follower_id], post_id, to_score(published_at))
+
+
+def remove_author_from_timeline(follower_id: int, author_id: int):
+    """
+    언팔로우한 작성자의 게시글을 타임라인에서 제거
+    """
+    max_length = getattr(settings, "TIMELINE_MAX_LENGTH", 800)
+    post_ids = [
+        post_id for post_id, _ in _recent_published_posts([author_id], None, max_length)
+    ]
+    get_timeline_store().remove(follower_id, post_ids)
+
+
+def get_timeline(
+    user_id: int, before: Optional[int] = None, limit: int = 20
+) -> Tuple[List[int], Optional[int]]:
+    """
+    타임라인 한 페이지의 (게시글 id 목록, 다음 페이지 커서)
+    미리 넣어 둔 항목과 팔로워가 많은 작성자에게서 끌어온 게시글을 게시일시 순으로 합친다.
+    """
+    entries = dict(get_timeline_store().page(user_id, before, limit))
+
+    prolific_author_ids = get_prolific_author_ids()
+    if prolific_author_ids:
+        pulled_author_ids = list(
+            Follow.objects.filter(
+                follower_id=user_id, following_id__in=prolific_author_ids
+            ).values_list("following_id", flat=True)
+        )
+        if pulled_author_ids:
+            for post_id, published_at in _recent_published_posts(
+                pulled_author_ids, before, limit
+            ):
+                entries[post_id] = to_score(published_at)
+
+    page = sorted(entries.items(), key=lambda item: (item[1], item[0]), reverse=True)
+    page = page[:limit]
+    next_before = page[-1][1] if len(page) == limit else None
+    return [post_id for post_id, _ in page], next_before
+
+
+def trim_timelines(retention_days: int) -> int:
+    """
+    보관 기간이 지난 타임라인 항목 삭제, 삭제한 항목 수를 반환
+    """
+    cutoff = to_score(timezone.now() - timedelta(days=retention_days))
+    return get_timeline_store().trim(cutoff)
@@ -0,0 +1,180 @@
+"""
+인기 게시글 (시간 감쇠 점수)
+HN 방식 점수 = (좋아요 x 가중치 + 댓글 x 가중치 + 조회수 x 가중치) / (경과 시간 + 2) ^ gravity
+
+compute_trending 명령어가 최근 TRENDING_WINDOW_HOURS 안에 발행된 게시글만
+(status, -published_at) 인덱스로 읽어 카테고리별(및 전체) 상위 K 개를 계산하고,
+trending_posts 테이블과 캐시에 순위를 통째로 다시 쓴다.
+조회는 캐시(없으면 테이블)에서 K 개의 id 를 읽어 채우므로 O(K) 이다.
+"""
+
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.metrics import record_cache_lookup
+
+from .counters import annotate_like_counts
+from .models import Category, Post, PostStatus, TrendingPost
+
+LIKE_WEIGHT = 3.0
+COMMENT_WEIGHT = 5.0
+VIEW_WEIGHT = 0.1
+# 발행 직후 게시글의 점수가 과도하게 커지지 않도록 경과 시간에 더하는 값
+AGE_OFFSET_HOURS = 2
+
+CACHE_KEY_PREFIX = "posts:trending"
+ALL_CATEGORIES = "all"
+
+TrendingEntries = List[Tuple[int, float]]
+
+
+def get_trending_settings() -> Tuple[int, int, float]:
+    """
+    (상위 K, 계산 대상 기간(시간), gravity)
+    """
+    return (
+        getattr(settings, "TRENDING_TOP_K", 50),
+        getattr(settings, "TRENDING_WINDOW_HOURS", 72),
+        getattr(settings, "TRENDING_GRAVITY", 1.8),
+    )
+
+
+def calculate_score(
+    like_count: int, comment_count: int, view_count: int, age_hours: float, gravity
+) -> float:
+    """
+    시간 감쇠 점수
+    """
+    points = (
+        like_count * LIKE_WEIGHT
+        + comment_count * COMMENT_WEIGHT
+        + view_count * VIEW_WEIGHT
+    )
+    return points / (max(age_hours, 0) + AGE_OFFSET_HOURS) ** gravity
+
+
+def cache_key(category_id: Optional[int]) -> str:
+    return f"{CACHE_KEY_PREFIX}:{category_id or ALL_CATEGORIES}"
+
+
+def compute_trending() -> Dict[Optional[int], TrendingEntries]:
+    """
+    카테고리별(None 은 전체) 상위 K 개 (게시글 id, 점수) 계산
+    """
+    top_k, window_hours, gravity = get_trending_settings()
+    now = timezone.now()
+    # 좋아요 수는 아직 합산되지 않은 샤드 증감분까지 더한 값
+    rows = (
+        annotate_like_counts(
+            Post.objects.filter(
+                status=PostStatus.PUBLISHED,
+                published_at__gte=now - timedelta(hours=window_hours),
+            )
+        )
+        .values_list(
+            "id",
+            "category_id",
+            "like_count",
+            "pending_like_delta",
+            "comment_count",
+            "view_count",
+            "published_at",
+        )
+        .iterator(chunk_size=5000)
+    )
+
+    # 카테고리별 크기 K 의 최소 힙 (가장 낮은 점수를 밀어냄)
+    heaps: Dict[Optional[int], List[Tuple[float, int]]] = {None: []}
+    for post_id, category_id, likes, pending, comments, views, published_at in rows:
+        age_hours = (now - published_at).total_seconds() / 3600
+        score = calculate_score(
+            max(likes + pending, 0), comments, views, age_hours, gravity
+        )
+        targets = (None,) if category_id is None else (None, category_id)
+        for target in targets:
+            heap = heaps.setdefault(target, [])
+            if len(heap) < top_k:
+                heapq.heappush(heap, (score, post_id))
+            elif score > heap[0][0]:
+                heapq.heapreplace(heap, (score, post_id))
+
+    return {
+        category_id: [
+            (post_id, score)
+            for score, post_id in sorted(heap, key=lambda item: (-item[0], -item[1]))
+        ]
+        for category_id, heap in heaps.items()
+    }
+
+
+def store_trending(rankings: Dict[Optional[int], TrendingEntries]) -> int:
+    """
+    순위를 trending_posts 테이블과 캐시에 다시 씀, 저장한 행 수를 반환
+    순위에 없는 카테고리는 빈 목록으로 캐시해 조회 시 테이블을 읽지 않게 한다.
+    """
+    computed_at = timezone.now()
+    rows = [
+        TrendingPost(
+            category_id=category_id,
+            post_id=post_id,
+            rank=rank,
+            score=score,
+            computed_at=computed_at,
+        )
+        for category_id, entries in rankings.items()
+        for rank, (post_id, score) in enumerate(entries, 1)
+    ]
+    with transaction.atomic():
+        TrendingPost.objects.all().delete()
+        TrendingPost.objects.bulk_create(rows, batch_size=1000)
+
+    category_ids = [None, *Category.objects.values_list("id", flat=True)]
+    cache.set_many(
+        {
+            cache_key(category_id): {
+                "computed_at": computed_at,
+                "entries": rankings.get(category_id, []),
+            }
+            for category_id in category_ids
+        },
+        None,
+    )
+    return len(rows)
+
+
+def get_trending(
+    category_id: Optional[int] = None,
+) -> Tuple[TrendingEntries, Optional[datetime]]:
+    """
+    저장된 순위의 (게시글 id/점수 목록, 계산일시)
+    캐시에 없으면 trending_posts 테이블에서 읽어 캐시에 채운다.
+    없는 카테고리는 캐시하지 않는다. (임의의 id 로 캐시 키가 늘어나지 않도록)
+    """
+    cached = cache.get(cache_key(category_id))
+    if cached is not None:
+        record_cache_lookup(CACHE_KEY_PREFIX, hits=1)
+        return cached["entries"], cached["computed_at"]
+    record_cache_lookup(CACHE_KEY_PREFIX, hits=0, misses=1)
+
+    rows = list(
+        TrendingPost.objects.filter(category_id=category_id)
+        .order_by("rank")
+        .values_list("post_id", "score", "computed_at")
+    )
+    if not rows and (
+        category_id is not None and not Category.objects.filter(id=category_id).exists()
+    ):
+        return [], None
+
+    entries = [(post_id, score) for post_id, score, _ in rows]
+    computed_at = rows[0][2] if rows else None
+    cache.set(
+        cache_key(category_id), {"computed_at": computed_at, "entries": entries}, None
+    )
+    return entries, computed_at
@@ -22,6 +22,11 @@ urlpatterns = [
         views.CommentListCreateView.as_view(),
         name="post-comments",
     ),
+    path(
+        "<int:post_id>/comments/thread/",
+        views.CommentThreadView.as_view(),
+        name="post-comment-thread",
+    ),
     path(
         "comments/<int:comment_id>/",
         views.CommentDetailView.as_view(),
@@ -0,0 +1,545 @@
+"""
+게시글 조회수 버퍼
+조회수 증가분을 캐시(운영: Redis, 개발: LocMem) 또는 프로세스 메모리에 모아 두었다가
+주기적으로 한 번의 UPDATE ... FROM (VALUES ...) 문으로 posts.view_count 에 반영한다.
+반영한 증가분은 조회가 기록된 날짜의 일별 통계(post_daily_stats, author_daily_stats)에도
+같은 트랜잭션에서 더한다.
+DB 반영에 실패한 배치는 버퍼로 되돌려 다음 반영 때 다시 시도한다.
+"""
+
+import atexit
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import date, datetime
+from datetime import timezone as dt_timezone
+from typing import Dict, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+
+from apps.core.redis_client import get_redis_client
+
+from .models import Post
+from .rollups import record_daily_views
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL = 10
+UPDATE_BATCH_SIZE = 1000
+
+CACHE_KEY_PREFIX = "posts:views"
+FLUSH_LOCK_KEY = f"{CACHE_KEY_PREFIX}:flush_lock"
+FLUSHED_BUCKET_KEY = f"{CACHE_KEY_PREFIX}:flushed_bucket"
+RETRY_KEY = f"{CACHE_KEY_PREFIX}:retry"
+LOST_TOTAL_KEY = f"{CACHE_KEY_PREFIX}:lost"
+WORKERS_KEY = f"{CACHE_KEY_PREFIX}:workers"
+
+# 날짜 -> 게시글 id -> 조회수 증가분
+DailyIncrements = Dict[date, Dict[int, int]]
+
+# 닫힌 버킷을 몇 개까지 거슬러 올라가 반영할지 (그 이전 버킷은 캐시 만료로 간주)
+MAX_BACKLOG_BUCKETS = 60
+
+
+# 토큰이 같을 때만 락 삭제 (다른 프로세스가 다시 잡은 락은 지우지 않음)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def get_flush_interval() -> int:
+    """
+    조회수 반영 주기(초)
+    """
+    return max(
+        1, getattr(settings, "POST_VIEW_COUNT_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL)
+    )
+
+
+def get_flush_lock_timeout() -> int:
+    """
+    반영 락 유효 시간(초)
+    반영이 오래 걸려도 락이 먼저 풀리지 않도록 넉넉히 두되,
+    잡은 프로세스가 죽었을 때 밀린 버킷이 보관 범위를 벗어나기 전에 풀리게 한다.
+    """
+    return max(get_flush_interval() * MAX_BACKLOG_BUCKETS // 2, 60)
+
+
+def acquire_flush_lock() -> Optional[str]:
+    """
+    반영 락 획득, 성공하면 해제할 때 쓸 토큰을 반환
+    """
+    token = uuid.uuid4().hex
+    client = get_redis_client()
+    if client is not None:
+        acquired = client.set(
+            FLUSH_LOCK_KEY, token, nx=True, ex=get_flush_lock_timeout()
+        )
+    else:
+        acquired = cache.add(FLUSH_LOCK_KEY, token, get_flush_lock_timeout())
+    return token if acquired else None
+
+
+def release_flush_lock(token: str):
+    """
+    아직 이 토큰의 락일 때만 해제 (Redis 가 있으면 원자적으로 비교 후 삭제)
+    """
+    client = get_redis_client()
+    if client is not None:
+        client.eval(RELEASE_LOCK_SCRIPT, 1, FLUSH_LOCK_KEY, token)
+        return
+    if cache.get(FLUSH_LOCK_KEY) == token:
+        cache.delete(FLUSH_LOCK_KEY)
+
+
+def merge_increments(target: DailyIncrements, increments: DailyIncrements):
+    """
+    날짜/게시글별 증가분을 target 에 더함
+    """
+    for day, counts in increments.items():
+        day_counts = target.setdefault(day, {})
+        for post_id, amount in counts.items():
+            day_counts[post_id] = day_counts.get(post_id, 0) + amount
+
+
+def total_increments(increments: DailyIncrements) -> int:
+    return sum(sum(counts.values()) for counts in increments.values())
+
+
+_workers_lock = threading.Lock()
+
+
+def register_worker(worker_id: str):
+    """
+    워커 등록 (Redis 가 있으면 SADD 로 원자적으로 추가)
+    """
+    client = get_redis_client()
+    if client is not None:
+        client.sadd(WORKERS_KEY, worker_id)
+        return
+    # 캐시 읽기-수정-쓰기는 프로세스 안에서만 안전 (LocMem 등 단일 프로세스 개발 환경)
+    with _workers_lock:
+        workers = cache.get(WORKERS_KEY) or set()
+        if worker_id not in workers:
+            workers.add(worker_id)
+            cache.set(WORKERS_KEY, workers, None)
+
+
+def unregister_workers(worker_ids: Set[str]):
+    """
+    워커 등록 해제 (Redis 가 있으면 SREM)
+    """
+    if not worker_ids:
+        return
+    client = get_redis_client()
+    if client is not None:
+        client.srem(WORKERS_KEY, *worker_ids)
+        return
+    with _workers_lock:
+        workers = cache.get(WORKERS_KEY) or set()
+        cache.set(WORKERS_KEY, workers - set(worker_ids), None)
+
+
+def get_registered_workers() -> Set[str]:
+    client = get_redis_client()
+    if client is not None:
+        return {worker_id.decode() for worker_id in client.smembers(WORKERS_KEY)}
+    return cache.get(WORKERS_KEY) or set()
+
+
+def _cache_incr(key: str, amount: int, timeout: int) -> int:
+    """
+    키가 없으면 생성하는 캐시 증가 연산
+    """
+    if cache.add(key, amount, timeout):
+        return amount
+    try:
+        return cache.incr(key, amount)
+    except ValueError:
+        # add 와 incr 사이에 만료된 경우
+        cache.set(key, amount, timeout)
+        return amount
+
+
+class CacheViewCountBuffer:
+    """
+    캐시 기반 조회수 버퍼
+    반영 주기 단위 버킷마다 게시글별 증가분과 슬롯 목록을 기록하므로
+    웹 프로세스가 종료되어도 증가분이 유실되지 않는다.
+    """
+
+    def __init__(self, flush_interval: int):
+        self.flush_interval = flush_interval
+        self.key_timeout = max(flush_interval * (MAX_BACKLOG_BUCKETS + 2), 3600)
+
+    def _current_bucket(self) -> int:
+        return int(time.time() // self.flush_interval)
+
+    def _key(self, bucket: int, name: str) -> str:
+        return f"{CACHE_KEY_PREFIX}:{bucket}:{name}"
+
+    def _bucket_date(self, bucket: int) -> date:
+        """
+        버킷이 시작된 시각의 (현지) 날짜
+        """
+        started = datetime.fromtimestamp(
+            bucket * self.flush_interval, tz=dt_timezone.utc
+        )
+        return timezone.localdate(started)
+
+    def record(self, post_id: int, amount: int = 1):
+        """
+        조회수 증가분 기록
+        """
+        bucket = self._current_bucket()
+        count_key = self._key(bucket, f"count:{post_id}")
+
+        if cache.add(count_key, amount, self.key_timeout):
+            # 버킷에서 처음 조회된 게시글이면 슬롯을 할당해 반영 대상에 등록
+            slot = _cache_incr(self._key(bucket, "slots"), 1, self.key_timeout)
+            cache.set(self._key(bucket, f"slot:{slot}"), post_id, self.key_timeout)
+        else:
+            _cache_incr(count_key, amount, self.key_timeout)
+
+        _cache_incr(self._key(bucket, "total"), amount, self.key_timeout)
+
+    def drain(self) -> DailyIncrements:
+        """
+        닫힌 버킷과 지난 반영에서 되돌린 증가분을 꺼내 버킷 날짜/게시글별로 합산
+        늦게 도착한 쓰기를 고려해 현재 버킷과 직전 버킷은 남겨 둔다.
+        """
+        last_closed = self._current_bucket() - 2
+        flushed = cache.get(FLUSHED_BUCKET_KEY)
+        first = last_closed - MAX_BACKLOG_BUCKETS + 1
+        if flushed is not None:
+            first = max(first, flushed + 1)
+
+        increments: DailyIncrements = {}
+        retry = cache.get(RETRY_KEY)
+        if retry:
+            merge_increments(increments, retry)
+            cache.delete(RETRY_KEY)
+        for bucket in range(first, last_closed + 1):
+            self._drain_bucket(
+                bucket, increments.setdefault(self._bucket_date(bucket), {})
+            )
+
+        if last_closed >= first:
+            cache.set(FLUSHED_BUCKET_KEY, last_closed, self.key_timeout)
+        return {day: counts for day, counts in increments.items() if counts}
+
+    def _drain_bucket(self, bucket: int, increments: Dict[int, int]):
+        slots = cache.get(self._key(bucket, "slots"))
+        if not slots:
+            return
+
+        slot_keys = [self._key(bucket, f"slot:{slot}") for slot in range(1, slots + 1)]
+        post_ids = list(cache.get_many(slot_keys).values())
+        count_keys = {self._key(bucket, f"count:{pid}"): pid for pid in post_ids}
+        counts = cache.get_many(list(count_keys))
+        total_key = self._key(bucket, "total")
+        total = cache.get(total_key) or 0
+
+        drained = 0
+        for key, amount in counts.items():
+            post_id = count_keys[key]
+            increments[post_id] = increments.get(post_id, 0) + amount
+            drained += amount
+
+        # 캐시 축출로 사라진 증가분은 버킷 합계와의 차이로 계산
+        if total > drained:
+            record_lost_increments(total - drained, reason=f"bucket {bucket} evicted")
+
+        cache.delete_many(
+            slot_keys + list(count_keys) + [total_key, self._key(bucket, "slots")]
+        )
+
+    def restore(self, increments: DailyIncrements):
+        """
+        반영하지 못한 증가분을 되돌려 둠 (반영 락을 잡은 상태에서 호출)
+        """
+        retry = cache.get(RETRY_KEY) or {}
+        merge_increments(retry, increments)
+        cache.set(RETRY_KEY, retry, self.key_timeout)
+
+    def close(self):
+        """
+        캐시 버퍼는 프로세스 종료 시 처리할 것이 없음
+        """
+
+
+class LocalViewCountBuffer:
+    """
+    프로세스 메모리 기반 조회수 버퍼
+    캐시 왕복조차 없이 증가분을 모으는 대신, 프로세스가 비정상 종료되면
+    마지막 반영 이후의 증가분이 유실된다. 유실량을 알 수 있도록 미반영 개수를
+    주기적으로 캐시에 체크포인트로 남긴다.
+    요청이 없는 동안에도 반영 타이머 스레드가 반영 주기마다 남은 증가분을 반영하고
+    하트비트를 남기므로, 한가한 워커가 종료된 워커로 잘못 집계되지 않는다.
+    """
+
+    CHECKPOINT_INTERVAL = 1.0
+
+    def __init__(self, flush_interval: int):
+        self.flush_interval = flush_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._pending: DailyIncrements = {}
+        self._pending_total = 0
+        self._lock = threading.Lock()
+        self._last_checkpoint = 0.0
+        self._stopped = threading.Event()
+        self._register()
+        self._timer = threading.Thread(
+            target=self._run_timer, name="view-count-flush", daemon=True
+        )
+        self._timer.start()
+
+    def _worker_key(self) -> str:
+        return f"{CACHE_KEY_PREFIX}:worker:{self.worker_id}"
+
+    def _register(self):
+        register_worker(self.worker_id)
+        self._checkpoint(force=True)
+
+    def _run_timer(self):
+        """
+        반영 타이머 (반영 주기마다 남은 증가분 반영, 없으면 하트비트만)
+        """
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                if self._pending_total:
+                    flush_post_view_counts()
+                else:
+                    self._checkpoint(force=True)
+                # 하트비트가 늦어 종료된 워커로 처리됐더라도 다시 등록
+                register_worker(self.worker_id)
+            except Exception:
+                logger.exception("조회수 반영 타이머 실행 중 오류가 발생했습니다.")
+            finally:
+                # 타이머 스레드의 DB 연결은 다음 주기까지 들고 있지 않음
+                connection.close()
+
+    def _checkpoint(self, force: bool = False):
+        now = time.time()
+        if not force and now - self._last_checkpoint < self.CHECKPOINT_INTERVAL:
+            return
+        self._last_checkpoint = now
+        cache.set(
+            self._worker_key(),
+            {"pending": self._pending_total, "heartbeat": now},
+            None,
+        )
+
+    def record(self, post_id: int, amount: int = 1):
+        """
+        조회수 증가분 기록
+        """
+        today = timezone.localdate()
+        with self._lock:
+            pending = self._pending.setdefault(today, {})
+            pending[post_id] = pending.get(post_id, 0) + amount
+            self._pending_total += amount
+        self._checkpoint()
+
+    def drain(self) -> DailyIncrements:
+        """
+        모아 둔 증가분을 꺼냄 (날짜/게시글별)
+        """
+        with self._lock:
+            increments, self._pending = self._pending, {}
+            self._pending_total = 0
+        self._checkpoint(force=True)
+        return increments
+
+    def restore(self, increments: DailyIncrements):
+        """
+        반영하지 못한 증가분을 되돌려 둠
+        """
+        with self._lock:
+            merge_increments(self._pending, increments)
+            self._pending_total += total_increments(increments)
+        self._checkpoint(force=True)
+
+    def close(self):
+        """
+        정상 종료 시 남은 증가분을 반영하고 워커 등록 해제
+        """
+        self._stopped.set()
+        _, unapplied = apply_view_increments(self.drain())
+        if unapplied:
+            record_lost_increments(
+                total_increments(unapplied), reason=f"worker {self.worker_id} shutdown"
+            )
+        cache.delete(self._worker_key())
+        unregister_workers({self.worker_id})
+
+
+def collect_lost_increments() -> int:
+    """
+    하트비트가 끊긴 워커(비정상 종료)의 마지막 체크포인트를 유실량으로 집계
+    """
+    stale_after = max(get_flush_interval() * 3, 30)
+    now = time.time()
+    workers = get_registered_workers()
+
+    lost = 0
+    dead_workers = set()
+    for worker_id in workers:
+        checkpoint = cache.get(f"{CACHE_KEY_PREFIX}:worker:{worker_id}")
+        if checkpoint is None or now - checkpoint["heartbeat"] > stale_after:
+            dead_workers.add(worker_id)
+            if checkpoint and checkpoint["pending"]:
+                lost += checkpoint["pending"]
+                record_lost_increments(
+                    checkpoint["pending"], reason=f"worker {worker_id} crashed"
+                )
+            cache.delete(f"{CACHE_KEY_PREFIX}:worker:{worker_id}")
+
+    unregister_workers(dead_workers)
+    return lost
+
+
+def record_lost_increments(amount: int, reason: str):
+    """
+    유실된 조회수 기록
+    """
+    _cache_incr(LOST_TOTAL_KEY, amount, None)
+    logger.warning("조회수 증가분 %d건 유실 (%s)", amount, reason)
+
+
+def get_lost_increments() -> int:
+    """
+    지금까지 집계된 유실 조회수
+    """
+    return cache.get(LOST_TOTAL_KEY) or 0
+
+
+def apply_view_increments(
+    increments: DailyIncrements,
+) -> Tuple[int, DailyIncrements]:
+    """
+    날짜/게시글별 증가분을 posts.view_count 와 그 날짜의 일별 통계에 일괄 반영
+    배치마다 두 쓰기를 한 트랜잭션으로 묶어 한쪽만 반영되지 않게 한다.
+    DB 오류가 나면 그 배치부터는 반영하지 않는다.
+    (갱신된 게시글 수, 반영하지 못한 증가분)을 반환
+    """
+    updated = 0
+    unapplied: DailyIncrements = {}
+    for day, counts in sorted(increments.items()):
+        items = [(post_id, amount) for post_id, amount in counts.items() if amount]
+        for start in range(0, len(items), UPDATE_BATCH_SIZE):
+            batch = items[start : start + UPDATE_BATCH_SIZE]
+            if not unapplied:
+                try:
+                    with transaction.atomic():
+                        if connection.vendor == "postgresql":
+                            updated += _apply_batch_postgresql(batch)
+                        else:
+                            updated += _apply_batch_generic(batch)
+                        record_daily_views(dict(batch), day)
+                    continue
+                except DatabaseError:
+                    logger.exception("조회수 증가분을 DB 에 반영하지 못했습니다.")
+            merge_increments(unapplied, {day: dict(batch)})
+    return updated, unapplied
+
+
+def _apply_batch_postgresql(batch) -> int:
+    values = ", ".join(["(%s::bigint, %s::integer)"] * len(batch))
+    params = [value for row in batch for value in row]
+    sql = (
+        "UPDATE posts AS p SET view_count = p.view_count + v.delta "
+        f"FROM (VALUES {values}) AS v(id, delta) "
+        "WHERE p.id = v.id"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+def _apply_batch_generic(batch) -> int:
+    delta = Case(
+        *[When(id=post_id, then=Value(amount)) for post_id, amount in batch],
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    return Post.objects.filter(id__in=[post_id for post_id, _ in batch]).update(
+        view_count=F("view_count") + delta
+    )
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def get_view_count_buffer():
+    """
+    설정에 따른 조회수 버퍼 (프로세스당 하나)
+    """
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                backend = getattr(settings, "POST_VIEW_COUNT_BUFFER", "cache")
+                buffer_class = (
+                    LocalViewCountBuffer if backend == "local" else CacheViewCountBuffer
+                )
+                _buffer = buffer_class(get_flush_interval())
+                atexit.register(_buffer.close)
+    return _buffer
+
+
+def record_post_view(post_id: int, amount: int = 1):
+    """
+    게시글 조회 기록
+    반영 주기가 지났으면 요청 처리 중에 한 번 반영을 시도한다.
+    """
+    get_view_count_buffer().record(post_id, amount)
+    if time.monotonic() - _last_flush >= get_flush_interval():
+        flush_post_view_counts()
+
+
+def flush_post_view_counts() -> Optional[Dict[str, int]]:
+    """
+    버퍼의 증가분을 DB 에 반영
+    반영하지 못한 증가분은 버퍼로 되돌려 다음 반영 때 다시 시도한다.
+    다른 프로세스가 반영 중이면 None 을 반환
+    """
+    global _last_flush
+    _last_flush = time.monotonic()
+
+    buffer = get_view_count_buffer()
+    lock_token = None
+    if isinstance(buffer, CacheViewCountBuffer):
+        lock_token = acquire_flush_lock()
+        if lock_token is None:
+            return None
+
+    try:
+        increments = buffer.drain()
+        updated, unapplied = apply_view_increments(increments)
+        if unapplied:
+            buffer.restore(unapplied)
+        lost = collect_lost_increments()
+    finally:
+        if lock_token is not None:
+            release_flush_lock(lock_token)
+
+    requeued = total_increments(unapplied)
+    return {
+        "posts": updated,
+        "increments": total_increments(increments) - requeued,
+        "requeued": requeued,
+        "lost": lost,
+    }
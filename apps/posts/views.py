@@ -5,59 +5,342 @@ Posts 앱 뷰
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
-from apps.core.utils import create_response
+from apps.core.autocomplete import (
+    autocomplete,
+    get_cached_autocomplete,
+    get_limit,
+    normalize_query,
+)
+from apps.core.cache import CachedRepresentationListMixin
+from apps.core.conditional import ConditionalGetMixin
+from apps.core.pagination import (
+    EstimatedPageNumberPagination,
+    KeysetPagination,
+    OptionalKeysetPagination,
+)
+from apps.core.query_checks import query_budget
+from apps.core.serializers import SparseFieldsetViewMixin
+from apps.core.utils import create_error_response, create_response
 
-from .models import Category, Comment, Post, PostLike, Tag
+from .caching import POST_VOLATILE_FIELDS, post_representation_cache
+from .counters import annotate_like_counts, get_merged_like_count, toggle_post_like
+from .like_status import get_liked_post_ids
+from .models import (
+    MAX_COMMENT_DEPTH,
+    Category,
+    Comment,
+    Post,
+    PostDailyStats,
+    PostStatus,
+    Tag,
+)
+from .rollups import get_daily_stats, parse_date_range, sum_daily_stats
+from .search import search_posts
 from .serializers import (
     CategorySerializer,
     CommentSerializer,
+    CommentThreadSerializer,
+    PostListSerializer,
+    PostSearchResultSerializer,
     PostSerializer,
     TagSerializer,
 )
+from .threads import (
+    DEFAULT_MAX_DEPTH,
+    MAX_DEPTH_LIMIT,
+    build_comment_tree,
+    load_comment_thread,
+    parse_thread_cursor,
+)
+from .timeline import get_timeline
+from .trending import get_trending
+from .unique_viewers import (
+    get_daily_unique_viewers,
+    get_unique_viewer_summary,
+    record_unique_viewer,
+)
+from .view_counter import record_post_view
+
+# 좋아요 여부 일괄 조회 시 한 번에 받을 수 있는 게시글 수
+MAX_LIKE_STATUS_IDS = 100
+# 게시글 통계의 일별 통계 기간 (일, 순 방문자 수 스케치 보관 기간 이내)
+DEFAULT_STATS_DAYS = 7
+MAX_STATS_DAYS = 90
 
 
-class PostViewSet(viewsets.ModelViewSet):
+def create_like_toggle_response(post_id: int, user_id: int):
+    """
+    좋아요 토글 후 표준 응답 생성
+    """
+    is_liked, like_count = toggle_post_like(post_id, user_id)
+    message = "좋아요를 눌렀습니다." if is_liked else "좋아요를 취소했습니다."
+
+    return create_response(
+        success=True,
+        message=message,
+        data={"is_liked": is_liked, "like_count": like_count},
+    )
+
+
+class PostViewSet(
+    ConditionalGetMixin,
+    SparseFieldsetViewMixin,
+    CachedRepresentationListMixin,
+    viewsets.ModelViewSet,
+):
     """
     게시글 ViewSet
     """
 
-    queryset = Post.objects.select_related("author", "category").prefetch_related(
-        "tags"
+    queryset = annotate_like_counts(
+        Post.objects.select_related("author", "category").prefetch_related("tags")
     )
     serializer_class = PostSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    # 같은 prefix 의 다른 경로(profile/, categories/ 등)를 상세 조회가 가로채지 않도록 숫자만 허용
+    lookup_value_regex = r"\d+"
+    pagination_class = OptionalKeysetPagination
+    # (-created_at, -id) 인덱스를 따라가도록 id 를 동점 해소용으로 추가
+    # (?status= 필터가 있으면 (status, -created_at) 인덱스 사용)
+    keyset_ordering = ("-created_at", "-id")
+    filterset_fields = ["status", "category", "author"]
+    representation_cache = post_representation_cache
+    volatile_fields = POST_VOLATILE_FIELDS
+    etag_namespace = "posts"
+
+    def get_serializer_class(self):
+        """
+        목록 조회는 요약 시리얼라이저 사용
+        """
+        if self.action in ("list", "feed", "trending"):
+            return PostListSerializer
+        if self.action == "search":
+            return PostSearchResultSerializer
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        """
+        목록/검색/피드/인기 조회는 요약에 필요한 컬럼만 조회
+        """
+        queryset = super().get_queryset()
+        if self.action in ("list", "search", "feed", "trending"):
+            queryset = queryset.only(*self.get_serializer_class().only_fields)
+        return queryset
+
+    def get_etag_extra(self):
+        """
+        상세 응답의 순 방문자 수 요약 (짧게 캐시되며 세대 토큰과 따로 바뀜)
+        """
+        if self.action == "retrieve":
+            return get_unique_viewer_summary(int(self.kwargs["pk"]))
+        return ""
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        게시글 상세 조회 (본문을 내려준 경우에만 조회수/순 방문자 기록)
+        """
+        response = super().retrieve(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            post_id = response.data["id"]
+            record_post_view(post_id)
+            record_unique_viewer(post_id, request)
+            response.data["unique_viewers"] = get_unique_viewer_summary(post_id)
+        return response
+
+    # 현재 페이지의 좋아요한 게시글 id (load_liked_post_ids 호출 전에는 None)
+    liked_post_ids = None
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.liked_post_ids is not None:
+            context["liked_post_ids"] = self.liked_post_ids
+        return context
+
+    def load_liked_post_ids(self, objects):
+        """
+        목록 한 페이지의 좋아요 여부를 한 번에 조회해 직렬화 컨텍스트에 넣음
+        """
+        user = self.request.user
+        if not user.is_authenticated:
+            self.liked_post_ids = set()
+            return
+        self.liked_post_ids = get_liked_post_ids(user.id, [obj.pk for obj in objects])
+
+    def get_cached_representations(self, objects, prefetch_lookups=()):
+        self.load_liked_post_ids(objects)
+        return super().get_cached_representations(objects, prefetch_lookups)
 
     def perform_create(self, serializer):
         """
-        게시글 생성 시 작성자 설정
+        게시글 생성 시 작성자 설정 (발행 상태로 생성하면 발행 처리)
         """
-        serializer.save(author=self.request.user)
+        post = serializer.save(author=self.request.user)
+        if post.status == PostStatus.PUBLISHED:
+            post.publish()
 
-    @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated])
-    def like(self, request, pk=None):
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
+    def feed(self, request):
         """
-        게시글 좋아요/취소
+        홈 타임라인 (?before=커서, 팔로우한 사용자와 내 게시글의 발행 순)
         """
-        post = self.get_object()
-        like, created = PostLike.objects.get_or_create(user=request.user, post=post)
+        try:
+            before = int(request.query_params["before"])
+        except (KeyError, ValueError):
+            before = None
+        limit = self.paginator.keyset_class().get_page_size(request)
 
-        if not created:
-            like.delete()
-            message = "좋아요를 취소했습니다."
-            is_liked = False
-        else:
-            message = "좋아요를 눌렀습니다."
-            is_liked = True
+        post_ids, next_before = get_timeline(request.user.id, before, limit)
+
+        next_url = None
+        if next_before is not None:
+            next_url = replace_query_param(
+                request.build_absolute_uri(), "before", next_before
+            )
+        return Response(
+            {"next": next_url, "results": self.get_published_representations(post_ids)}
+        )
 
-        return create_response(
-            success=True,
-            message=message,
-            data={"is_liked": is_liked, "like_count": post.like_count},
+    @action(detail=False, methods=["get"])
+    def trending(self, request):
+        """
+        인기 게시글 (?category=카테고리 id, 주기적으로 계산해 둔 상위 K 개)
+        """
+        category_id = request.query_params.get("category") or None
+        if category_id is not None:
+            try:
+                category_id = int(category_id)
+            except ValueError:
+                return create_error_response(
+                    "카테고리 id 가 올바르지 않습니다.", error_code="INVALID_CATEGORY"
+                )
+
+        entries, computed_at = get_trending(category_id)
+        post_ids = [post_id for post_id, _ in entries]
+        return Response(
+            {
+                "computed_at": computed_at,
+                "results": self.get_published_representations(post_ids),
+            }
         )
 
+    def get_published_representations(self, post_ids):
+        """
+        id 순서대로 발행된 게시글을 in_bulk 한 번으로 읽어 직렬화 (직렬화 캐시 사용)
+        그 사이 삭제/비공개된 게시글은 제외
+        """
+        queryset = self.get_queryset().filter(status=PostStatus.PUBLISHED)
+        # prefetch 는 직렬화 캐시 누락분에만 수행
+        prefetch_lookups = queryset._prefetch_related_lookups
+        posts = queryset.prefetch_related(None).in_bulk(post_ids)
+        objects = [posts[post_id] for post_id in post_ids if post_id in posts]
+        return self.get_cached_representations(objects, prefetch_lookups)
+
+    @action(detail=False, methods=["get"])
+    def search(self, request):
+        """
+        게시글 전문 검색 (?q=검색어, 관련도 순)
+        """
+        query_text = request.query_params.get("q", "").strip()
+        if not query_text:
+            return create_error_response(
+                "검색어를 입력해주세요.", error_code="SEARCH_QUERY_REQUIRED"
+            )
+
+        queryset = search_posts(self.filter_queryset(self.get_queryset()), query_text)
+        # 관련도 순 정렬을 유지해야 하므로 키셋 대신 페이지 번호 페이지네이션 사용
+        paginator = EstimatedPageNumberPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        self.load_liked_post_ids(page)
+        serializer = self.get_serializer(
+            page,
+            many=True,
+            context={**self.get_serializer_context(), "search_query": query_text},
+        )
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="likes/status",
+        permission_classes=[IsAuthenticated],
+    )
+    def like_status(self, request):
+        """
+        게시글별 좋아요 여부 (?ids=1,2,3, 최대 MAX_LIKE_STATUS_IDS 개)
+        """
+        try:
+            post_ids = [
+                int(value)
+                for value in request.query_params.get("ids", "").split(",")
+                if value.strip()
+            ]
+        except ValueError:
+            return create_error_response(
+                "게시글 id 목록이 올바르지 않습니다.", error_code="INVALID_POST_IDS"
+            )
+        if len(post_ids) > MAX_LIKE_STATUS_IDS:
+            return create_error_response(
+                f"한 번에 최대 {MAX_LIKE_STATUS_IDS}개까지 조회할 수 있습니다.",
+                error_code="TOO_MANY_POST_IDS",
+            )
+
+        liked_post_ids = get_liked_post_ids(request.user.id, post_ids)
+        return Response(
+            {"results": {post_id: post_id in liked_post_ids for post_id in post_ids}}
+        )
+
+    @action(detail=True, methods=["get"])
+    def stats(self, request, pk=None):
+        """
+        게시글 통계
+        누적 조회수/좋아요/댓글 수, 순 방문자 수와
+        기간(?from=&to= 또는 ?days=, 최대 MAX_STATS_DAYS 일)의 일별 통계(롤업 + 순 방문자 수)
+        """
+        post = get_object_or_404(
+            annotate_like_counts(
+                Post.objects.only("id", "view_count", "like_count", "comment_count")
+            ),
+            pk=pk,
+        )
+        try:
+            start, end = parse_date_range(
+                request.query_params, DEFAULT_STATS_DAYS, MAX_STATS_DAYS
+            )
+        except ValueError as exc:
+            return create_error_response(str(exc), error_code="INVALID_DATE_RANGE")
+
+        daily = get_daily_stats(PostDailyStats, start, end, post_id=post.id)
+        unique_viewers = get_daily_unique_viewers(
+            post.id, [row["date"] for row in daily]
+        )
+        for row, count in zip(daily, unique_viewers):
+            row["unique_viewers"] = count
+
+        return Response(
+            {
+                "id": post.id,
+                "view_count": post.view_count,
+                "like_count": get_merged_like_count(post),
+                "comment_count": post.comment_count,
+                "unique_viewers": get_unique_viewer_summary(post.id),
+                "period": {"from": start, "to": end, **sum_daily_stats(daily)},
+                "daily": daily,
+            }
+        )
+
+    @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated])
+    def like(self, request, pk=None):
+        """
+        게시글 좋아요/취소
+        """
+        post = get_object_or_404(Post.objects.only("id"), pk=pk)
+        return create_like_toggle_response(post.id, request.user.id)
+
 
 class CategoryViewSet(viewsets.ModelViewSet):
     """
@@ -78,6 +361,33 @@ class TagViewSet(viewsets.ModelViewSet):
     serializer_class = TagSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
+    @action(detail=False, methods=["get"])
+    def autocomplete(self, request):
+        """
+        태그명 자동완성 (?q=접두어, 접두어 일치 후 유사도 일치, 사용 횟수 순)
+        """
+        query = normalize_query(request.query_params.get("q", ""))
+        if not query:
+            return Response({"results": []})
+
+        limit = get_limit(request)
+
+        def build():
+            tags, complete = autocomplete(
+                Tag.objects.only("id", "name", "usage_count"), ["name"], query, limit
+            )
+            if tags is None:
+                return None, False
+            data = [
+                {"id": tag.id, "name": tag.name, "usage_count": tag.usage_count}
+                for tag in tags
+            ]
+            return data, complete
+
+        return Response(
+            {"results": get_cached_autocomplete("tags", query, limit, build)}
+        )
+
 
 class PostLikeView(generics.CreateAPIView):
     """
@@ -90,31 +400,26 @@ class PostLikeView(generics.CreateAPIView):
         """
         게시글 좋아요/취소
         """
-        post = get_object_or_404(Post, id=post_id)
-        like, created = PostLike.objects.get_or_create(user=request.user, post=post)
-
-        if not created:
-            like.delete()
-            message = "좋아요를 취소했습니다."
-            is_liked = False
-        else:
-            message = "좋아요를 눌렀습니다."
-            is_liked = True
-
-        return create_response(
-            success=True,
-            message=message,
-            data={"is_liked": is_liked, "like_count": post.like_count},
-        )
+        post = get_object_or_404(Post.objects.only("id"), id=post_id)
+        return create_like_toggle_response(post.id, request.user.id)
 
 
-class CommentListCreateView(generics.ListCreateAPIView):
+class CommentListCreateView(
+    ConditionalGetMixin, SparseFieldsetViewMixin, generics.ListCreateAPIView
+):
     """
     댓글 목록 조회/생성 뷰
     """
 
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = OptionalKeysetPagination
+    keyset_ordering = ("created_at", "id")
+    etag_namespace = "comments"
+
+    def get_generation_names(self, kind):
+        # 댓글에 작성자 정보가 들어가므로 사용자 변경도 반영
+        return [f"comments:post:{self.kwargs['post_id']}", "users:list"]
 
     def get_queryset(self):
         """
@@ -129,10 +434,82 @@ class CommentListCreateView(generics.ListCreateAPIView):
         """
         post_id = self.kwargs["post_id"]
         post = get_object_or_404(Post, id=post_id)
+        parent = serializer.validated_data.get("parent")
+        if parent is not None:
+            if parent.post_id != post.id:
+                raise ValidationError({"parent": "다른 게시글의 댓글입니다."})
+            if parent.depth >= MAX_COMMENT_DEPTH:
+                raise ValidationError({"parent": "더 이상 답글을 달 수 없습니다."})
         serializer.save(author=self.request.user, post=post)
 
 
-class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
+class CommentThreadView(generics.GenericAPIView):
+    """
+    댓글 스레드 조회 뷰
+    루트 댓글 한 페이지와 그 답글들을 중첩 구조로 반환 (쿼리 2번)
+
+    - parent: 이 댓글의 답글들을 루트로 조회 (더 보기)
+    - max_depth: 루트 아래로 포함할 답글 단계 (기본 3, 최대 10)
+    - page_size / after: 루트 댓글 페이지 크기 / 다음 페이지 커서
+    """
+
+    serializer_class = CommentThreadSerializer
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = None
+
+    def get_queryset(self):
+        return Comment.objects.select_related("author").only(
+            *CommentThreadSerializer.only_fields
+        )
+
+    # 세션/사용자, 상위 댓글, 루트 페이지, 답글 구간
+    @query_budget(5)
+    def get(self, request, post_id):
+        parent = None
+        parent_id = request.query_params.get("parent")
+        if parent_id:
+            try:
+                parent = Comment.objects.only("id", "path", "depth").get(
+                    id=int(parent_id), post_id=post_id
+                )
+            except (ValueError, Comment.DoesNotExist):
+                return create_error_response(
+                    "상위 댓글을 찾을 수 없습니다.",
+                    error_code="COMMENT_NOT_FOUND",
+                    status_code=status.HTTP_404_NOT_FOUND,
+                )
+        try:
+            max_depth = int(request.query_params.get("max_depth", DEFAULT_MAX_DEPTH))
+        except ValueError:
+            max_depth = DEFAULT_MAX_DEPTH
+        max_depth = max(0, min(max_depth, MAX_DEPTH_LIMIT))
+        limit = KeysetPagination().get_page_size(request)
+
+        comments, next_after = load_comment_thread(
+            self.get_queryset(),
+            post_id,
+            parent=parent,
+            after=parse_thread_cursor(request.query_params.get("after")),
+            limit=limit,
+            max_depth=max_depth,
+        )
+        results = build_comment_tree(
+            comments, lambda rows: self.get_serializer(rows, many=True).data
+        )
+
+        next_url = None
+        if next_after is not None:
+            next_url = replace_query_param(
+                request.build_absolute_uri(), "after", next_after
+            )
+        return Response({"next": next_url, "results": results})
+
+
+class CommentDetailView(
+    ConditionalGetMixin,
+    SparseFieldsetViewMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
     """
     댓글 상세 조회/수정/삭제 뷰
     """
@@ -141,6 +518,11 @@ class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     lookup_url_kwarg = "comment_id"
+    etag_namespace = "comments"
+
+    def get_generation_names(self, kind):
+        # 댓글에 작성자 정보가 들어가므로 사용자 변경도 반영
+        return super().get_generation_names(kind) + ["users:list"]
 
     def get_permissions(self):
         """
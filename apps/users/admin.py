@@ -5,7 +5,9 @@ Users 앱 Admin 설정
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
-from .models import User, UserProfile
+from apps.core.pagination import EstimatedCountPaginator
+
+from .models import Follow, User, UserProfile
 
 
 @admin.register(User)
@@ -84,3 +86,17 @@ class UserProfileAdmin(admin.ModelAdmin):
             {"fields": ("is_public", "email_notifications", "push_notifications")},
         ),
     )
+
+
+@admin.register(Follow)
+class FollowAdmin(admin.ModelAdmin):
+    """
+    팔로우 관리자 설정
+    """
+
+    list_display = ("follower", "following", "created_at")
+    list_filter = ("created_at",)
+    raw_id_fields = ("follower", "following")
+    ordering = ("-created_at",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
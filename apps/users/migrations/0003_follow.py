@@ -0,0 +1,63 @@
+# Generated by Django 5.2.1 on 2026-10-18 05:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_autocomplete_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Follow",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "follower",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="following_relations",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="팔로워",
+                    ),
+                ),
+                (
+                    "following",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="follower_relations",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="팔로잉",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "팔로우",
+                "verbose_name_plural": "팔로우들",
+                "db_table": "user_follows",
+                "indexes": [
+                    models.Index(
+                        fields=["following", "follower"],
+                        name="user_follow_followi_4780e3_idx",
+                    )
+                ],
+                "unique_together": {("follower", "following")},
+            },
+        ),
+    ]
@@ -4,7 +4,9 @@ Toss 스타일의 네이밍 컨벤션을 따름
 """
 
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Collate, Lower
 from django.utils import timezone
 
 
@@ -43,6 +45,23 @@ class User(AbstractUser):
         verbose_name = "사용자"
         verbose_name_plural = "사용자들"
         ordering = ["-created_at"]
+        indexes = [
+            # 자동완성 (apps.core.autocomplete 참고)
+            models.Index(
+                Collate(Lower("username"), "C"), name="users_username_prefix_idx"
+            ),
+            models.Index(
+                Collate(Lower("nickname"), "C"), name="users_nickname_prefix_idx"
+            ),
+            GinIndex(
+                OpClass(Lower("username"), name="gin_trgm_ops"),
+                name="users_username_trgm_gin",
+            ),
+            GinIndex(
+                OpClass(Lower("nickname"), name="gin_trgm_ops"),
+                name="users_nickname_trgm_gin",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.email} ({self.nickname or self.username})"
@@ -89,3 +108,35 @@ class UserProfile(models.Model):
 
     def __str__(self):
         return f"{self.user.email}의 프로필"
+
+
+class Follow(models.Model):
+    """
+    팔로우 관계 (follower 가 following 의 게시글을 타임라인으로 받음)
+    """
+
+    follower = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="following_relations",
+        verbose_name="팔로워",
+    )
+    following = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="follower_relations",
+        verbose_name="팔로잉",
+    )
+
+    # 타임스탬프
+    created_at = models.DateTimeField("생성일시", auto_now_add=True)
+
+    class Meta:
+        db_table = "user_follows"
+        verbose_name = "팔로우"
+        verbose_name_plural = "팔로우들"
+        unique_together = ["follower", "following"]
+        indexes = [models.Index(fields=["following", "follower"])]
+
+    def __str__(self):
+        return f"{self.follower_id} -> {self.following_id}"
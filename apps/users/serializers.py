@@ -5,12 +5,14 @@ Users 앱 시리얼라이저
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from apps.core.serializers import SparseFieldsetMixin
+
 from .models import UserProfile
 
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     사용자 시리얼라이저
     """
@@ -52,7 +54,28 @@ class UserSerializer(serializers.ModelSerializer):
         return user
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserSummarySerializer(serializers.ModelSerializer):
+    """
+    사용자 요약 시리얼라이저 (목록 응답에 포함되는 작성자 정보)
+    """
+
+    display_name = serializers.ReadOnlyField()
+
+    class Meta:
+        model = User
+        fields = [
+            "id",
+            "display_name",
+            "profile_image",
+        ]
+        read_only_fields = fields
+
+    field_sources = {"display_name": ["nickname", "username"]}
+    # display_name 계산에 필요한 컬럼 (.only() 에 사용)
+    only_fields = ["id", "nickname", "username", "profile_image"]
+
+
+class UserProfileSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     사용자 프로필 시리얼라이저
     """
@@ -0,0 +1,24 @@
+"""
+Users 앱 시그널
+사용자 정보가 바뀌면 사용자 목록/상세와 작성자 정보를 담은 댓글 응답의 ETag 세대를 갱신한다.
+"""
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.conditional import bump_generations
+
+# 직렬화 결과에 영향을 주지 않는 사용자 필드 (로그인 시각 갱신 등)
+USER_FIELDS_NOT_SERIALIZED = {"last_login", "last_login_at", "password"}
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_user(sender, instance, update_fields=None, **kwargs):
+    """
+    사용자 저장/삭제 시 ETag 무효화
+    """
+    if update_fields is not None and set(update_fields) <= USER_FIELDS_NOT_SERIALIZED:
+        return
+    bump_generations(["users:list", f"users:{instance.pk}"])
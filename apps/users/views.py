@@ -3,26 +3,78 @@ Users 앱 뷰
 """
 
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.shortcuts import get_object_or_404
 from rest_framework import generics, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from apps.core.utils import create_response
-
-from .models import UserProfile
-from .serializers import UserProfileSerializer, UserSerializer
+from apps.core.autocomplete import (
+    autocomplete,
+    get_cached_autocomplete,
+    get_limit,
+    normalize_query,
+)
+from apps.core.conditional import ConditionalGetMixin, build_etag, conditional_action
+from apps.core.serializers import SparseFieldsetViewMixin
+from apps.core.utils import create_error_response, create_response
+from apps.posts.models import AuthorDailyStats
+from apps.posts.rollups import get_daily_stats, parse_date_range, sum_daily_stats
+from apps.posts.timeline import backfill_timeline, remove_author_from_timeline
+
+from .models import Follow, UserProfile
+from .serializers import UserProfileSerializer, UserSerializer, UserSummarySerializer
 
 User = get_user_model()
 
+# 작성자 통계의 기간 (일)
+DEFAULT_STATS_DAYS = 30
+MAX_STATS_DAYS = 366
+
+
+def current_user_validators(view, request, *args, **kwargs):
+    """
+    현재 사용자 응답의 검증자 (인증 과정에서 이미 읽은 행을 사용하므로 추가 쿼리 없음)
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return None
+    etag = build_etag(request.get_full_path(), user.pk, user.updated_at)
+    return etag, user.updated_at
+
 
-class UserViewSet(viewsets.ModelViewSet):
+def user_profile_validators(view, request, *args, **kwargs):
+    """
+    현재 사용자 프로필 응답의 검증자 (프로필과 중첩된 사용자 정보의 수정일시)
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return None
+    profile_updated_at = (
+        UserProfile.objects.filter(user=user)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+    if profile_updated_at is None:
+        return None
+    last_modified = max(profile_updated_at, user.updated_at)
+    etag = build_etag(
+        request.get_full_path(), user.pk, profile_updated_at, user.updated_at
+    )
+    return etag, last_modified
+
+
+class UserViewSet(ConditionalGetMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     사용자 ViewSet
     """
 
     queryset = User.objects.all()
     serializer_class = UserSerializer
+    etag_namespace = "users"
+    # 같은 prefix 의 다른 경로(profile/, categories/ 등)를 상세 조회가 가로채지 않도록 숫자만 허용
+    lookup_value_regex = r"\d+"
 
     def get_permissions(self):
         """
@@ -35,6 +87,7 @@ class UserViewSet(viewsets.ModelViewSet):
         return [permission() for permission in permission_classes]
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
+    @conditional_action(current_user_validators)
     def me(self, request):
         """
         현재 사용자 정보 조회
@@ -46,6 +99,90 @@ class UserViewSet(viewsets.ModelViewSet):
             data=serializer.data,
         )
 
+    @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated])
+    def follow(self, request, pk=None):
+        """
+        사용자 팔로우/취소 (팔로우하면 최근 게시글을 타임라인에 채워 넣음)
+        """
+        target = get_object_or_404(User.objects.only("id"), pk=pk)
+        if target.id == request.user.id:
+            return create_error_response(
+                "자기 자신은 팔로우할 수 없습니다.", error_code="CANNOT_FOLLOW_SELF"
+            )
+
+        follower_id = request.user.id
+        deleted, _ = Follow.objects.filter(
+            follower_id=follower_id, following_id=target.id
+        ).delete()
+        if deleted:
+            transaction.on_commit(
+                lambda: remove_author_from_timeline(follower_id, target.id)
+            )
+            return create_response(
+                success=True,
+                message="팔로우를 취소했습니다.",
+                data={"is_following": False},
+            )
+
+        Follow.objects.get_or_create(follower_id=follower_id, following_id=target.id)
+        transaction.on_commit(lambda: backfill_timeline(follower_id, target.id))
+        return create_response(
+            success=True, message="팔로우했습니다.", data={"is_following": True}
+        )
+
+    @action(detail=True, methods=["get"])
+    def stats(self, request, pk=None):
+        """
+        작성자 통계 (?from=&to= 또는 ?days= 기간의 일별 조회수/좋아요/댓글 수, 롤업 기준)
+        """
+        author = get_object_or_404(User.objects.only("id"), pk=pk)
+        try:
+            start, end = parse_date_range(
+                request.query_params, DEFAULT_STATS_DAYS, MAX_STATS_DAYS
+            )
+        except ValueError as exc:
+            return create_error_response(str(exc), error_code="INVALID_DATE_RANGE")
+
+        daily = get_daily_stats(AuthorDailyStats, start, end, author_id=author.id)
+        return Response(
+            {
+                "id": author.id,
+                "period": {"from": start, "to": end, **sum_daily_stats(daily)},
+                "daily": daily,
+            }
+        )
+
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
+    def autocomplete(self, request):
+        """
+        사용자 자동완성 (?q=닉네임/사용자명 접두어, 접두어 일치 후 유사도 일치)
+        """
+        query = normalize_query(request.query_params.get("q", ""))
+        if not query:
+            return Response({"results": []})
+
+        limit = get_limit(request)
+
+        def build():
+            users, complete = autocomplete(
+                User.objects.filter(is_active=True).only(
+                    *UserSummarySerializer.only_fields
+                ),
+                ["nickname", "username"],
+                query,
+                limit,
+            )
+            if users is None:
+                return None, False
+            data = UserSummarySerializer(
+                users, many=True, context=self.get_serializer_context()
+            ).data
+            return data, complete
+
+        return Response(
+            {"results": get_cached_autocomplete("users", query, limit, build)}
+        )
+
 
 class UserProfileView(generics.RetrieveUpdateAPIView):
     """
@@ -55,6 +192,13 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = UserProfileSerializer
     permission_classes = [IsAuthenticated]
 
+    @conditional_action(user_profile_validators)
+    def retrieve(self, request, *args, **kwargs):
+        """
+        사용자 프로필 조회
+        """
+        return super().retrieve(request, *args, **kwargs)
+
     def get_object(self):
         """
         현재 사용자의 프로필 반환
@@ -71,6 +215,13 @@ class CurrentUserView(generics.RetrieveAPIView):
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
 
+    @conditional_action(current_user_validators)
+    def retrieve(self, request, *args, **kwargs):
+        """
+        현재 사용자 정보 조회
+        """
+        return super().retrieve(request, *args, **kwargs)
+
     def get_object(self):
         """
         현재 사용자 반환
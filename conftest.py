@@ -0,0 +1 @@
+pytest_plugins = ["apps.core.pytest_plugin"]
@@ -22,6 +22,7 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 THIRD_PARTY_APPS = [
@@ -40,6 +41,9 @@ LOCAL_APPS = [
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
+    "apps.core.slow_queries.SlowQueryMiddleware",
+    "apps.core.instrumentation.RequestInstrumentationMiddleware",
+    "apps.core.profiling.RequestProfilingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -117,7 +121,7 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "apps.core.pagination.EstimatedPageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
@@ -125,16 +129,139 @@ REST_FRAMEWORK = {
         "rest_framework.filters.OrderingFilter",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "apps.core.renderers.FastJSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "apps.core.parsers.FastJSONParser",
         "rest_framework.parsers.MultiPartParser",
         "rest_framework.parsers.FormParser",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+# 페이지네이션 (플래너 추정 개수가 이 값 이상이면 정확한 COUNT(*) 생략)
+PAGINATION_ESTIMATE_THRESHOLD = config(
+    "PAGINATION_ESTIMATE_THRESHOLD", default=10000, cast=int
+)
+
+# 게시글 좋아요 카운터 (인기 게시글의 행 경합을 줄이기 위한 샤드 개수)
+POST_LIKE_COUNTER_SHARDS = config("POST_LIKE_COUNTER_SHARDS", default=8, cast=int)
+
+# 게시글 조회수 버퍼 ("cache": 공유 캐시, "local": 프로세스 메모리)
+POST_VIEW_COUNT_BUFFER = config("POST_VIEW_COUNT_BUFFER", default="cache")
+POST_VIEW_COUNT_FLUSH_INTERVAL = config(
+    "POST_VIEW_COUNT_FLUSH_INTERVAL", default=10, cast=int
+)
+
+# 게시글 직렬화 결과 캐시 유지 시간(초)
+POST_REPRESENTATION_CACHE_TIMEOUT = config(
+    "POST_REPRESENTATION_CACHE_TIMEOUT", default=3600, cast=int
+)
+
+# 사용자별 게시글 좋아요 여부 캐시 유지 시간(초)
+LIKE_STATUS_CACHE_TIMEOUT = config("LIKE_STATUS_CACHE_TIMEOUT", default=3600, cast=int)
+
+# 사용자별 좋아요 Bloom 필터 저장소 (redis, db, 비우면 사용 안 함)와 목표 오탐률
+LIKE_FILTER_BACKEND = config("LIKE_FILTER_BACKEND", default="")
+LIKE_FILTER_FALSE_POSITIVE_RATE = config(
+    "LIKE_FILTER_FALSE_POSITIVE_RATE", default=0.01, cast=float
+)
+
+# 자동완성 결과 캐시 유지 시간(초)
+AUTOCOMPLETE_CACHE_TIMEOUT = config("AUTOCOMPLETE_CACHE_TIMEOUT", default=60, cast=int)
+
+# 자동완성 쿼리 1건당 시간 예산(ms), 초과 시 statement_timeout 으로 중단
+AUTOCOMPLETE_STATEMENT_TIMEOUT_MS = config(
+    "AUTOCOMPLETE_STATEMENT_TIMEOUT_MS", default=50, cast=int
+)
+
+# Redis 연결 주소 (비어 있으면 Redis 를 쓰는 기능은 DB 저장소로 대체)
+REDIS_URL = config("REDIS_URL", default="")
+
+# 홈 타임라인 저장소 (redis 또는 db)
+TIMELINE_BACKEND = config("TIMELINE_BACKEND", default="db")
+# 사용자당 Redis 타임라인에 남겨 둘 최대 게시글 수
+TIMELINE_MAX_LENGTH = config("TIMELINE_MAX_LENGTH", default=800, cast=int)
+# 타임라인 항목 보관 기간(일), trim_timelines 명령어가 사용
+TIMELINE_RETENTION_DAYS = config("TIMELINE_RETENTION_DAYS", default=30, cast=int)
+# 팔로워가 이 수 이상인 작성자는 fan-out 대신 피드 조회 시 pull
+TIMELINE_FANOUT_FOLLOWER_LIMIT = config(
+    "TIMELINE_FANOUT_FOLLOWER_LIMIT", default=10000, cast=int
+)
+
+# 게시글 순 방문자 수 HyperLogLog 저장소 (redis 또는 cache)와 보관 기간(일)
+UNIQUE_VIEWERS_BACKEND = config("UNIQUE_VIEWERS_BACKEND", default="cache")
+UNIQUE_VIEWERS_RETENTION_DAYS = config(
+    "UNIQUE_VIEWERS_RETENTION_DAYS", default=90, cast=int
+)
+# 게시글 상세의 기간별 순 방문자 수 캐시 시간(초)
+UNIQUE_VIEWERS_SUMMARY_CACHE_TIMEOUT = config(
+    "UNIQUE_VIEWERS_SUMMARY_CACHE_TIMEOUT", default=60, cast=int
+)
+
+# 일별 통계 롤업: 커밋이 늦은 행을 건너뛰지 않도록 이 시간(초) 이전에 만들어진 행까지만 집계
+ROLLUP_SAFETY_LAG_SECONDS = config("ROLLUP_SAFETY_LAG_SECONDS", default=60, cast=int)
+
+# 인기 게시글: 카테고리별 저장 개수, 계산 대상 기간(시간), 시간 감쇠 지수
+TRENDING_TOP_K = config("TRENDING_TOP_K", default=50, cast=int)
+TRENDING_WINDOW_HOURS = config("TRENDING_WINDOW_HOURS", default=72, cast=int)
+TRENDING_GRAVITY = config("TRENDING_GRAVITY", default=1.8, cast=float)
+
+# 요청 계측: 계측할 요청 비율(0 이면 끔)과 Server-Timing 헤더 응답 여부
+INSTRUMENTATION_SAMPLE_RATE = config(
+    "INSTRUMENTATION_SAMPLE_RATE", default=0.0, cast=float
+)
+INSTRUMENTATION_SERVER_TIMING = config(
+    "INSTRUMENTATION_SERVER_TIMING", default=True, cast=bool
+)
+
+# 쿼리 점검: "" (끔) / "log" / "raise", 같은 모양 쿼리가 몇 번 반복되면 N+1 로 볼지
+QUERY_CHECK_MODE = config("QUERY_CHECK_MODE", default="")
+NPLUSONE_THRESHOLD = config("NPLUSONE_THRESHOLD", default=5, cast=int)
+# 뷰별 쿼리 예산 (세션/인증 쿼리 포함, 뷰의 @query_budget 보다 우선)
+QUERY_BUDGETS = {
+    "PostViewSet.list": 8,
+    "PostViewSet.retrieve": 6,
+    "PostViewSet.feed": 5,
+    "CommentListCreateView.get": 6,
+    "UserViewSet.list": 5,
+    "UserProfileView.get": 5,
+}
+
+# 요청 프로파일링: 샘플링 비율(서명된 X-Profile 헤더 요청은 항상), 방식(sample/cprofile),
+# 스택 샘플링 간격(ms), 결과 디렉터리, 대상 뷰(쉼표 구분, 비우면 전체), 헤더 토큰 유효 시간(초)과
+# 토큰 하나로 프로파일링할 기본 요청 수, 남겨 둘 .prof 파일 수, collapsed stack 파일 최대 크기
+PROFILING_SAMPLE_RATE = config("PROFILING_SAMPLE_RATE", default=0.0, cast=float)
+PROFILING_MODE = config("PROFILING_MODE", default="sample")
+PROFILING_INTERVAL_MS = config("PROFILING_INTERVAL_MS", default=5, cast=int)
+PROFILING_DIR = config("PROFILING_DIR", default=str(BASE_DIR / "logs" / "profiles"))
+PROFILING_VIEWS = config(
+    "PROFILING_VIEWS",
+    default="",
+    cast=lambda v: [s.strip() for s in v.split(",") if s.strip()],
+)
+PROFILING_TOKEN_MAX_AGE = config("PROFILING_TOKEN_MAX_AGE", default=3600, cast=int)
+PROFILING_TOKEN_MAX_REQUESTS = config(
+    "PROFILING_TOKEN_MAX_REQUESTS", default=100, cast=int
+)
+PROFILING_MAX_PROFILES = config("PROFILING_MAX_PROFILES", default=200, cast=int)
+PROFILING_MAX_COLLAPSED_BYTES = config(
+    "PROFILING_MAX_COLLAPSED_BYTES", default=10 * 1024 * 1024, cast=int
+)
+
+# Prometheus 지표 (/metrics, prometheus_client 가 설치된 경우만), 조회용 Bearer 토큰 (비우면 DEBUG 에서만 조회 가능)
+METRICS_ENABLED = config("METRICS_ENABLED", default=True, cast=bool)
+METRICS_TOKEN = config("METRICS_TOKEN", default="")
+
+# 느린 쿼리 로그: 사용 여부(켜면 모든 쿼리에 뷰 이름/요청 id SQL 주석), 기준 시간(ms),
+# 실행 계획 방식(analyze/plain/빈 값), 같은 뷰/SQL 지문의 실행 계획을 다시 구하는 간격(초)
+SLOW_QUERY_LOG = config("SLOW_QUERY_LOG", default=False, cast=bool)
+SLOW_QUERY_THRESHOLD_MS = config("SLOW_QUERY_THRESHOLD_MS", default=200, cast=float)
+SLOW_QUERY_EXPLAIN = config("SLOW_QUERY_EXPLAIN", default="plain")
+SLOW_QUERY_EXPLAIN_INTERVAL = config(
+    "SLOW_QUERY_EXPLAIN_INTERVAL", default=300, cast=int
+)
+
 # CORS settings
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
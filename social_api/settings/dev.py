@@ -37,6 +37,19 @@ CACHES = {
     }
 }
 
+# 개발환경에서는 모든 요청 계측
+INSTRUMENTATION_SAMPLE_RATE = config(
+    "INSTRUMENTATION_SAMPLE_RATE", default=1.0, cast=float
+)
+
+# 개발환경에서는 N+1 / 쿼리 예산 초과를 경고 로그로 남김
+QUERY_CHECK_MODE = config("QUERY_CHECK_MODE", default="log")
+
+# 개발환경에서는 느린 쿼리를 EXPLAIN (ANALYZE, BUFFERS) 결과와 함께 기록
+SLOW_QUERY_LOG = config("SLOW_QUERY_LOG", default=True, cast=bool)
+SLOW_QUERY_THRESHOLD_MS = config("SLOW_QUERY_THRESHOLD_MS", default=100, cast=float)
+SLOW_QUERY_EXPLAIN = config("SLOW_QUERY_EXPLAIN", default="analyze")
+
 # Django Debug Toolbar (선택사항)
 if DEBUG:
     INTERNAL_IPS = [
@@ -35,13 +35,35 @@ USE_TZ = True
 
 
 # Cache settings (Redis 권장)
+REDIS_URL = config("REDIS_URL", default="redis://127.0.0.1:6379/1")
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.redis.RedisCache",
-        "LOCATION": config("REDIS_URL", default="redis://127.0.0.1:6379/1"),
+        "LOCATION": REDIS_URL,
     }
 }
 
+# 홈 타임라인은 Redis sorted set 에 저장
+TIMELINE_BACKEND = config("TIMELINE_BACKEND", default="redis")
+
+# 좋아요 여부 Bloom 필터는 Redis 비트맵에 저장
+LIKE_FILTER_BACKEND = config("LIKE_FILTER_BACKEND", default="redis")
+
+# 게시글 순 방문자 수는 Redis HyperLogLog 사용
+UNIQUE_VIEWERS_BACKEND = config("UNIQUE_VIEWERS_BACKEND", default="redis")
+
+# 요청 계측은 일부 요청만 샘플링하고, 내부 처리 시간은 헤더로 노출하지 않음 (로그로만 기록)
+INSTRUMENTATION_SAMPLE_RATE = config(
+    "INSTRUMENTATION_SAMPLE_RATE", default=0.05, cast=float
+)
+INSTRUMENTATION_SERVER_TIMING = config(
+    "INSTRUMENTATION_SERVER_TIMING", default=False, cast=bool
+)
+
+# 느린 쿼리는 쿼리를 다시 실행하지 않는 EXPLAIN 결과와 함께 기록
+SLOW_QUERY_LOG = config("SLOW_QUERY_LOG", default=True, cast=bool)
+SLOW_QUERY_EXPLAIN = config("SLOW_QUERY_EXPLAIN", default="plain")
+
 # Session settings
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
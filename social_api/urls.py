@@ -25,6 +25,8 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+from apps.core.metrics import metrics_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     # API 문서
@@ -39,6 +41,8 @@ urlpatterns = [
     path("api/v1/", include("api.urls")),
     path("api/v1/users/", include("apps.users.urls")),
     path("api/v1/posts/", include("apps.posts.urls")),
+    # Prometheus 지표
+    path("metrics", metrics_view, name="metrics"),
 ]
 
 # 개발 환경에서 미디어 파일 서빙